@@ -0,0 +1,93 @@
+"""
+Reporte de compresión de los archivos de datos.
+Guarda y vuelve a cargar un club sintético con cada códec de compresión y
+formato de PersistenciaService, midiendo el tamaño en disco y los tiempos.
+
+Uso:
+    python -m benchmarks.compresion_persistencia [cantidad ...]
+"""
+
+# Standard library imports
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Local application imports
+from club.salida import configurar_salida, SalidaNula
+from club.entidades.actividad import Actividad
+from club.entidades.pago import Pago
+from club.patrones.factory.socio_factory import SocioFactory
+from club.patrones.singleton.club_registry import ClubRegistry
+from club.servicios.compresion import CODECS
+from club.servicios.persistencia_service import PersistenciaService
+
+FORMATOS = (PersistenciaService.FORMATO_PICKLE, PersistenciaService.FORMATO_BINARIO)
+
+
+def _poblar_registry(cantidad: int):
+    """Llena el registry con socios, inscripciones y dos pagos por socio."""
+    registry = ClubRegistry.get_instance()
+    registry.reset()
+    actividades = [Actividad(f"Actividad {i}", 15000, cantidad) for i in range(10)]
+    for actividad in actividades:
+        registry._actividades[actividad.nombre.lower()] = actividad
+    tipos = ("regular", "premium")
+    metodos = ("Efectivo", "Tarjeta", "Transferencia")
+    inicio = datetime(2024, 1, 1)
+    for i in range(cantidad):
+        if i % 5 == 0:
+            socio = SocioFactory.crear_socio("infantil", f"Socio {i}", 10_000_000 + i, 12)
+        else:
+            socio = SocioFactory.crear_socio(tipos[i % 2], f"Socio {i}", 10_000_000 + i)
+        registry._socios[socio.dni] = socio
+        actividad = actividades[i % len(actividades)]
+        actividad.inscribir_socio(socio)
+        socio.agregar_actividad(actividad)
+        for j in range(2):
+            registry._pagos.append(Pago(socio, 25000, metodos[(i + j) % 3], inicio + timedelta(minutes=2 * i + j)))
+    registry.reconstruir_indices()
+
+
+def _tamano_directorio(directorio: str) -> int:
+    return sum(entrada.stat().st_size for entrada in os.scandir(directorio) if entrada.is_file())
+
+
+def medir_codec(formato: str, codec: str, directorio: str) -> dict:
+    """Guarda el registry actual con un códec y lo vuelve a cargar, midiendo ambos pasos."""
+    registry = ClubRegistry.get_instance()
+    for coleccion in registry.COLECCIONES:
+        registry.marcar_modificada(coleccion)
+    servicio = PersistenciaService(directorio, formato=formato, compresion=codec)
+    inicio = time.perf_counter()
+    servicio.guardar_datos()
+    guardado = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    servicio.cargar_datos()
+    carga = time.perf_counter() - inicio
+    return {"formato": formato, "codec": codec, "bytes": _tamano_directorio(directorio),
+            "guardado": guardado, "carga": carga}
+
+
+def imprimir_reporte(cantidades: list):
+    """Imprime tamaño y tiempos de guardado y carga por formato y códec."""
+    configurar_salida(SalidaNula())
+    print("=" * 70)
+    print("REPORTE DE COMPRESIÓN DE DATOS PERSISTIDOS")
+    print("=" * 70)
+    print(f"{'Socios':>10} {'Formato':>8} {'Códec':>6} {'Tamaño (MB)':>12} {'Guardar (s)':>12} {'Cargar (s)':>11}")
+    for cantidad in cantidades:
+        _poblar_registry(cantidad)
+        for formato in FORMATOS:
+            for codec in CODECS:
+                with tempfile.TemporaryDirectory() as directorio:
+                    r = medir_codec(formato, codec, directorio)
+                print(f"{cantidad:>10} {r['formato']:>8} {r['codec']:>6} {r['bytes'] / 2**20:>12.1f} "
+                      f"{r['guardado']:>12.2f} {r['carga']:>11.2f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]] or [100_000, 1_000_000]
+    imprimir_reporte(argumentos)
@@ -0,0 +1,92 @@
+"""
+Reporte de memoria de las entidades del club.
+Compara el formato compacto (__slots__) con el formato anterior (__dict__)
+construyendo socios, profesores, actividades y pagos sintéticos.
+
+Uso:
+    python -m benchmarks.memoria_entidades [cantidad ...]
+"""
+
+# Standard library imports
+import gc
+import sys
+import tracemalloc
+from datetime import datetime
+
+# Local application imports
+from club.entidades.actividad import Actividad
+from club.entidades.pago import Pago
+from club.entidades.profesor import Profesor
+from club.entidades.socio import SocioRegular, SocioPremium, SocioInfantil
+
+
+class _EntidadConDict:
+    """Réplica del formato anterior: los atributos viven en un __dict__."""
+    pass
+
+
+def _a_formato_dict(entidad) -> _EntidadConDict:
+    """Crea una réplica de la entidad con el estado guardado en un __dict__."""
+    replica = _EntidadConDict()
+    replica.__dict__.update(entidad.__getstate__())
+    return replica
+
+
+def _crear_entidades(cantidad: int) -> list:
+    """Crea entidades en proporciones similares a un club real."""
+    fecha = datetime(2025, 1, 1)
+    tipos = (SocioRegular, SocioPremium)
+    actividades = [Actividad(f"Actividad {i}", 15000, cantidad) for i in range(10)]
+    entidades = list(actividades)
+    for i in range(cantidad):
+        if i % 5 == 0:
+            socio = SocioInfantil(f"Socio {i}", 10_000_000 + i, 12)
+        else:
+            socio = tipos[i % 2](f"Socio {i}", 10_000_000 + i)
+        entidades.append(socio)
+        entidades.append(Pago(socio, 25000, "Efectivo", fecha))
+        if i % 100 == 0:
+            entidades.append(Profesor(f"Profesor {i}", 20_000_000 + i, 150000))
+    return entidades
+
+
+def _medir(constructor) -> int:
+    """Retorna los bytes retenidos por el resultado del constructor."""
+    gc.collect()
+    tracemalloc.start()
+    resultado = constructor()
+    usado, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return usado
+
+
+def medir_memoria(cantidad: int) -> dict:
+    """Mide la memoria de ambos formatos para una cantidad de socios."""
+    entidades = _crear_entidades(cantidad)
+    compacto = _medir(lambda: _crear_entidades(cantidad))
+    # Las réplicas comparten los valores de los atributos; se mide solo el
+    # costo del formato y se le suma el de los valores (nombres, fechas, etc.)
+    valores = compacto - sum(sys.getsizeof(e) for e in entidades)
+    con_dict = _medir(lambda: [_a_formato_dict(e) for e in entidades]) + valores
+    return {"cantidad": cantidad, "entidades": len(entidades),
+            "con_dict": con_dict, "compacto": compacto}
+
+
+def imprimir_reporte(cantidades: list):
+    """Imprime la comparación de memoria para cada cantidad de socios."""
+    print("=" * 70)
+    print("REPORTE DE MEMORIA DE ENTIDADES (__dict__ vs __slots__)")
+    print("=" * 70)
+    print(f"{'Socios':>10} {'Entidades':>10} {'__dict__ (MB)':>15} {'__slots__ (MB)':>15} {'Ahorro':>8}")
+    for cantidad in cantidades:
+        r = medir_memoria(cantidad)
+        ahorro = 1 - r["compacto"] / r["con_dict"]
+        print(f"{r['cantidad']:>10} {r['entidades']:>10} {r['con_dict'] / 2**20:>15.1f} "
+              f"{r['compacto'] / 2**20:>15.1f} {ahorro:>8.0%}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]] or [100_000, 1_000_000]
+    imprimir_reporte(argumentos)
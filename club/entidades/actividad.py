@@ -3,15 +3,21 @@ Entidad Actividad - Representa las actividades deportivas del club.
 """
 
 # Standard library imports
-from typing import List
+from typing import Dict
 
 # Local application imports
-from club.patrones.observer.observer import Observer
+from club.estructuras.estado_slots import EstadoSlots
+from club.estructuras.vista_coleccion import VistaColeccion
+from club.patrones.observer.observer import SujetoObservable
 
 
-class Actividad:
+class Actividad(EstadoSlots, SujetoObservable):
     """Representa una actividad deportiva del club. Contiene solo datos y estado."""
     
+    __slots__ = ("_nombre", "_costo", "_capacidad", "_profesores",
+                 "_socios", "_torneos", "_observadores", "_suscripciones",
+                 "_despachador")
+    
     def __init__(self, nombre: str, costo: float, capacidad: int):
         """Inicializa una Actividad.
 
@@ -23,10 +29,11 @@ class Actividad:
         self._nombre = nombre
         self._costo = costo
         self._capacidad = capacidad
-        self._profesores: List['Profesor'] = []
-        self._socios: List['Socio'] = []
-        self._torneos: List['Torneo'] = []
-        self._observadores: List['Observer'] = []
+        # Diccionarios usados como conjuntos ordenados por inserción (valor None)
+        self._profesores: Dict['Profesor', None] = {}
+        self._socios: Dict['Socio', None] = {}
+        self._torneos: Dict['Torneo', None] = {}
+        super().__init__()
         
     @property
     def nombre(self) -> str:
@@ -47,56 +54,65 @@ class Actividad:
         return self._capacidad
 
     @property
-    def profesores(self) -> List['Profesor']:
-        return self._profesores.copy()
+    def profesores(self) -> VistaColeccion['Profesor']:
+        return VistaColeccion(self._profesores)
     
     @property
-    def socios(self) -> List['Socio']:
-        return self._socios.copy()
+    def socios(self) -> VistaColeccion['Socio']:
+        return VistaColeccion(self._socios)
     
     @property
-    def torneos(self) -> List['Torneo']:
-        return self._torneos.copy()
+    def torneos(self) -> VistaColeccion['Torneo']:
+        return VistaColeccion(self._torneos)
+    
+    def tiene_profesor(self, profesor: 'Profesor') -> bool:
+        """Indica si el profesor está asignado a la actividad, en O(1)."""
+        return profesor in self._profesores
+    
+    def tiene_socio(self, socio: 'Socio') -> bool:
+        """Indica si el socio está inscrito en la actividad, en O(1)."""
+        return socio in self._socios
+    
+    def cantidad_socios(self) -> int:
+        """Retorna la cantidad de socios inscritos sin copiar la colección."""
+        return len(self._socios)
     
     def agregar_profesor(self, profesor: 'Profesor'):
         """Agrega un profesor a la lista interna de la actividad."""
-        if profesor not in self._profesores:
-            self._profesores.append(profesor)
+        self._profesores[profesor] = None
     
     def eliminar_profesor(self, profesor: 'Profesor'):
         """Elimina un profesor de la lista interna."""
-        if profesor in self._profesores:
-            self._profesores.remove(profesor)
+        self._profesores.pop(profesor, None)
     
     def inscribir_socio(self, socio: 'Socio'):
         """Agrega un socio a la lista interna de la actividad."""
-        if socio not in self._socios:
-            self._socios.append(socio)
+        self._socios[socio] = None
     
     def desinscribir_socio(self, socio: 'Socio'):
         """Elimina un socio de la lista interna."""
-        if socio in self._socios:
-            self._socios.remove(socio)
+        self._socios.pop(socio, None)
 
     def agregar_torneo(self, torneo: 'Torneo'):
         """Agrega un torneo a la lista de torneos de la actividad."""
-        if torneo not in self._torneos:
-            self._torneos.append(torneo)
-    
-    def agregar_observador(self, observador: 'Observer'):
-        """Agrega un observador para notificaciones (Observer Pattern)."""
-        if observador not in self._observadores:
-            self._observadores.append(observador)
-    
-    def eliminar_observador(self, observador: 'Observer'):
-        """Elimina un observador."""
-        if observador in self._observadores:
-            self._observadores.remove(observador)
-    
-    def notificar_observadores(self, evento: str, datos: dict):
-        """Notifica a todos los observadores sobre un evento."""
-        for observador in self._observadores:
-            observador.actualizar(evento, datos)
+        self._torneos[torneo] = None
+    
+    def __getstate__(self) -> Dict[str, object]:
+        estado = super().__getstate__()
+        # El despachador tiene hilos propios y la tabla de suscripciones se
+        # rearma al notificar: ninguno forma parte de los datos
+        estado.pop("_despachador", None)
+        estado.pop("_suscripciones", None)
+        return estado
+    
+    def _migrar_estado(self):
+        """Migra las colecciones guardadas como listas."""
+        self._despachador = None
+        self._suscripciones = {}
+        for atributo in ("_profesores", "_socios", "_torneos"):
+            coleccion = getattr(self, atributo)
+            if isinstance(coleccion, list):
+                setattr(self, atributo, dict.fromkeys(coleccion))
     
     def __str__(self) -> str:
         profesores_str = ", ".join([p.nombre for p in self._profesores]) if self._profesores else "Sin asignar"
@@ -4,29 +4,46 @@ Entidad Pago - Representa el registro de pagos de cuotas.
 
 # Standard library imports
 from datetime import datetime
+from typing import Optional
 
 # Local application imports
+from club.estructuras.estado_slots import EstadoSlots
 # Se evita la importación directa para prevenir dependencias circulares
 # from club.entidades.socio import Socio
 
 
-class Pago:
+class Pago(EstadoSlots):
     """Representa un pago de cuota realizado por un socio."""
     
-    def __init__(self, socio: 'Socio', monto: float, metodo: str):
+    __slots__ = ("_socio", "_monto", "_metodo", "_fecha", "_comprobante")
+    
+    def __init__(self, socio: 'Socio', monto: float, metodo: str, fecha: Optional[datetime] = None):
         """Inicializa un objeto Pago.
 
         Args:
             socio: La instancia del socio que realiza el pago.
             monto: El monto del pago.
             metodo: El método de pago (ej. 'Efectivo', 'Tarjeta').
+            fecha: La fecha del pago (por defecto, el momento actual).
         """
         self._socio = socio
         self._monto = monto
         self._metodo = metodo
-        self._fecha = datetime.now()
+        self._fecha = fecha if fecha is not None else datetime.now()
         self._comprobante = self._generar_comprobante()
     
+    @classmethod
+    def restaurar(cls, socio: Optional['Socio'], monto: float, metodo: str,
+                  fecha: datetime, comprobante: str) -> 'Pago':
+        """Reconstruye un pago ya registrado (por ejemplo, leído de disco) sin recalcular su comprobante."""
+        pago = cls.__new__(cls)
+        pago._socio = socio
+        pago._monto = monto
+        pago._metodo = metodo
+        pago._fecha = fecha
+        pago._comprobante = comprobante
+        return pago
+    
     @property
     def socio(self) -> 'Socio':
         return self._socio
@@ -3,16 +3,20 @@ Entidad Profesor - Representa a los instructores de actividades.
 """
 
 # Standard library imports
-from typing import List
+from typing import Dict
 
 # Local application imports
+from club.estructuras.estado_slots import EstadoSlots
+from club.estructuras.vista_coleccion import VistaColeccion
 # Se evita la importación directa para prevenir dependencias circulares
 # from club.entidades.actividad import Actividad
 
 
-class Profesor:
+class Profesor(EstadoSlots):
     """Representa un profesor/instructor del club. Contiene solo datos y estado."""
     
+    __slots__ = ("_nombre", "_dni", "_sueldo", "_actividades")
+    
     def __init__(self, nombre: str, dni: int, sueldo: float):
         """Inicializa un objeto Profesor.
 
@@ -24,7 +28,7 @@ class Profesor:
         self._nombre = nombre
         self._dni = dni
         self._sueldo = sueldo
-        self._actividades: List['Actividad'] = []
+        self._actividades: Dict['Actividad', None] = {}
     
     @property
     def nombre(self) -> str:
@@ -45,18 +49,21 @@ class Profesor:
         self._sueldo = valor
     
     @property
-    def actividades(self) -> List['Actividad']:
-        return self._actividades.copy()
+    def actividades(self) -> VistaColeccion['Actividad']:
+        return VistaColeccion(self._actividades)
     
     def asignar_actividad(self, actividad: 'Actividad'):
         """Asigna una actividad a la lista interna del profesor."""
-        if actividad not in self._actividades:
-            self._actividades.append(actividad)
+        self._actividades[actividad] = None
     
     def desasignar_actividad(self, actividad: 'Actividad'):
         """Desasigna una actividad de la lista interna."""
-        if actividad in self._actividades:
-            self._actividades.remove(actividad)
+        self._actividades.pop(actividad, None)
+    
+    def _migrar_estado(self):
+        """Migra las actividades guardadas como lista."""
+        if isinstance(self._actividades, list):
+            self._actividades = dict.fromkeys(self._actividades)
     
     def __str__(self) -> str:
         actividades_str = ", ".join([a.nombre for a in self._actividades]) if self._actividades else "Ninguna"
@@ -5,17 +5,21 @@ Implementa jerarquía de herencia para diferentes tipos de socios.
 
 # Standard library imports
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict
 from datetime import datetime
 
 # Local application imports
+from club.estructuras.estado_slots import EstadoSlots
+from club.estructuras.vista_coleccion import VistaColeccion
 # Se evita la importación directa para prevenir dependencias circulares
 # from club.entidades.actividad import Actividad
 
 
-class Socio(ABC):
+class Socio(ABC, EstadoSlots):
     """Clase base abstracta para todos los tipos de socios. Contiene solo datos y estado."""
     
+    __slots__ = ("_nombre", "_dni", "_actividades", "_fecha_registro", "_estado_pago")
+    
     def __init__(self, nombre: str, dni: int):
         """Inicializa un objeto Socio.
 
@@ -25,7 +29,7 @@ class Socio(ABC):
         """
         self._nombre = nombre
         self._dni = dni
-        self._actividades: List['Actividad'] = []
+        self._actividades: Dict['Actividad', None] = {}
         self._fecha_registro = datetime.now()
         self._estado_pago = "Pendiente"
         
@@ -38,8 +42,8 @@ class Socio(ABC):
         return self._dni
     
     @property
-    def actividades(self) -> List['Actividad']:
-        return self._actividades.copy()
+    def actividades(self) -> VistaColeccion['Actividad']:
+        return VistaColeccion(self._actividades)
     
     @property
     def fecha_registro(self) -> datetime:
@@ -55,19 +59,26 @@ class Socio(ABC):
     
     def agregar_actividad(self, actividad: 'Actividad'):
         """Agrega una actividad a la lista interna del socio."""
-        if actividad not in self._actividades:
-            self._actividades.append(actividad)
+        self._actividades[actividad] = None
     
     def eliminar_actividad(self, actividad: 'Actividad'):
         """Elimina una actividad de la lista interna del socio."""
-        if actividad in self._actividades:
-            self._actividades.remove(actividad)
+        self._actividades.pop(actividad, None)
+    
+    def tiene_actividad(self, actividad: 'Actividad') -> bool:
+        """Indica si el socio está inscrito en la actividad, en O(1)."""
+        return actividad in self._actividades
     
     @abstractmethod
     def get_tipo(self) -> str:
         """Retorna el tipo de socio como un string."""
         pass
     
+    def _migrar_estado(self):
+        """Migra las actividades guardadas como lista."""
+        if isinstance(self._actividades, list):
+            self._actividades = dict.fromkeys(self._actividades)
+    
     def __str__(self) -> str:
         actividades_str = ", ".join([a.nombre for a in self._actividades]) if self._actividades else "Ninguna"
         return (f"Socio: {self._nombre}\n"
@@ -83,6 +94,8 @@ class Socio(ABC):
 class SocioRegular(Socio):
     """Socio que paga según las actividades en las que participa."""
     
+    __slots__ = ()
+    
     def get_tipo(self) -> str:
         return "Regular"
 
@@ -90,6 +103,8 @@ class SocioRegular(Socio):
 class SocioPremium(Socio):
     """Socio que paga una cuota fija y accede a todas las actividades."""
     
+    __slots__ = ()
+    
     CUOTA_FIJA = 30000
     
     def get_tipo(self) -> str:
@@ -99,6 +114,8 @@ class SocioPremium(Socio):
 class SocioInfantil(Socio):
     """Socio menor de edad con cuota reducida y acceso limitado."""
     
+    __slots__ = ("_edad",)
+    
     CUOTA_FIJA = 15000
     
     def __init__(self, nombre: str, dni: int, edad: int):
@@ -3,18 +3,23 @@ Entidad Torneo - Representa torneos organizados por actividades.
 """
 
 # Standard library imports
-from typing import List
+from typing import Dict
 from datetime import datetime
 
 # Local application imports
+from club.estructuras.estado_slots import EstadoSlots
+from club.estructuras.vista_coleccion import VistaColeccion
 # Se evita la importación directa para prevenir dependencias circulares
 # from club.entidades.actividad import Actividad
 # from club.entidades.socio import Socio
 
 
-class Torneo:
+class Torneo(EstadoSlots):
     """Representa un torneo deportivo. Contiene solo datos y estado."""
     
+    __slots__ = ("_nombre", "_actividad", "_fecha", "_costo_inscripcion",
+                 "_participantes", "_fecha_creacion")
+    
     def __init__(self, nombre: str, actividad: 'Actividad', fecha: str, costo_inscripcion: float = 0):
         """Inicializa un objeto Torneo.
 
@@ -28,7 +33,7 @@ class Torneo:
         self._actividad = actividad
         self._fecha = fecha
         self._costo_inscripcion = costo_inscripcion
-        self._participantes: List['Socio'] = []
+        self._participantes: Dict['Socio', None] = {}
         self._fecha_creacion = datetime.now()
     
     @property
@@ -48,13 +53,21 @@ class Torneo:
         return self._costo_inscripcion
     
     @property
-    def participantes(self) -> List['Socio']:
-        return self._participantes.copy()
+    def participantes(self) -> VistaColeccion['Socio']:
+        return VistaColeccion(self._participantes)
     
     def inscribir_participante(self, socio: 'Socio'):
         """Agrega un socio a la lista de participantes del torneo."""
-        if socio not in self._participantes:
-            self._participantes.append(socio)
+        self._participantes[socio] = None
+    
+    def tiene_participante(self, socio: 'Socio') -> bool:
+        """Indica si el socio participa del torneo, en O(1)."""
+        return socio in self._participantes
+    
+    def _migrar_estado(self):
+        """Migra los participantes guardados como lista."""
+        if isinstance(self._participantes, list):
+            self._participantes = dict.fromkeys(self._participantes)
     
     def __str__(self) -> str:
         return (f"Torneo: {self._nombre}\n"
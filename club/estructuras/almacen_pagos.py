@@ -0,0 +1,319 @@
+"""
+Almacén columnar de pagos.
+Guarda los pagos en arreglos tipados (monto, fecha, DNI y método codificado)
+y materializa objetos Pago solo cuando se los solicita.
+"""
+
+# Standard library imports
+import pickle
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Third party imports (opcional)
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+# Local application imports
+from club.entidades.pago import Pago
+
+# Columnas tipadas del almacén y su código de tipo
+_COLUMNAS = (("_montos", 'd'), ("_timestamps", 'd'), ("_dnis", 'q'), ("_metodos", 'I'))
+
+
+class AlmacenPagosColumnar(Sequence):
+    """
+    Secuencia de pagos respaldada por columnas tipadas.
+    
+    Además de la interfaz de secuencia, ofrece las mismas consultas que
+    LibroPagos (entre, del_mes, ultimos) y RecaudacionAcumulada (total,
+    cantidad, por_metodo, total_socio, total_mes), resueltas de forma
+    vectorizada con NumPy si está disponible o con `array` en su defecto.
+    """
+    
+    def __init__(self, resolver_socio: Optional[Callable[[int], Optional['Socio']]] = None):
+        """Inicializa un almacén vacío.
+        
+        Args:
+            resolver_socio: Función que obtiene un socio por DNI, usada para
+                materializar los pagos. Puede asignarse luego con asignar_resolver.
+        """
+        self._resolver_socio = resolver_socio
+        self._montos = array('d')
+        self._timestamps = array('d')
+        self._dnis = array('q')
+        self._metodos = array('I')
+        self._catalogo_metodos: List[str] = []
+        self._codigos_metodo: Dict[str, int] = {}
+        # Índice de filas por DNI; None hasta que se lo necesita tras deserializar
+        self._filas_por_socio: Optional[Dict[int, array]] = {}
+        # Socios eliminados del registry que siguen referenciados por pagos, por DNI
+        self._retirados: Dict[int, 'Socio'] = {}
+        self._ordenado = True
+        # Tras cargar con buffers fuera de banda, las columnas son vistas de solo lectura
+        self._solo_lectura = False
+    
+    def asignar_resolver(self, resolver_socio: Callable[[int], Optional['Socio']]):
+        """Asigna la función usada para obtener el socio de cada pago."""
+        self._resolver_socio = resolver_socio
+    
+    def retirar_socio(self, socio: 'Socio'):
+        """Conserva un socio eliminado del registry para materializar sus pagos."""
+        self._retirados[socio.dni] = socio
+    
+    def socios_retirados(self) -> List['Socio']:
+        """Retorna los socios retirados que conserva el almacén."""
+        return list(self._retirados.values())
+    
+    # --- Escritura ---
+    
+    def append(self, pago: Pago):
+        """Agrega un pago descomponiéndolo en sus columnas."""
+        self.agregar_fila(pago.socio.dni, pago.monto, pago.metodo, pago.fecha.timestamp())
+    
+    def agregar_fila(self, dni: int, monto: float, metodo: str, timestamp: float):
+        """Agrega un pago a partir de sus valores, sin construir el objeto Pago."""
+        if self._solo_lectura:
+            self._hacer_escribible()
+        if self._timestamps and timestamp < self._timestamps[-1]:
+            self._ordenado = False
+        codigo = self._codigos_metodo.get(metodo)
+        if codigo is None:
+            codigo = len(self._catalogo_metodos)
+            self._catalogo_metodos.append(metodo)
+            self._codigos_metodo[metodo] = codigo
+        if self._filas_por_socio is not None:
+            self._filas_por_socio.setdefault(dni, array('q')).append(len(self._montos))
+        self._montos.append(monto)
+        self._timestamps.append(timestamp)
+        self._dnis.append(dni)
+        self._metodos.append(codigo)
+    
+    def clear(self):
+        """Elimina todos los pagos conservando el resolver de socios."""
+        self.__init__(self._resolver_socio)
+    
+    def copia(self) -> 'AlmacenPagosColumnar':
+        """Retorna una copia independiente, copiando los arreglos sin materializar pagos."""
+        nuevo = AlmacenPagosColumnar(self._resolver_socio)
+        for nombre, tipo in _COLUMNAS:
+            setattr(nuevo, nombre, _a_arreglo(tipo, getattr(self, nombre), copiar=True))
+        nuevo._catalogo_metodos = list(self._catalogo_metodos)
+        nuevo._codigos_metodo = dict(self._codigos_metodo)
+        nuevo._retirados = dict(self._retirados)
+        if self._filas_por_socio is not None:
+            nuevo._filas_por_socio = {dni: filas[:] for dni, filas in self._filas_por_socio.items()}
+        else:
+            nuevo._filas_por_socio = None
+        nuevo._ordenado = self._ordenado
+        return nuevo
+    
+    def _hacer_escribible(self):
+        """Copia a arreglos propios las columnas que son vistas de solo lectura."""
+        for nombre, tipo in _COLUMNAS:
+            setattr(self, nombre, _a_arreglo(tipo, getattr(self, nombre)))
+        self._solo_lectura = False
+    
+    # --- Secuencia ---
+    
+    def __len__(self) -> int:
+        return len(self._montos)
+    
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._materializar(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de pago fuera de rango")
+        return self._materializar(indice)
+    
+    def __iter__(self) -> Iterator[Pago]:
+        for fila in range(len(self)):
+            yield self._materializar(fila)
+    
+    def filas(self) -> Iterator[tuple]:
+        """Recorre los pagos como tuplas (dni, monto, metodo, timestamp) sin materializar objetos Pago."""
+        catalogo = self._catalogo_metodos
+        return zip(self._dnis, self._montos, (catalogo[codigo] for codigo in self._metodos), self._timestamps)
+    
+    def _materializar(self, fila: int) -> Pago:
+        """Construye el objeto Pago de una fila sin recalcular su comprobante."""
+        dni = self._dnis[fila]
+        timestamp = self._timestamps[fila]
+        socio = self._resolver_socio(dni) if self._resolver_socio else None
+        if socio is None:
+            socio = self._retirados.get(dni)
+        return Pago.restaurar(socio, self._montos[fila], self._catalogo_metodos[self._metodos[fila]],
+                              datetime.fromtimestamp(timestamp), f"PAGO-{dni}-{int(timestamp)}")
+    
+    # --- Consultas por socio y por fecha ---
+    
+    def pagos_socio(self, dni: int) -> List[Pago]:
+        """Retorna los pagos de un socio en O(pagos del socio)."""
+        return [self._materializar(fila) for fila in self._indice_socios().get(dni, ())]
+    
+    def tiene_pagos(self, dni: int) -> bool:
+        """Indica si el socio tiene al menos un pago en el almacén."""
+        return dni in self._indice_socios()
+    
+    def _indice_socios(self) -> Dict[int, array]:
+        """Retorna el índice de filas por DNI, construyéndolo la primera vez."""
+        if self._filas_por_socio is None:
+            indice: Dict[int, array] = {}
+            for fila, dni in enumerate(self._dnis):
+                indice.setdefault(dni, array('q')).append(fila)
+            self._filas_por_socio = indice
+        return self._filas_por_socio
+    
+    def _filas_entre(self, desde: float, hasta: float, incluir_hasta: bool) -> List[int]:
+        """Filas cuyo timestamp está en el rango, en orden cronológico."""
+        if self._ordenado:
+            inicio = bisect_left(self._timestamps, desde)
+            fin = (bisect_right if incluir_hasta else bisect_left)(self._timestamps, hasta)
+            return list(range(inicio, fin))
+        if np is not None:
+            timestamps = np.frombuffer(self._timestamps, dtype=np.float64)
+            mascara = (timestamps >= desde) & ((timestamps <= hasta) if incluir_hasta else (timestamps < hasta))
+            filas = np.flatnonzero(mascara)
+            return filas[np.argsort(timestamps[filas], kind="stable")].tolist()
+        filas = [i for i, t in enumerate(self._timestamps)
+                 if desde <= t and (t <= hasta if incluir_hasta else t < hasta)]
+        return sorted(filas, key=self._timestamps.__getitem__)
+    
+    def entre(self, desde: datetime, hasta: datetime) -> List[Pago]:
+        """Retorna los pagos con fecha en el intervalo [desde, hasta]."""
+        filas = self._filas_entre(desde.timestamp(), hasta.timestamp(), True)
+        return [self._materializar(fila) for fila in filas]
+    
+    def del_mes(self, anio: int, mes: int) -> List[Pago]:
+        """Retorna los pagos realizados en un mes calendario."""
+        filas = self._filas_entre(*self._limites_mes(anio, mes), False)
+        return [self._materializar(fila) for fila in filas]
+    
+    def ultimos(self, cantidad: int) -> List[Pago]:
+        """Retorna los últimos pagos en orden cronológico."""
+        if cantidad <= 0:
+            return []
+        if self._ordenado:
+            filas = range(max(len(self) - cantidad, 0), len(self))
+        elif np is not None:
+            timestamps = np.frombuffer(self._timestamps, dtype=np.float64)
+            filas = np.argsort(timestamps, kind="stable")[-cantidad:].tolist()
+        else:
+            filas = sorted(range(len(self)), key=self._timestamps.__getitem__)[-cantidad:]
+        return [self._materializar(fila) for fila in filas]
+    
+    @staticmethod
+    def _limites_mes(anio: int, mes: int) -> tuple:
+        desde = datetime(anio, mes, 1)
+        hasta = datetime(anio + 1, 1, 1) if mes == 12 else datetime(anio, mes + 1, 1)
+        return desde.timestamp(), hasta.timestamp()
+    
+    # --- Agregados vectorizados ---
+    
+    @property
+    def total(self) -> float:
+        if np is not None:
+            return float(np.frombuffer(self._montos, dtype=np.float64).sum())
+        return sum(self._montos)
+    
+    @property
+    def cantidad(self) -> int:
+        return len(self)
+    
+    @property
+    def por_metodo(self) -> Dict[str, float]:
+        if np is not None and self._montos:
+            totales = np.bincount(np.frombuffer(self._metodos, dtype=np.uint32),
+                                  weights=np.frombuffer(self._montos, dtype=np.float64),
+                                  minlength=len(self._catalogo_metodos))
+            return dict(zip(self._catalogo_metodos, totales.tolist()))
+        totales = [0.0] * len(self._catalogo_metodos)
+        for codigo, monto in zip(self._metodos, self._montos):
+            totales[codigo] += monto
+        return dict(zip(self._catalogo_metodos, totales))
+    
+    def total_socio(self, dni: int) -> float:
+        """Retorna el total pagado por un socio."""
+        filas = self._indice_socios().get(dni)
+        if not filas:
+            return 0
+        if np is not None:
+            montos = np.frombuffer(self._montos, dtype=np.float64)
+            return float(montos[np.frombuffer(filas, dtype=np.int64)].sum())
+        return sum(self._montos[fila] for fila in filas)
+    
+    def totales_por_socio(self) -> Dict[int, float]:
+        """Retorna el total pagado por cada socio en una sola pasada."""
+        if np is not None and self._montos:
+            dnis, inversa = np.unique(np.frombuffer(self._dnis, dtype=np.int64), return_inverse=True)
+            totales = np.bincount(inversa, weights=np.frombuffer(self._montos, dtype=np.float64))
+            return dict(zip(dnis.tolist(), totales.tolist()))
+        totales: Dict[int, float] = {}
+        for dni, monto in zip(self._dnis, self._montos):
+            totales[dni] = totales.get(dni, 0) + monto
+        return totales
+    
+    def total_mes(self, anio: int, mes: int) -> float:
+        """Retorna el total recaudado en un mes calendario."""
+        desde, hasta = self._limites_mes(anio, mes)
+        if np is not None:
+            timestamps = np.frombuffer(self._timestamps, dtype=np.float64)
+            montos = np.frombuffer(self._montos, dtype=np.float64)
+            return float(montos[(timestamps >= desde) & (timestamps < hasta)].sum())
+        return sum(m for t, m in zip(self._timestamps, self._montos) if desde <= t < hasta)
+    
+    # --- Serialización ---
+    
+    def __getstate__(self) -> dict:
+        estado = self.__dict__.copy()
+        # El resolver referencia al registry y el índice por socio se reconstruye;
+        # los socios retirados se guardan por referencias (ver Instantanea)
+        del estado["_resolver_socio"]
+        del estado["_filas_por_socio"]
+        del estado["_retirados"]
+        del estado["_solo_lectura"]
+        for nombre, tipo in _COLUMNAS:
+            estado[nombre] = _a_arreglo(tipo, estado[nombre])
+        return estado
+    
+    def __reduce_ex__(self, protocolo: int):
+        """Con el protocolo 5, las columnas se exportan como buffers sin copiarlas.
+        
+        Quien serializa puede guardarlos fuera de banda (buffer_callback) y al
+        cargar el almacén usa directamente los buffers recibidos, por ejemplo
+        vistas de un archivo mapeado en memoria.
+        """
+        if protocolo < 5:
+            return super().__reduce_ex__(protocolo)
+        estado = self.__getstate__()
+        for nombre, tipo in _COLUMNAS:
+            estado[nombre] = (tipo, pickle.PickleBuffer(getattr(self, nombre)))
+        return AlmacenPagosColumnar, (), estado
+    
+    def __setstate__(self, estado: dict):
+        self.__dict__.update(estado)
+        self._resolver_socio = None
+        self._filas_por_socio = None
+        self._retirados = {}
+        self._solo_lectura = False
+        for nombre, _ in _COLUMNAS:
+            valor = getattr(self, nombre)
+            if isinstance(valor, tuple):
+                tipo, buffer = valor
+                setattr(self, nombre, memoryview(buffer).cast('B').cast(tipo))
+                self._solo_lectura = True
+
+
+def _a_arreglo(tipo: str, columna, copiar: bool = False) -> array:
+    """Retorna la columna como arreglo, copiando las vistas de memoria a uno propio."""
+    if isinstance(columna, array):
+        return columna[:] if copiar else columna
+    arreglo = array(tipo)
+    arreglo.frombytes(memoryview(columna).cast('B'))
+    return arreglo
@@ -0,0 +1,132 @@
+"""
+Carga diferida de las colecciones del registry.
+Las colecciones se reemplazan por representantes que leen su archivo de datos
+la primera vez que se usan, de modo que el arranque no depende del tamaño de
+los datos sino de cuáles se consultan.
+"""
+
+# Standard library imports
+import threading
+from typing import Callable, Iterable
+
+
+class CargaPerezosa:
+    """
+    Carga pendiente de un grupo de colecciones que se restauran juntas.
+    Se ejecuta una única vez, la primera vez que se usa alguna de ellas.
+    """
+    
+    def __init__(self, cargar: Callable[[], None]):
+        """Inicializa la carga.
+        
+        Args:
+            cargar: Función que lee los archivos y reemplaza los representantes
+                del registry por las colecciones reales.
+        """
+        self._cargar = cargar
+        self._cargada = False
+        self._en_curso = False
+        self._lock = threading.RLock()
+    
+    @property
+    def cargada(self) -> bool:
+        return self._cargada
+    
+    def ejecutar(self):
+        """Ejecuta la carga si todavía no se hizo."""
+        if self._cargada:
+            return
+        with self._lock:
+            if self._cargada:
+                return
+            if self._en_curso:
+                raise RuntimeError("Carga diferida recursiva: la colección se usó mientras se cargaba")
+            self._en_curso = True
+            try:
+                self._cargar()
+            finally:
+                self._en_curso = False
+                # Aunque falle, no se reintenta: la función deja colecciones válidas
+                self._cargada = True
+
+
+class ColeccionPerezosa:
+    """
+    Representante de un atributo del registry que todavía no se cargó.
+    
+    Cualquier uso (iterar, consultar, llamar a un método, isinstance) ejecuta
+    la carga y se delega en el objeto real, que reemplaza al representante en
+    el registry; a partir de ahí el registry no vuelve a pasar por aquí.
+    """
+    
+    __slots__ = ("_carga", "_duenio", "_atributo")
+    
+    def __init__(self, carga: CargaPerezosa, duenio: object, atributo: str):
+        """Inicializa el representante.
+        
+        Args:
+            carga: Carga que reemplaza el atributo del dueño por el objeto real.
+            duenio: El objeto que guarda la colección (el registry).
+            atributo: Nombre del atributo que ocupa el representante.
+        """
+        self._carga = carga
+        self._duenio = duenio
+        self._atributo = atributo
+    
+    @classmethod
+    def instalar(cls, carga: CargaPerezosa, duenio: object, atributos: Iterable[str]):
+        """Reemplaza atributos del dueño por representantes de una misma carga."""
+        for atributo in atributos:
+            setattr(duenio, atributo, cls(carga, duenio, atributo))
+    
+    def _objetivo(self):
+        self._carga.ejecutar()
+        objetivo = getattr(self._duenio, self._atributo)
+        if objetivo is self:
+            raise RuntimeError(f"La carga diferida no restauró el atributo '{self._atributo}'")
+        return objetivo
+    
+    @property
+    def __class__(self):
+        # Permite que isinstance() vea el tipo de la colección real
+        return type(self._objetivo())
+    
+    def __getattr__(self, nombre: str):
+        return getattr(self._objetivo(), nombre)
+    
+    def __len__(self) -> int:
+        return len(self._objetivo())
+    
+    def __iter__(self):
+        return iter(self._objetivo())
+    
+    def __reversed__(self):
+        return reversed(self._objetivo())
+    
+    def __contains__(self, elemento: object) -> bool:
+        return elemento in self._objetivo()
+    
+    def __getitem__(self, clave):
+        return self._objetivo()[clave]
+    
+    def __setitem__(self, clave, valor):
+        self._objetivo()[clave] = valor
+    
+    def __delitem__(self, clave):
+        del self._objetivo()[clave]
+    
+    def __bool__(self) -> bool:
+        return bool(self._objetivo())
+    
+    def __eq__(self, otro: object) -> bool:
+        return self._objetivo() == otro
+    
+    __hash__ = None
+    
+    def __reduce_ex__(self, protocolo):
+        return self._objetivo().__reduce_ex__(protocolo)
+    
+    def __repr__(self) -> str:
+        if not self._carga.cargada:
+            return f"<ColeccionPerezosa '{self._atributo}' sin cargar>"
+        return repr(self._objetivo())
@@ -0,0 +1,44 @@
+"""
+Soporte de serialización para entidades compactas basadas en __slots__.
+Permite cargar tanto archivos nuevos como archivos guardados con __dict__.
+"""
+
+# Standard library imports
+from typing import Dict, Tuple
+
+
+def slots_de(clase: type) -> Tuple[str, ...]:
+    """Retorna todos los slots declarados en la jerarquía de una clase."""
+    nombres = []
+    for base in reversed(clase.__mro__):
+        for nombre in base.__dict__.get("__slots__", ()):
+            if nombre not in nombres:
+                nombres.append(nombre)
+    return tuple(nombres)
+
+
+class EstadoSlots:
+    """
+    Mixin que define el estado serializable de una entidad con __slots__
+    como un diccionario, igual que el de las versiones anteriores con __dict__.
+    """
+    
+    __slots__ = ()
+    
+    def __getstate__(self) -> Dict[str, object]:
+        return {nombre: getattr(self, nombre) for nombre in slots_de(type(self))
+                if hasattr(self, nombre)}
+    
+    def __setstate__(self, estado):
+        """Restaura el estado desde un diccionario (formato con __dict__)
+        o una tupla (estado, slots) y aplica las migraciones de la entidad."""
+        if isinstance(estado, tuple):
+            estado_dict, estado_slots = estado
+            estado = {**(estado_dict or {}), **(estado_slots or {})}
+        for nombre, valor in estado.items():
+            setattr(self, nombre, valor)
+        self._migrar_estado()
+    
+    def _migrar_estado(self):
+        """Adapta el estado restaurado de versiones anteriores (hook opcional)."""
+        pass
@@ -0,0 +1,71 @@
+"""
+Libro de pagos ordenado cronológicamente.
+Permite consultas por rango de fechas, por mes y de los últimos pagos.
+"""
+
+# Standard library imports
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Iterable, Iterator, List
+
+# Local application imports
+# Se evita la importación directa para prevenir dependencias circulares
+# from club.entidades.pago import Pago
+
+
+class LibroPagos:
+    """
+    Mantiene los pagos ordenados por fecha en dos listas paralelas
+    (fechas y pagos) para resolver consultas con búsqueda binaria.
+    """
+    
+    def __init__(self, pagos: Iterable['Pago'] = ()):
+        """Inicializa el libro, ordenando una única vez los pagos recibidos.
+
+        Args:
+            pagos: Pagos iniciales en cualquier orden.
+        """
+        ordenados = sorted(pagos, key=lambda p: p.fecha)
+        self._fechas: List[datetime] = [p.fecha for p in ordenados]
+        self._pagos: List['Pago'] = ordenados
+    
+    def agregar(self, pago: 'Pago'):
+        """Agrega un pago en su posición cronológica.
+
+        Los pagos con fecha posterior al último se agregan al final en O(1);
+        los pagos retroactivos se insertan en su posición sin reordenar el libro.
+        """
+        fecha = pago.fecha
+        if not self._fechas or fecha >= self._fechas[-1]:
+            self._fechas.append(fecha)
+            self._pagos.append(pago)
+            return
+        posicion = bisect_right(self._fechas, fecha)
+        self._fechas.insert(posicion, fecha)
+        self._pagos.insert(posicion, pago)
+    
+    def entre(self, desde: datetime, hasta: datetime) -> List['Pago']:
+        """Retorna los pagos con fecha en el intervalo [desde, hasta]."""
+        inicio = bisect_left(self._fechas, desde)
+        fin = bisect_right(self._fechas, hasta)
+        return self._pagos[inicio:fin]
+    
+    def del_mes(self, anio: int, mes: int) -> List['Pago']:
+        """Retorna los pagos realizados en un mes calendario."""
+        desde = datetime(anio, mes, 1)
+        hasta = datetime(anio + 1, 1, 1) if mes == 12 else datetime(anio, mes + 1, 1)
+        inicio = bisect_left(self._fechas, desde)
+        fin = bisect_left(self._fechas, hasta)
+        return self._pagos[inicio:fin]
+    
+    def ultimos(self, cantidad: int) -> List['Pago']:
+        """Retorna los últimos pagos en orden cronológico."""
+        if cantidad <= 0:
+            return []
+        return self._pagos[-cantidad:]
+    
+    def __len__(self) -> int:
+        return len(self._pagos)
+    
+    def __iter__(self) -> Iterator['Pago']:
+        return iter(self._pagos)
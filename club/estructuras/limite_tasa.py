@@ -0,0 +1,58 @@
+"""
+Limitador de tasa por cubeta de fichas (token bucket).
+Acota la cantidad de operaciones por segundo permitiendo ráfagas cortas.
+"""
+
+# Standard library imports
+import threading
+import time
+
+
+class LimiteTasa:
+    """
+    Cubeta de fichas que se recarga a una tasa constante.
+    
+    Cada operación consume una ficha; si no hay, la reserva queda adeudada y
+    se informa cuánto hay que esperar, así las esperas respetan el orden en
+    que se pidieron.
+    """
+    
+    def __init__(self, tasa: float, rafaga: int = 1):
+        """Inicializa la cubeta llena.
+        
+        Args:
+            tasa: Fichas que se recargan por segundo.
+            rafaga: Capacidad de la cubeta, es decir, operaciones seguidas sin espera.
+        """
+        if tasa <= 0 or rafaga <= 0:
+            raise ValueError("La tasa y la ráfaga deben ser mayores que cero")
+        self._tasa = tasa
+        self._rafaga = rafaga
+        self._fichas = float(rafaga)
+        self._ultima_recarga = time.monotonic()
+        self._lock = threading.Lock()
+    
+    @property
+    def tasa(self) -> float:
+        return self._tasa
+    
+    @property
+    def rafaga(self) -> int:
+        return self._rafaga
+    
+    def _recargar(self, ahora: float):
+        self._fichas = min(self._rafaga, self._fichas + (ahora - self._ultima_recarga) * self._tasa)
+        self._ultima_recarga = ahora
+    
+    def reservar(self) -> float:
+        """Consume una ficha y retorna los segundos a esperar antes de usarla (0 si hay)."""
+        with self._lock:
+            self._recargar(time.monotonic())
+            self._fichas -= 1
+            return 0.0 if self._fichas >= 0 else -self._fichas / self._tasa
+    
+    def disponibles(self) -> float:
+        """Fichas disponibles en este momento (negativo si hay reservas adeudadas)."""
+        with self._lock:
+            self._recargar(time.monotonic())
+            return self._fichas
@@ -0,0 +1,63 @@
+"""
+Acumuladores de recaudación mantenidos de forma incremental.
+Evitan recorrer la lista de pagos para generar totales y reportes.
+"""
+
+# Standard library imports
+from typing import Dict, Iterable, Tuple
+
+# Local application imports
+# Se evita la importación directa para prevenir dependencias circulares
+# from club.entidades.pago import Pago
+
+
+class RecaudacionAcumulada:
+    """
+    Totales de recaudación (general, por método, por socio y por mes)
+    actualizados en O(1) con cada pago registrado.
+    """
+    
+    def __init__(self, pagos: Iterable['Pago'] = ()):
+        """Inicializa los acumuladores a partir de los pagos existentes.
+
+        Args:
+            pagos: Pagos ya registrados, por ejemplo luego de cargar datos.
+        """
+        self._total = 0
+        self._cantidad = 0
+        self._por_metodo: Dict[str, float] = {}
+        self._por_socio: Dict[int, float] = {}
+        self._por_mes: Dict[Tuple[int, int], float] = {}
+        for pago in pagos:
+            self.registrar(pago)
+    
+    @property
+    def total(self) -> float:
+        return self._total
+    
+    @property
+    def cantidad(self) -> int:
+        return self._cantidad
+    
+    @property
+    def por_metodo(self) -> Dict[str, float]:
+        return self._por_metodo.copy()
+    
+    def registrar(self, pago: 'Pago'):
+        """Suma un pago a todos los acumuladores."""
+        monto = pago.monto
+        dni = pago.socio.dni
+        mes = (pago.fecha.year, pago.fecha.month)
+        self._total += monto
+        self._cantidad += 1
+        self._por_metodo[pago.metodo] = self._por_metodo.get(pago.metodo, 0) + monto
+        self._por_socio[dni] = self._por_socio.get(dni, 0) + monto
+        self._por_mes[mes] = self._por_mes.get(mes, 0) + monto
+    
+    def total_socio(self, dni: int) -> float:
+        """Retorna el total pagado por un socio."""
+        return self._por_socio.get(dni, 0)
+    
+    def total_mes(self, anio: int, mes: int) -> float:
+        """Retorna el total recaudado en un mes calendario."""
+        return self._por_mes.get((anio, mes), 0)
@@ -0,0 +1,43 @@
+"""
+Vista de solo lectura sobre las colecciones internas de las entidades.
+Permite recorrer las relaciones sin copiarlas ni exponerlas a modificaciones.
+"""
+
+# Standard library imports
+from collections.abc import Collection
+from typing import Dict, Generic, Iterator, List, TypeVar
+
+T = TypeVar('T')
+
+
+class VistaColeccion(Collection, Generic[T]):
+    """
+    Vista viva e inmutable sobre un diccionario usado como conjunto ordenado.
+    Refleja los cambios de la entidad dueña sin costo de copia.
+    """
+    
+    __slots__ = ("_datos",)
+    
+    def __init__(self, datos: Dict[T, None]):
+        """Inicializa la vista.
+
+        Args:
+            datos: La colección interna de la entidad.
+        """
+        self._datos = datos
+    
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._datos)
+    
+    def __len__(self) -> int:
+        return len(self._datos)
+    
+    def __contains__(self, elemento: object) -> bool:
+        return elemento in self._datos
+    
+    def copia(self) -> List[T]:
+        """Retorna una copia independiente de la colección en una lista."""
+        return list(self._datos)
+    
+    def __repr__(self) -> str:
+        return f"VistaColeccion({list(self._datos)!r})"
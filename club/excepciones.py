@@ -45,3 +45,11 @@ class CapacidadAlcanzadaError(ClubException):
 class InscripcionError(ClubException):
     """Se lanza por errores relacionados con la lógica de inscripción."""
     pass
+
+class ColaEventosLlenaError(ClubException):
+    """Se lanza cuando la cola de eventos asíncronos está llena y la política es fallar."""
+    pass
+
+class TransporteError(ClubException):
+    """Se lanza cuando un transporte de notificaciones no puede entregar un mensaje."""
+    pass
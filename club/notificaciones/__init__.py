@@ -0,0 +1,5 @@
+from .transportes import Mensaje, Transporte, TransporteArchivo, TransporteSMTP, TransporteWebhook
+from .bandeja import BandejaSalida, obtener_bandeja, configurar_bandeja
+
+__all__ = ['Mensaje', 'Transporte', 'TransporteArchivo', 'TransporteSMTP', 'TransporteWebhook',
+           'BandejaSalida', 'obtener_bandeja', 'configurar_bandeja']
\ No newline at end of file
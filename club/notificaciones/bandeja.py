@@ -0,0 +1,378 @@
+"""
+Bandeja de salida persistente de notificaciones.
+Los notificadores encolan los mensajes en una base SQLite y un hilo los
+entrega a un transporte, con reintentos y un límite de tasa, de modo que una
+notificación no se pierde si el transporte falla o el proceso termina.
+"""
+
+# Standard library imports
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+# Local application imports
+from club.salida import obtener_salida
+from club.estructuras.limite_tasa import LimiteTasa
+from club.notificaciones.transportes import Mensaje, Transporte
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS mensajes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    evento TEXT NOT NULL,
+    destinatario TEXT NOT NULL,
+    asunto TEXT NOT NULL,
+    cuerpo TEXT NOT NULL,
+    datos TEXT NOT NULL,
+    creado REAL NOT NULL,
+    intentos INTEGER NOT NULL DEFAULT 0,
+    proximo_intento REAL NOT NULL,
+    estado TEXT NOT NULL DEFAULT 'pendiente',
+    ultimo_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_mensajes_estado ON mensajes (estado, proximo_intento);
+"""
+
+
+class BandejaSalida:
+    """
+    Cola persistente de mensajes entregados por un hilo trabajador.
+    
+    - Encolar confirma la transacción en disco antes de retornar; un lote de
+      mensajes se encola en una sola transacción.
+    - El hilo toma los mensajes vencidos en orden y los reclama (estado
+      'enviando') en la misma transacción en que los lee, así que
+      procesar_pendientes() y el hilo nunca entregan el mismo mensaje. Por
+      cada uno pide una ficha al límite de tasa y llama al transporte. Si la
+      entrega funciona el mensaje se borra; si falla se reprograma con espera
+      exponencial (retardo_inicial * 2^n, hasta retardo_maximo) y tras
+      max_intentos queda como 'fallido'.
+    - La entrega es al menos una vez: si el proceso termina entre el envío y
+      la confirmación, al abrir la bandeja los mensajes que quedaron
+      reclamados vuelven a estar pendientes y se envían de nuevo.
+    """
+    
+    PENDIENTE = "pendiente"
+    ENVIANDO = "enviando"
+    FALLIDO = "fallido"
+    
+    # Ventana, en segundos, sobre la que se calcula el caudal de entregas
+    VENTANA_CAUDAL = 60.0
+    
+    def __init__(self, transporte: Transporte, ruta: str = os.path.join("data", "bandeja_salida.db"),
+                 tasa: float = 10.0, rafaga: int = 20, max_intentos: int = 5,
+                 retardo_inicial: float = 1.0, retardo_maximo: float = 300.0, tamano_lote: int = 100):
+        """Inicializa la bandeja y abre (o crea) su base.
+        
+        Args:
+            transporte: Destino de las entregas.
+            ruta: Archivo SQLite de la bandeja.
+            tasa: Entregas por segundo permitidas al transporte.
+            rafaga: Entregas seguidas permitidas sin esperar a la tasa.
+            max_intentos: Intentos antes de dar un mensaje por fallido.
+            retardo_inicial: Segundos de espera después del primer fallo.
+            retardo_maximo: Espera máxima entre reintentos.
+            tamano_lote: Mensajes que el hilo lee de la base en cada consulta.
+        """
+        if max_intentos <= 0 or tamano_lote <= 0:
+            raise ValueError("max_intentos y tamano_lote deben ser mayores que cero")
+        self._transporte = transporte
+        self._ruta = ruta
+        self._limite = LimiteTasa(tasa, rafaga)
+        self._max_intentos = max_intentos
+        self._retardo_inicial = retardo_inicial
+        self._retardo_maximo = retardo_maximo
+        self._tamano_lote = tamano_lote
+        directorio = os.path.dirname(ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        # El hilo trabajador y quienes encolan comparten la conexión bajo el lock
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False)
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute("PRAGMA synchronous=FULL")
+        self._conexion.executescript(ESQUEMA)
+        with self._conexion:
+            # Reclamados por una ejecución anterior que terminó sin confirmarlos
+            self._conexion.execute("UPDATE mensajes SET estado = ? WHERE estado = ?",
+                                   (self.PENDIENTE, self.ENVIANDO))
+        # Protege la conexión y las métricas, que actualizan varios hilos
+        self._lock = threading.Lock()
+        self._cambios = threading.Condition()
+        self._detenida = False
+        self._hilo: Optional[threading.Thread] = None
+        # Métricas desde que se abrió la bandeja
+        self._enviados = 0
+        self._reintentos = 0
+        self._fallidos = 0
+        self._segundos_limitado = 0.0
+        self._entregas_recientes: deque = deque()
+        self._inicio = time.monotonic()
+    
+    # --- Encolado ---
+    
+    def encolar(self, evento: str, destinatario: str, asunto: str, cuerpo: str,
+                datos: Optional[dict] = None) -> int:
+        """Guarda un mensaje en la bandeja y retorna su id.
+        
+        Args:
+            evento: Evento que originó la notificación.
+            destinatario: Identificador del destinatario.
+            asunto: Asunto del mensaje.
+            cuerpo: Texto del mensaje.
+            datos: Datos estructurados del evento (se guardan como JSON).
+        """
+        return self.encolar_varios([Mensaje(evento, destinatario, asunto, cuerpo, datos)])[0]
+    
+    def encolar_varios(self, mensajes: Iterable[Mensaje]) -> List[int]:
+        """Guarda varios mensajes en una única transacción y retorna sus ids."""
+        ahora = time.time()
+        ids = []
+        with self._lock, self._conexion:
+            for mensaje in mensajes:
+                cursor = self._conexion.execute(
+                    "INSERT INTO mensajes (evento, destinatario, asunto, cuerpo, datos, creado, proximo_intento) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (mensaje.evento, str(mensaje.destinatario), mensaje.asunto, mensaje.cuerpo,
+                     json.dumps(mensaje.datos, ensure_ascii=False, default=str), ahora, ahora))
+                mensaje.id = cursor.lastrowid
+                mensaje.creado = ahora
+                ids.append(cursor.lastrowid)
+        if ids:
+            with self._cambios:
+                self._cambios.notify_all()
+        return ids
+    
+    # --- Entrega ---
+    
+    def iniciar(self):
+        """Inicia el hilo que entrega los mensajes, si no está corriendo."""
+        if self._hilo is not None and self._hilo.is_alive():
+            return
+        self._detenida = False
+        self._hilo = threading.Thread(target=self._trabajar, name="bandeja-salida", daemon=True)
+        self._hilo.start()
+    
+    def detener(self, timeout: Optional[float] = None):
+        """Detiene el hilo trabajador; los mensajes pendientes quedan en la base."""
+        with self._cambios:
+            self._detenida = True
+            self._cambios.notify_all()
+        if self._hilo is not None:
+            self._hilo.join(timeout)
+            self._hilo = None
+    
+    def cerrar(self, timeout: Optional[float] = None):
+        """Detiene el hilo y cierra la base y el transporte."""
+        self.detener(timeout)
+        with self._lock:
+            self._conexion.close()
+        self._transporte.cerrar()
+    
+    def procesar_pendientes(self, limite: Optional[int] = None) -> int:
+        """Entrega en el hilo actual los mensajes vencidos, respetando el límite de tasa.
+        
+        Args:
+            limite: Cantidad máxima de mensajes a procesar (por defecto, todos los vencidos).
+        
+        Returns:
+            La cantidad de mensajes procesados (entregados o reprogramados).
+        """
+        procesados = 0
+        while limite is None or procesados < limite:
+            lote = self._vencidos(self._tamano_lote if limite is None else min(self._tamano_lote,
+                                                                               limite - procesados))
+            if not lote:
+                break
+            for mensaje in lote:
+                espera = self._limite.reservar()
+                if espera > 0:
+                    self._contar_espera(espera)
+                    time.sleep(espera)
+                self._entregar(mensaje)
+                procesados += 1
+        return procesados
+    
+    def esperar(self, timeout: Optional[float] = None) -> bool:
+        """Espera a que no queden mensajes pendientes.
+        
+        Args:
+            timeout: Segundos máximos de espera (por defecto, sin límite).
+        
+        Returns:
+            True si la bandeja quedó sin pendientes.
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+        while self.pendientes():
+            restante = None if limite is None else limite - time.monotonic()
+            if restante is not None and restante <= 0:
+                return False
+            with self._cambios:
+                self._cambios.wait(0.05 if restante is None else min(0.05, restante))
+        return True
+    
+    def reintentar_fallidos(self) -> int:
+        """Vuelve a poner en cola los mensajes fallidos y retorna cuántos."""
+        with self._lock, self._conexion:
+            cursor = self._conexion.execute(
+                "UPDATE mensajes SET estado = ?, intentos = 0, proximo_intento = ? WHERE estado = ?",
+                (self.PENDIENTE, time.time(), self.FALLIDO))
+        with self._cambios:
+            self._cambios.notify_all()
+        return cursor.rowcount
+    
+    def _trabajar(self):
+        while True:
+            with self._cambios:
+                if self._detenida:
+                    return
+            lote = self._vencidos(self._tamano_lote)
+            if not lote:
+                proximo = self._proximo_intento()
+                with self._cambios:
+                    if not self._detenida:
+                        self._cambios.wait(None if proximo is None else max(0.0, proximo - time.time()))
+                continue
+            for indice, mensaje in enumerate(lote):
+                espera = self._limite.reservar()
+                if espera > 0:
+                    self._contar_espera(espera)
+                    with self._cambios:
+                        # Si se detiene durante la espera, el resto del lote vuelve a quedar pendiente
+                        if self._cambios.wait_for(lambda: self._detenida, espera):
+                            self._liberar(lote[indice:])
+                            return
+                self._entregar(mensaje)
+    
+    def _vencidos(self, cantidad: int) -> List[Mensaje]:
+        """Lee y reclama, en una sola transacción, hasta `cantidad` mensajes vencidos."""
+        with self._lock, self._conexion:
+            filas = self._conexion.execute(
+                "SELECT id, evento, destinatario, asunto, cuerpo, datos, creado, intentos FROM mensajes "
+                "WHERE estado = ? AND proximo_intento <= ? ORDER BY proximo_intento, id LIMIT ?",
+                (self.PENDIENTE, time.time(), cantidad)).fetchall()
+            self._conexion.executemany("UPDATE mensajes SET estado = ? WHERE id = ?",
+                                       ((self.ENVIANDO, fila[0]) for fila in filas))
+        return [Mensaje(evento, destinatario, asunto, cuerpo, json.loads(datos), id=id_mensaje,
+                        creado=creado, intentos=intentos)
+                for id_mensaje, evento, destinatario, asunto, cuerpo, datos, creado, intentos in filas]
+    
+    def _liberar(self, mensajes: List[Mensaje]):
+        """Devuelve a la cola mensajes reclamados que no se llegaron a enviar."""
+        with self._lock, self._conexion:
+            self._conexion.executemany("UPDATE mensajes SET estado = ? WHERE id = ? AND estado = ?",
+                                       ((self.PENDIENTE, mensaje.id, self.ENVIANDO) for mensaje in mensajes))
+    
+    def _contar_espera(self, espera: float):
+        with self._lock:
+            self._segundos_limitado += espera
+    
+    def _proximo_intento(self) -> Optional[float]:
+        with self._lock:
+            fila = self._conexion.execute("SELECT MIN(proximo_intento) FROM mensajes WHERE estado = ?",
+                                          (self.PENDIENTE,)).fetchone()
+        return fila[0]
+    
+    def _entregar(self, mensaje: Mensaje):
+        try:
+            self._transporte.enviar(mensaje)
+        except Exception as e:
+            self._registrar_fallo(mensaje, e)
+            return
+        with self._lock:
+            with self._conexion:
+                self._conexion.execute("DELETE FROM mensajes WHERE id = ?", (mensaje.id,))
+            ahora = time.monotonic()
+            self._enviados += 1
+            self._entregas_recientes.append(ahora)
+            while self._entregas_recientes and self._entregas_recientes[0] < ahora - self.VENTANA_CAUDAL:
+                self._entregas_recientes.popleft()
+        with self._cambios:
+            self._cambios.notify_all()
+    
+    def _registrar_fallo(self, mensaje: Mensaje, error: Exception):
+        intentos = mensaje.intentos + 1
+        if intentos >= self._max_intentos:
+            estado, proximo = self.FALLIDO, time.time()
+            obtener_salida().error(f"No se pudo entregar el mensaje {mensaje.id} ('{mensaje.evento}') "
+                                   f"después de {intentos} intentos: {error}")
+        else:
+            estado = self.PENDIENTE
+            proximo = time.time() + min(self._retardo_inicial * 2 ** (intentos - 1), self._retardo_maximo)
+            obtener_salida().warning(f"Falló la entrega del mensaje {mensaje.id} (intento {intentos}), "
+                                     f"se reintenta en {proximo - time.time():.1f} s: {error}")
+        with self._lock:
+            with self._conexion:
+                self._conexion.execute(
+                    "UPDATE mensajes SET intentos = ?, proximo_intento = ?, estado = ?, ultimo_error = ? "
+                    "WHERE id = ?", (intentos, proximo, estado, str(error), mensaje.id))
+            if estado == self.FALLIDO:
+                self._fallidos += 1
+            else:
+                self._reintentos += 1
+    
+    # --- Métricas ---
+    
+    def pendientes(self) -> int:
+        """Mensajes en cola, incluidos los que esperan un reintento y los que se están enviando."""
+        with self._lock:
+            return self._conexion.execute("SELECT COUNT(*) FROM mensajes WHERE estado IN (?, ?)",
+                                          (self.PENDIENTE, self.ENVIANDO)).fetchone()[0]
+    
+    def metricas(self) -> Dict[str, float]:
+        """Retorna el estado de la bandeja y los contadores de entrega.
+        
+        Returns:
+            Un diccionario con:
+                pendientes: mensajes en cola (profundidad de la cola).
+                en_reintento: pendientes que ya fallaron al menos una vez.
+                fallidos: mensajes que agotaron los intentos.
+                antiguedad_maxima: segundos en cola del pendiente más viejo.
+                enviados, reintentos: contadores desde que se abrió la bandeja.
+                entregas_por_segundo: caudal en los últimos VENTANA_CAUDAL segundos
+                    (o desde que se abrió la bandeja, si es más reciente).
+                segundos_limitado: tiempo total de espera impuesto por el límite de tasa.
+        """
+        with self._lock:
+            pendientes, en_reintento, mas_viejo = self._conexion.execute(
+                "SELECT COUNT(*), COALESCE(SUM(intentos > 0), 0), MIN(creado) FROM mensajes "
+                "WHERE estado IN (?, ?)", (self.PENDIENTE, self.ENVIANDO)).fetchone()
+            fallidos = self._conexion.execute("SELECT COUNT(*) FROM mensajes WHERE estado = ?",
+                                              (self.FALLIDO,)).fetchone()[0]
+            ahora = time.monotonic()
+            recientes = sum(1 for instante in self._entregas_recientes
+                            if instante >= ahora - self.VENTANA_CAUDAL)
+            enviados, reintentos, segundos_limitado = self._enviados, self._reintentos, self._segundos_limitado
+        ventana = min(self.VENTANA_CAUDAL, ahora - self._inicio)
+        return {
+            "pendientes": pendientes,
+            "en_reintento": en_reintento,
+            "fallidos": fallidos,
+            "antiguedad_maxima": 0.0 if mas_viejo is None else max(0.0, time.time() - mas_viejo),
+            "enviados": enviados,
+            "reintentos": reintentos,
+            "entregas_por_segundo": recientes / ventana if ventana > 0 else 0.0,
+            "segundos_limitado": segundos_limitado,
+        }
+
+
+_bandeja_actual: Optional[BandejaSalida] = None
+
+
+def obtener_bandeja() -> Optional[BandejaSalida]:
+    """Retorna la bandeja de salida configurada, o None si las notificaciones solo se muestran."""
+    return _bandeja_actual
+
+
+def configurar_bandeja(bandeja: Optional[BandejaSalida]) -> Optional[BandejaSalida]:
+    """Reemplaza la bandeja de salida del sistema y retorna la anterior.
+    
+    La bandeja anterior no se detiene ni se cierra, para que el llamador
+    decida si debe reutilizarla.
+    """
+    global _bandeja_actual
+    anterior = _bandeja_actual
+    _bandeja_actual = bandeja
+    return anterior
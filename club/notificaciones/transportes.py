@@ -0,0 +1,177 @@
+"""
+Transportes de notificaciones.
+Entregan los mensajes de la bandeja de salida a un destino concreto: un
+directorio de spool, un servidor SMTP local de depuración o un webhook.
+"""
+
+# Standard library imports
+import json
+import os
+import smtplib
+import urllib.request
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+from typing import Dict, Optional
+
+# Local application imports
+from club.excepciones import TransporteError
+
+
+class Mensaje:
+    """
+    Notificación dirigida a un destinatario, tal como se guarda en la bandeja.
+    """
+    
+    __slots__ = ("id", "evento", "destinatario", "asunto", "cuerpo", "datos", "creado", "intentos")
+    
+    def __init__(self, evento: str, destinatario: str, asunto: str, cuerpo: str,
+                 datos: Optional[dict] = None, id: Optional[int] = None, creado: float = 0.0,
+                 intentos: int = 0):
+        """Inicializa un mensaje.
+        
+        Args:
+            evento: Evento que originó la notificación.
+            destinatario: Identificador del destinatario (el DNI del socio).
+            asunto: Asunto del mensaje.
+            cuerpo: Texto del mensaje.
+            datos: Datos estructurados del evento (serializables en JSON).
+            id: Identificador asignado por la bandeja al encolarlo.
+            creado: Timestamp en que se encoló.
+            intentos: Entregas fallidas hasta ahora.
+        """
+        self.id = id
+        self.evento = evento
+        self.destinatario = destinatario
+        self.asunto = asunto
+        self.cuerpo = cuerpo
+        self.datos = datos or {}
+        self.creado = creado
+        self.intentos = intentos
+    
+    def a_dict(self) -> dict:
+        return {"id": self.id, "evento": self.evento, "destinatario": self.destinatario,
+                "asunto": self.asunto, "cuerpo": self.cuerpo, "datos": self.datos, "creado": self.creado}
+    
+    def __repr__(self) -> str:
+        return f"Mensaje(id={self.id}, evento='{self.evento}', destinatario='{self.destinatario}')"
+
+
+class Transporte(ABC):
+    """
+    Interfaz de los destinos de entrega de la bandeja de salida.
+    
+    La bandeja puede entregar un mensaje más de una vez (si el proceso termina
+    entre la entrega y su confirmación), así que los transportes usan el id
+    del mensaje para que las repeticiones sean idempotentes.
+    """
+    
+    @abstractmethod
+    def enviar(self, mensaje: Mensaje):
+        """Entrega un mensaje o lanza una excepción para que se reintente.
+        
+        Args:
+            mensaje: El mensaje a entregar.
+        """
+        pass
+    
+    def cerrar(self):
+        """Libera los recursos del transporte."""
+        pass
+
+
+class TransporteArchivo(Transporte):
+    """Escribe cada mensaje como un archivo JSON en un directorio de spool."""
+    
+    def __init__(self, directorio: str = os.path.join("data", "spool")):
+        """Inicializa el transporte.
+        
+        Args:
+            directorio: Directorio donde se dejan los mensajes.
+        """
+        self._directorio = directorio
+    
+    def enviar(self, mensaje: Mensaje):
+        os.makedirs(self._directorio, exist_ok=True)
+        # El nombre depende solo del id: una entrega repetida reemplaza el mismo archivo
+        ruta = os.path.join(self._directorio, f"{mensaje.id:010d}.json")
+        temporal = ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(mensaje.a_dict(), f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, ruta)
+
+
+class TransporteSMTP(Transporte):
+    """
+    Envía los mensajes por correo a un servidor SMTP, pensado para un servidor
+    local de depuración (por ejemplo, `python -m aiosmtpd -n -l localhost:1025`).
+    """
+    
+    def __init__(self, host: str = "localhost", puerto: int = 1025, remitente: str = "club@localhost",
+                 dominio: str = "socios.club.local", timeout: float = 10.0):
+        """Inicializa el transporte.
+        
+        Args:
+            host: Servidor SMTP.
+            puerto: Puerto del servidor.
+            remitente: Dirección del remitente.
+            dominio: Dominio de las direcciones de los socios (<dni>@dominio).
+            timeout: Segundos máximos de cada conexión.
+        """
+        self._host = host
+        self._puerto = puerto
+        self._remitente = remitente
+        self._dominio = dominio
+        self._timeout = timeout
+        self._conexion: Optional[smtplib.SMTP] = None
+    
+    def enviar(self, mensaje: Mensaje):
+        correo = EmailMessage()
+        correo["From"] = self._remitente
+        correo["To"] = f"{mensaje.destinatario}@{self._dominio}"
+        correo["Subject"] = mensaje.asunto
+        correo["Message-ID"] = f"<club-{mensaje.id}@{self._dominio}>"
+        correo.set_content(mensaje.cuerpo)
+        try:
+            if self._conexion is None:
+                self._conexion = smtplib.SMTP(self._host, self._puerto, timeout=self._timeout)
+            self._conexion.send_message(correo)
+        except (OSError, smtplib.SMTPException):
+            # La conexión se descarta y se abre otra en el próximo intento
+            self.cerrar()
+            raise
+    
+    def cerrar(self):
+        if self._conexion is not None:
+            try:
+                self._conexion.quit()
+            except (OSError, smtplib.SMTPException):
+                pass
+            self._conexion = None
+
+
+class TransporteWebhook(Transporte):
+    """Publica cada mensaje como JSON con un POST a una URL (un webhook o un servicio que lo simula)."""
+    
+    def __init__(self, url: str, timeout: float = 5.0, cabeceras: Optional[Dict[str, str]] = None):
+        """Inicializa el transporte.
+        
+        Args:
+            url: URL que recibe los mensajes.
+            timeout: Segundos máximos de cada pedido.
+            cabeceras: Cabeceras HTTP adicionales (por ejemplo, de autenticación).
+        """
+        self._url = url
+        self._timeout = timeout
+        self._cabeceras = dict(cabeceras or {})
+    
+    def enviar(self, mensaje: Mensaje):
+        pedido = urllib.request.Request(
+            self._url, data=json.dumps(mensaje.a_dict(), ensure_ascii=False).encode("utf-8"), method="POST",
+            headers={**self._cabeceras, "Content-Type": "application/json",
+                     "Idempotency-Key": f"club-{mensaje.id}"})
+        # urlopen lanza HTTPError para los códigos de error
+        with urllib.request.urlopen(pedido, timeout=self._timeout) as respuesta:
+            if not 200 <= respuesta.status < 300:
+                raise TransporteError(f"El webhook respondió {respuesta.status} al mensaje {mensaje.id}")
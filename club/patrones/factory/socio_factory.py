@@ -4,6 +4,7 @@ Permite crear diferentes tipos de socios sin conocer las clases concretas.
 """
 
 # Standard library imports
+from datetime import datetime
 from typing import Optional
 
 # Local application imports
@@ -15,6 +16,8 @@ class SocioFactory:
     Factory para crear instancias de diferentes tipos de socios.
     """
     
+    _CLASES = {"regular": SocioRegular, "premium": SocioPremium, "infantil": SocioInfantil}
+    
     @staticmethod
     def crear_socio(tipo: str, nombre: str, dni: int, edad: Optional[int] = None) -> Socio:
         """Crea un socio según el tipo especificado.
@@ -50,6 +53,36 @@ class SocioFactory:
             tipos_validos = ["regular", "premium", "infantil"]
             raise ValueError(f"Tipo de socio inválido: '{tipo}'. Tipos válidos: {tipos_validos}")
     
+    @staticmethod
+    def restaurar_socio(tipo: str, nombre: str, dni: int, edad: Optional[int],
+                        fecha_registro: datetime, estado_pago: str) -> Socio:
+        """Reconstruye un socio ya registrado (por ejemplo, leído de disco).
+        
+        A diferencia de crear_socio, no vuelve a validar los datos ni toma la
+        fecha actual como fecha de registro.
+        
+        Args:
+            tipo: Tipo de socio en minúsculas ('regular', 'premium', 'infantil').
+            nombre: Nombre del socio.
+            dni: DNI del socio.
+            edad: Edad (solo para socio infantil).
+            fecha_registro: Fecha de registro original.
+            estado_pago: Estado de pago guardado.
+        
+        Returns:
+            La instancia de Socio, sin actividades.
+        """
+        clase = SocioFactory._CLASES[tipo]
+        socio = clase.__new__(clase)
+        socio._nombre = nombre
+        socio._dni = dni
+        socio._actividades = {}
+        socio._fecha_registro = fecha_registro
+        socio._estado_pago = estado_pago
+        if edad is not None:
+            socio._edad = edad
+        return socio
+    
     @staticmethod
     def tipos_disponibles() -> list:
         """Retorna la lista de tipos de socios disponibles."""
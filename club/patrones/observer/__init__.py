@@ -1,5 +1,6 @@
-from .observer import Observer, Observable
+from .observer import Observer, AsyncObserver, Observable, SujetoObservable
+from .despachador import DespachadorEventos
 from .notificador_torneo import NotificadorTorneo
 from .notificador_pago import NotificadorPago
 
-__all__ = ['Observer', 'Observable', 'NotificadorTorneo', 'NotificadorPago']
\ No newline at end of file
+__all__ = ['Observer', 'AsyncObserver', 'Observable', 'SujetoObservable', 'DespachadorEventos', 'NotificadorTorneo', 'NotificadorPago']
\ No newline at end of file
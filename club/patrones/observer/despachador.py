@@ -0,0 +1,151 @@
+"""
+Despacho asíncrono de eventos del patrón Observer.
+Los eventos se encolan en una cola acotada y uno o más hilos los entregan a
+los observadores, de modo que quien notifica no espera a que terminen.
+"""
+
+# Standard library imports
+import atexit
+import queue
+import threading
+import time
+from typing import Optional, Sequence
+
+# Local application imports
+from club.excepciones import ColaEventosLlenaError
+from club.salida import obtener_salida
+from .observer import EntregaAsincrona, entregar_asincronas
+
+
+class DespachadorEventos:
+    """
+    Cola acotada de eventos entregados por hilos trabajadores.
+    
+    Cuando la cola está llena, la política de contrapresión decide qué pasa:
+    'bloquear' espera a que haya lugar, 'descartar_antiguo' descarta el evento
+    más viejo de la cola y 'fallar' lanza ColaEventosLlenaError.
+    
+    Cada evento se entrega a sus observadores en orden y desde un mismo hilo;
+    con más de un hilo, eventos distintos pueden entregarse en paralelo.
+    """
+    
+    BLOQUEAR = "bloquear"
+    DESCARTAR_ANTIGUO = "descartar_antiguo"
+    FALLAR = "fallar"
+    
+    def __init__(self, capacidad: int = 1000, hilos: int = 1, politica: str = BLOQUEAR,
+                 nombre: str = "eventos"):
+        """Inicializa el despachador e inicia sus hilos.
+        
+        Args:
+            capacidad: Cantidad máxima de eventos pendientes en la cola.
+            hilos: Cantidad de hilos que entregan los eventos.
+            politica: 'bloquear', 'descartar_antiguo' o 'fallar'.
+            nombre: Prefijo del nombre de los hilos.
+        """
+        if politica not in (self.BLOQUEAR, self.DESCARTAR_ANTIGUO, self.FALLAR):
+            raise ValueError(f"Política de contrapresión desconocida: '{politica}'")
+        if capacidad <= 0 or hilos <= 0:
+            raise ValueError("La capacidad y la cantidad de hilos deben ser mayores que cero")
+        self._cola: queue.Queue = queue.Queue(maxsize=capacidad)
+        self._politica = politica
+        self._descartados = 0
+        self._cerrado = False
+        self._hilos = [threading.Thread(target=self._trabajar, name=f"{nombre}-{i + 1}", daemon=True)
+                       for i in range(hilos)]
+        for hilo in self._hilos:
+            hilo.start()
+        # Al terminar el programa se entregan los eventos pendientes
+        atexit.register(self.cerrar)
+    
+    @property
+    def pendientes(self) -> int:
+        """Eventos encolados o en proceso de entrega."""
+        return self._cola.unfinished_tasks
+    
+    @property
+    def descartados(self) -> int:
+        """Eventos descartados por la política 'descartar_antiguo'."""
+        return self._descartados
+    
+    def publicar(self, suscripciones: Sequence['Suscripcion'], evento: str, datos: dict):
+        """Encola un evento para entregarlo a los manejadores indicados.
+        
+        Args:
+            suscripciones: Pares (observador, manejador) suscritos al evento.
+            evento: Tipo de evento que ocurrió.
+            datos: Información adicional sobre el evento.
+        """
+        if self._cerrado:
+            raise RuntimeError("El despachador de eventos está cerrado")
+        elemento = (suscripciones, evento, datos)
+        if self._politica == self.BLOQUEAR:
+            self._cola.put(elemento)
+            return
+        while True:
+            try:
+                self._cola.put_nowait(elemento)
+                return
+            except queue.Full:
+                if self._politica == self.FALLAR:
+                    raise ColaEventosLlenaError(
+                        f"La cola de eventos está llena ({self._cola.maxsize} pendientes); evento '{evento}' rechazado")
+            try:
+                self._cola.get_nowait()
+            except queue.Empty:
+                continue
+            self._cola.task_done()
+            self._descartados += 1
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Espera a que se entreguen todos los eventos encolados hasta ahora.
+        
+        Args:
+            timeout: Segundos máximos de espera (por defecto, sin límite).
+        
+        Returns:
+            True si no quedan eventos pendientes.
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+        with self._cola.all_tasks_done:
+            while self._cola.unfinished_tasks:
+                restante = None if limite is None else limite - time.monotonic()
+                if restante is not None and restante <= 0:
+                    return False
+                self._cola.all_tasks_done.wait(restante)
+        return True
+    
+    def cerrar(self, timeout: Optional[float] = None):
+        """Entrega los eventos pendientes y detiene los hilos."""
+        if self._cerrado:
+            return
+        self.flush(timeout)
+        self._cerrado = True
+        for _ in self._hilos:
+            self._cola.put(None)
+        for hilo in self._hilos:
+            hilo.join(timeout)
+        atexit.unregister(self.cerrar)
+    
+    def _trabajar(self):
+        while True:
+            elemento = self._cola.get()
+            try:
+                if elemento is None:
+                    return
+                suscripciones, evento, datos = elemento
+                asincronas = []
+                for observador, manejador in suscripciones:
+                    if isinstance(manejador, EntregaAsincrona):
+                        asincronas.append(manejador)
+                        continue
+                    try:
+                        manejador(datos)
+                    except Exception as e:
+                        obtener_salida().error(
+                            f"El observador {type(observador).__name__} falló al procesar '{evento}': {e}")
+                if asincronas:
+                    # Las entregas asíncronas de un evento se esperan juntas en este hilo
+                    entregar_asincronas(asincronas, datos)
+            finally:
+                self._cola.task_done()
@@ -2,73 +2,112 @@
 Observador concreto para notificaciones de pagos.
 """
 
+# Standard library imports
+from typing import Optional
+
 # Local application imports
+from club.salida import obtener_salida
+from club.notificaciones.bandeja import BandejaSalida, obtener_bandeja
 from .observer import Observer
 
 
 class NotificadorPago(Observer):
     """
     Observador que maneja notificaciones de pagos de cuotas.
+    Las muestra por la salida y, si hay una bandeja de salida configurada,
+    las encola para entregarlas al socio.
     """
     
+    # Eventos a los que se suscribe, con el método que procesa cada uno
+    MANEJADORES = {
+        "pago_registrado": "_notificar_pago_exitoso",
+        "pago_vencido": "_notificar_pago_vencido",
+        "recordatorio_pago": "_notificar_recordatorio",
+    }
+    
     def __init__(self, nombre: str = "Sistema de Pagos"):
         """Inicializa el notificador.
-
+        
         Args:
             nombre: El nombre del notificador.
         """
         self._nombre = nombre
     
-    def actualizar(self, evento: str, datos: dict):
-        """Procesa eventos relacionados con pagos.
-
-        Args:
-            evento: El tipo de evento a procesar.
-            datos: Un diccionario con los datos del evento.
-        """
-        if evento == "pago_registrado":
-            self._notificar_pago_exitoso(datos)
-        elif evento == "pago_vencido":
-            self._notificar_pago_vencido(datos)
-        elif evento == "recordatorio_pago":
-            self._notificar_recordatorio(datos)
-    
     def _notificar_pago_exitoso(self, datos: dict):
         """Notifica sobre un pago exitoso."""
+        salida = obtener_salida()
+        bandeja = obtener_bandeja()
+        if not salida.habilitado() and bandeja is None:
+            return
         socio_nombre = datos.get('socio', 'Socio')
         monto = datos.get('monto', 0)
         comprobante = datos.get('comprobante', 'N/A')
         metodo = datos.get('metodo', 'Efectivo')
+        detalle = [
+            f"Monto: ${monto} | Método: {metodo}",
+            f"Comprobante: {comprobante}",
+            "¡Muchas gracias! Su pago ha sido procesado exitosamente.",
+        ]
         
-        print("\n" + "="*60)
-        print(f"[PAGO REGISTRADO] ✓ - {socio_nombre}")
-        print("="*60)
-        print(f"Monto: ${monto} | Método: {metodo}")
-        print(f"Comprobante: {comprobante}")
-        print("¡Muchas gracias! Su pago ha sido procesado exitosamente.")
-        print("="*60 + "\n")
-
+        salida.mostrar("\n".join([
+            "\n" + "="*60,
+            f"[PAGO REGISTRADO] ✓ - {socio_nombre}",
+            "="*60,
+            *detalle,
+            "="*60 + "\n"
+        ]), evento="pago_registrado", socio=socio_nombre, monto=monto, comprobante=comprobante)
+        self._encolar(bandeja, "pago_registrado", datos, f"Pago registrado - {comprobante}", detalle)
+    
     def _notificar_pago_vencido(self, datos: dict):
         """Notifica sobre un pago vencido."""
+        salida = obtener_salida()
+        bandeja = obtener_bandeja()
+        if not salida.habilitado() and bandeja is None:
+            return
         socio_nombre = datos.get('socio', 'Socio')
         monto = datos.get('monto', 0)
+        detalle = [
+            f"Monto adeudado: ${monto}",
+            "Por favor, regularice su situación a la brevedad.",
+        ]
         
-        print("\n" + "="*60)
-        print(f"[AVISO DE PAGO VENCIDO] - {socio_nombre}")
-        print("="*60)
-        print(f"Monto adeudado: ${monto}")
-        print("Por favor, regularice su situación a la brevedad.")
-        print("="*60 + "\n")
-
+        salida.mostrar("\n".join([
+            "\n" + "="*60,
+            f"[AVISO DE PAGO VENCIDO] - {socio_nombre}",
+            "="*60,
+            *detalle,
+            "="*60 + "\n"
+        ]), evento="pago_vencido", socio=socio_nombre, monto=monto)
+        self._encolar(bandeja, "pago_vencido", datos, "Aviso de pago vencido", detalle)
+    
     def _notificar_recordatorio(self, datos: dict):
         """Notifica un recordatorio de pago."""
+        salida = obtener_salida()
+        bandeja = obtener_bandeja()
+        if not salida.habilitado() and bandeja is None:
+            return
         socio_nombre = datos.get('socio', 'Socio')
         monto = datos.get('monto', 0)
         vencimiento = datos.get('vencimiento', 'Próximamente')
+        detalle = [
+            f"Monto a pagar: ${monto}",
+            f"Fecha de vencimiento: {vencimiento}",
+        ]
         
-        print("\n" + "="*60)
-        print(f"[RECORDATORIO DE PAGO] - {socio_nombre}")
-        print("="*60)
-        print(f"Monto a pagar: ${monto}")
-        print(f"Fecha de vencimiento: {vencimiento}")
-        print("="*60 + "\n")
\ No newline at end of file
+        salida.mostrar("\n".join([
+            "\n" + "="*60,
+            f"[RECORDATORIO DE PAGO] - {socio_nombre}",
+            "="*60,
+            *detalle,
+            "="*60 + "\n"
+        ]), evento="recordatorio_pago", socio=socio_nombre, monto=monto, vencimiento=vencimiento)
+        self._encolar(bandeja, "recordatorio_pago", datos, "Recordatorio de pago", detalle)
+    
+    @staticmethod
+    def _encolar(bandeja: Optional[BandejaSalida], evento: str, datos: dict, asunto: str, detalle: list):
+        """Guarda la notificación en la bandeja de salida, si hay una configurada."""
+        if bandeja is None:
+            return
+        socio_nombre = datos.get('socio', 'Socio')
+        cuerpo = "\n".join([f"Hola {socio_nombre},", "", *detalle])
+        bandeja.encolar(evento, datos.get('dni', socio_nombre), asunto, cuerpo, datos)
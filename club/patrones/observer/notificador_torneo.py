@@ -2,65 +2,180 @@
 Observador concreto para notificaciones de torneos.
 """
 
+# Standard library imports
+import threading
+from typing import Dict, Optional, Set, Tuple
+
 # Local application imports
+from club.salida import obtener_salida
+from club.notificaciones.bandeja import obtener_bandeja
+from club.notificaciones.transportes import Mensaje
+from .despachador import DespachadorEventos
 from .observer import Observer
 
 
 class NotificadorTorneo(Observer):
     """
     Observador que maneja notificaciones de nuevos torneos.
+    
+    Los anuncios de torneos se envían en segundo plano y por lotes de socios,
+    y cada socio recibe un único anuncio por torneo aunque el evento se repita.
+    Con una bandeja de salida configurada, cada anuncio se encola además como
+    un mensaje para el socio.
     """
     
-    def __init__(self, nombre: str = "Sistema de Torneos"):
+    # Eventos a los que se suscribe, con el método que procesa cada uno
+    MANEJADORES = {
+        "nuevo_torneo": "_notificar_nuevo_torneo",
+        "torneo_cancelado": "_notificar_cancelacion",
+        "inscripcion_torneo": "_notificar_inscripcion",
+    }
+    
+    TAMANO_LOTE = 500
+    
+    # Hilo de anuncios compartido por todos los notificadores (se crea al primer uso)
+    _despachador: Optional[DespachadorEventos] = None
+    _lock_despachador = threading.Lock()
+    
+    def __init__(self, nombre: str = "Sistema de Torneos", tamano_lote: int = TAMANO_LOTE,
+                 segundo_plano: bool = True):
         """Inicializa el notificador.
-
+        
         Args:
             nombre: El nombre del notificador.
+            tamano_lote: Cantidad de socios anunciados en cada mensaje.
+            segundo_plano: Si es True, los anuncios de torneos se envían desde
+                un hilo compartido y quien crea el torneo no los espera.
         """
+        if tamano_lote <= 0:
+            raise ValueError("El tamaño de lote debe ser mayor que cero")
         self._nombre = nombre
+        self._tamano_lote = tamano_lote
+        self._segundo_plano = segundo_plano
+        self._iniciar()
     
-    def actualizar(self, evento: str, datos: dict):
-        """Procesa eventos relacionados con torneos.
-
-        Args:
-            evento: El tipo de evento a procesar.
-            datos: Un diccionario con los datos del evento.
-        """
-        if evento == "nuevo_torneo":
-            self._notificar_nuevo_torneo(datos)
-        elif evento == "torneo_cancelado":
-            self._notificar_cancelacion(datos)
-        elif evento == "inscripcion_torneo":
-            self._notificar_inscripcion(datos)
+    def _iniciar(self):
+        self._lock = threading.Lock()
+        # (actividad, torneo, fecha) -> DNIs ya notificados del torneo
+        self._notificados: Dict[Tuple[str, str, str], Set[int]] = {}
+    
+    def __getstate__(self) -> dict:
+        # Se guarda con las actividades; los notificados son de la ejecución
+        return {"_nombre": self._nombre, "_tamano_lote": self._tamano_lote,
+                "_segundo_plano": self._segundo_plano}
+    
+    def __setstate__(self, estado: dict):
+        self._nombre = estado.get("_nombre", "Sistema de Torneos")
+        self._tamano_lote = estado.get("_tamano_lote", self.TAMANO_LOTE)
+        self._segundo_plano = estado.get("_segundo_plano", True)
+        self._iniciar()
     
     def _notificar_nuevo_torneo(self, datos: dict):
-        """Notifica sobre un nuevo torneo a los socios inscritos en la actividad."""
+        """Programa el anuncio de un nuevo torneo a los socios inscritos en la actividad."""
+        if not obtener_salida().habilitado() and obtener_bandeja() is None:
+            return
+        # Los destinatarios son los inscritos al crear el torneo, no al enviar
+        # los lotes (tuple() no copia si ya es una tupla)
+        datos = {**datos, 'socios': tuple(datos.get('socios', ()))}
+        if not self._segundo_plano:
+            self._difundir(datos)
+            return
+        self._obtener_despachador().publicar(((self, self._difundir),), "nuevo_torneo", datos)
+    
+    @classmethod
+    def _obtener_despachador(cls) -> DespachadorEventos:
+        with cls._lock_despachador:
+            if cls._despachador is None:
+                cls._despachador = DespachadorEventos(hilos=1, nombre="torneos")
+            return cls._despachador
+    
+    def _difundir(self, datos: dict):
+        """Anuncia un torneo por lotes, omitiendo a los socios ya notificados."""
+        salida = obtener_salida()
+        mostrar = salida.habilitado()
+        bandeja = obtener_bandeja()
         torneo = datos.get('torneo', 'Torneo')
         actividad = datos.get('actividad', 'Actividad')
         fecha = datos.get('fecha', 'Sin fecha')
         costo = datos.get('costo', 0)
-        socios_a_notificar = datos.get('socios', [])
-
-        print("\n" + "="*60)
-        print(f"[NUEVO TORNEO] ¡{torneo} de {actividad}!")
-        print("="*60)
-        print(f"Fecha: {fecha} | Costo de inscripción: ${costo}")
-        print("\nNotificando a los siguientes socios:")
-        if socios_a_notificar:
-            for socio in socios_a_notificar:
-                print(f"  - {socio.nombre}")
-        else:
-            print("  (No hay socios inscritos en esta actividad para notificar)")
-        print("="*60 + "\n")
-
+        socios = datos.get('socios', ())
+        with self._lock:
+            notificados = self._notificados.setdefault((actividad, torneo, fecha), set())
+        
+        encabezado = "\n".join([
+            "\n" + "="*60,
+            f"[NUEVO TORNEO] ¡{torneo} de {actividad}!",
+            "="*60,
+            f"Fecha: {fecha} | Costo de inscripción: ${costo}",
+            "\nNotificando a los siguientes socios:"
+        ])
+        if not socios:
+            salida.mostrar("\n".join([encabezado, "  (No hay socios inscritos en esta actividad para notificar)",
+                                      "="*60 + "\n"]),
+                           evento="nuevo_torneo", torneo=torneo, actividad=actividad, notificados=0)
+            return
+        cuerpo = f"{torneo} de {actividad}\nFecha: {fecha} | Costo de inscripción: ${costo}"
+        total = 0
+        for inicio in range(0, len(socios), self._tamano_lote):
+            with self._lock:
+                lote = [socio for socio in socios[inicio:inicio + self._tamano_lote]
+                        if socio.dni not in notificados]
+                notificados.update(socio.dni for socio in lote)
+            if not lote:
+                continue
+            if mostrar:
+                if total == 0:
+                    salida.mostrar(encabezado, evento="nuevo_torneo", torneo=torneo, actividad=actividad)
+                salida.mostrar("\n".join(f"  - {socio.nombre}" for socio in lote),
+                               evento="nuevo_torneo_lote", torneo=torneo, actividad=actividad,
+                               notificados=len(lote))
+            if bandeja is not None:
+                # Un lote de mensajes por transacción de la bandeja
+                bandeja.encolar_varios(
+                    Mensaje("nuevo_torneo", socio.dni, f"Nuevo torneo: {torneo}",
+                            f"Hola {socio.nombre},\n\n{cuerpo}",
+                            {'torneo': torneo, 'actividad': actividad, 'fecha': fecha, 'costo': costo,
+                             'dni': socio.dni})
+                    for socio in lote)
+            total += len(lote)
+        if total and mostrar:
+            salida.mostrar("="*60 + "\n", evento="nuevo_torneo_fin", torneo=torneo, actividad=actividad,
+                           notificados=total)
+        elif not total:
+            salida.debug(f"Los socios de {actividad} ya fueron notificados del torneo '{torneo}'")
+    
+    @classmethod
+    def esperar(cls, timeout: Optional[float] = None) -> bool:
+        """Espera a que terminen los anuncios programados por cualquier notificador.
+        
+        Args:
+            timeout: Segundos máximos de espera (por defecto, sin límite).
+        
+        Returns:
+            True si no quedan anuncios pendientes.
+        """
+        despachador = cls._despachador
+        return despachador is None or despachador.flush(timeout)
+    
     def _notificar_cancelacion(self, datos: dict):
         """Notifica sobre cancelación de torneo."""
         torneo = datos.get('torneo', 'Torneo')
-        print(f"\n[AVISO] El torneo '{torneo}' ha sido cancelado.")
+        with self._lock:
+            self._notificados.pop((datos.get('actividad', 'Actividad'), torneo, datos.get('fecha', 'Sin fecha')),
+                                  None)
+        obtener_salida().mostrar(f"\n[AVISO] El torneo '{torneo}' ha sido cancelado.",
+                                 evento="torneo_cancelado", torneo=torneo)
     
     def _notificar_inscripcion(self, datos: dict):
         """Notifica sobre inscripción exitosa a un torneo."""
         socio = datos.get('socio')
         torneo = datos.get('torneo')
         if socio and torneo:
-            print(f"\n[INSCRIPCIÓN A TORNEO] {socio.nombre} se ha inscrito exitosamente en '{torneo.nombre}'.")
\ No newline at end of file
+            obtener_salida().mostrar(
+                f"\n[INSCRIPCIÓN A TORNEO] {socio.nombre} se ha inscrito exitosamente en '{torneo.nombre}'.",
+                evento="inscripcion_torneo", socio=socio.nombre, torneo=torneo.nombre)
+            bandeja = obtener_bandeja()
+            if bandeja is not None:
+                bandeja.encolar("inscripcion_torneo", socio.dni, f"Inscripción a {torneo.nombre}",
+                                f"Hola {socio.nombre},\n\nTe inscribiste en '{torneo.nombre}' ({torneo.fecha}).",
+                                {'torneo': torneo.nombre, 'fecha': torneo.fecha, 'dni': socio.dni})
\ No newline at end of file
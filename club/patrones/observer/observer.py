@@ -4,59 +4,294 @@ Define el contrato para observadores y sujetos observables.
 """
 
 # Standard library imports
-from abc import ABC, abstractmethod
-from typing import List
+import asyncio
+from abc import ABC
+from functools import partial
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Local application imports
+from club.salida import obtener_salida
+
+# Par (observador, manejador) que recibe los datos de un tipo de evento
+Suscripcion = Tuple['Observer', Callable[[dict], None]]
 
 
 class Observer(ABC):
     """
     Interfaz para los observadores que reciben notificaciones.
+    
+    Un observador se suscribe a tipos de evento concretos declarando en
+    MANEJADORES el método que procesa cada uno; el sujeto solo le entrega
+    esos eventos. Si no declara MANEJADORES, recibe todos los eventos en
+    actualizar(), como los observadores anteriores a las suscripciones.
     """
     
-    @abstractmethod
+    # Tipo de evento -> nombre del método que recibe sus datos
+    MANEJADORES: Optional[Dict[str, str]] = None
+    
     def actualizar(self, evento: str, datos: dict):
         """Método llamado cuando ocurre un evento observable.
         
+        Por defecto entrega los datos al manejador suscrito al evento.
+        
         Args:
             evento: Tipo de evento que ocurrió.
             datos: Información adicional sobre el evento.
         """
-        pass
+        manejador = self.manejador(evento)
+        if manejador is not None:
+            manejador(datos)
+    
+    def manejador(self, evento: str) -> Optional[Callable[[dict], None]]:
+        """Retorna la función que procesa los datos de un tipo de evento.
+        
+        Args:
+            evento: Tipo de evento.
+        
+        Returns:
+            El manejador suscrito, o None si el evento no le interesa al observador.
+        """
+        if self.MANEJADORES is None:
+            # Adaptador para los observadores sin suscripciones: reciben todo en actualizar()
+            return partial(self.actualizar, evento)
+        nombre = self.MANEJADORES.get(evento)
+        return getattr(self, nombre) if nombre is not None else None
 
 
-class Observable(ABC):
+class AsyncObserver(Observer):
     """
-    Clase base para sujetos observables que notifican a los observadores.
+    Observador cuyas entregas son corrutinas, para transportes de E/S (correo,
+    pasarelas de SMS) que pueden esperar en paralelo.
+    
+    Convive con los observadores sincrónicos en el mismo sujeto: los
+    manejadores declarados en MANEJADORES son corrutinas, o sin MANEJADORES
+    recibe todos los eventos en actualizar_async(). Las entregas asíncronas de
+    un mismo evento se esperan juntas, cada una con su límite de timeout.
+    """
+    
+    # Segundos máximos de cada entrega (None, sin límite); se puede cambiar por instancia
+    timeout: Optional[float] = 10.0
+    
+    async def actualizar_async(self, evento: str, datos: dict):
+        """Corrutina llamada cuando ocurre un evento observable.
+        
+        Por defecto espera al manejador suscrito al evento.
+        
+        Args:
+            evento: Tipo de evento que ocurrió.
+            datos: Información adicional sobre el evento.
+        """
+        if self.MANEJADORES is None:
+            raise NotImplementedError("Un AsyncObserver sin MANEJADORES debe implementar actualizar_async()")
+        nombre = self.MANEJADORES.get(evento)
+        if nombre is not None:
+            await getattr(self, nombre)(datos)
+    
+    def manejador(self, evento: str) -> Optional['EntregaAsincrona']:
+        """Retorna la entrega asíncrona de un tipo de evento, o None si no le interesa."""
+        if self.MANEJADORES is None:
+            return EntregaAsincrona(self, partial(self.actualizar_async, evento), evento)
+        nombre = self.MANEJADORES.get(evento)
+        return EntregaAsincrona(self, getattr(self, nombre), evento) if nombre is not None else None
+
+
+class EntregaAsincrona:
+    """
+    Manejador de un AsyncObserver en la tabla de suscripciones.
+    
+    Llamado como un manejador sincrónico (notificación sincrónica o hilo del
+    despachador) ejecuta la corrutina con entregar_asincronas().
+    """
+    
+    __slots__ = ("observador", "funcion", "evento")
+    
+    def __init__(self, observador: AsyncObserver, funcion: Callable[[dict], Awaitable[None]], evento: str):
+        self.observador = observador
+        self.funcion = funcion
+        self.evento = evento
+    
+    def __call__(self, datos: dict):
+        entregar_asincronas((self,), datos)
+
+
+# Tareas programadas desde código sincrónico dentro de un bucle en ejecución;
+# se guarda una referencia para que no se recolecten antes de terminar
+_tareas_pendientes: Set[asyncio.Task] = set()
+
+
+async def entregar_async(entregas: Iterable[EntregaAsincrona], datos: dict):
+    """Espera en paralelo las entregas asíncronas de un evento.
+    
+    Cada entrega tiene el timeout de su observador. Los errores y los
+    vencimientos se informan por la salida y no interrumpen a las demás.
+    """
+    entregas = tuple(entregas)
+    resultados = await asyncio.gather(
+        *(asyncio.wait_for(entrega.funcion(datos), entrega.observador.timeout) for entrega in entregas),
+        return_exceptions=True)
+    for entrega, resultado in zip(entregas, resultados):
+        if not isinstance(resultado, Exception):
+            continue
+        nombre = type(entrega.observador).__name__
+        if isinstance(resultado, asyncio.TimeoutError):
+            obtener_salida().error(f"El observador {nombre} no terminó de procesar '{entrega.evento}' "
+                                   f"en {entrega.observador.timeout} s")
+        else:
+            obtener_salida().error(f"El observador {nombre} falló al procesar '{entrega.evento}': {resultado}")
+
+
+def entregar_asincronas(entregas: Iterable[EntregaAsincrona], datos: dict):
+    """Ejecuta entregas asíncronas desde código sincrónico.
+    
+    Sin un bucle de asyncio en el hilo, las espera en paralelo en un bucle
+    propio antes de retornar. Dentro de un bucle en ejecución no se puede
+    bloquear: se programan como una tarea y el método retorna enseguida.
     """
+    try:
+        bucle = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(entregar_async(entregas, datos))
+        return
+    tarea = bucle.create_task(entregar_async(tuple(entregas), datos))
+    _tareas_pendientes.add(tarea)
+    tarea.add_done_callback(_tareas_pendientes.discard)
+
+
+def entregar(suscripciones: Iterable[Suscripcion], datos: dict):
+    """Entrega un evento desde código sincrónico.
+    
+    Los manejadores sincrónicos se llaman en orden; los asíncronos se juntan
+    y se entregan en paralelo al final (ver entregar_asincronas).
+    """
+    asincronas = None
+    for _, manejador in suscripciones:
+        if isinstance(manejador, EntregaAsincrona):
+            if asincronas is None:
+                asincronas = []
+            asincronas.append(manejador)
+        else:
+            manejador(datos)
+    if asincronas:
+        entregar_asincronas(asincronas, datos)
+
+
+async def entregar_en_bucle(suscripciones: Iterable[Suscripcion], datos: dict):
+    """Entrega un evento desde una corrutina: los manejadores sincrónicos se
+    llaman en orden y los asíncronos se esperan en paralelo."""
+    asincronas = []
+    for _, manejador in suscripciones:
+        if isinstance(manejador, EntregaAsincrona):
+            asincronas.append(manejador)
+        else:
+            manejador(datos)
+    if asincronas:
+        await entregar_async(asincronas, datos)
+
+
+def suscripciones_de(observadores: Iterable[Observer], evento: str) -> Tuple[Suscripcion, ...]:
+    """Arma, en el orden de registro, las suscripciones de los observadores a un evento."""
+    suscripciones = []
+    for observador in observadores:
+        manejador = observador.manejador(evento)
+        if manejador is not None:
+            suscripciones.append((observador, manejador))
+    return tuple(suscripciones)
+
+
+class SujetoObservable:
+    """
+    Comportamiento de los sujetos observables, sin atributos propios en
+    __slots__: las entidades compactas lo heredan declarando _observadores,
+    _suscripciones y _despachador entre sus slots (ver Observable).
+    """
+    
+    __slots__ = ()
     
-    def __init__(self):
-        """Inicializa un objeto Observable."""
+    def __init__(self, despachador: Optional['DespachadorEventos'] = None):
+        """Inicializa un objeto Observable.
+        
+        Args:
+            despachador: Despachador asíncrono de eventos (opcional).
+        """
         self._observadores: List[Observer] = []
+        self._suscripciones: Dict[str, Tuple[Suscripcion, ...]] = {}
+        self._despachador = despachador
+    
+    def configurar_despachador(self, despachador: Optional['DespachadorEventos']):
+        """Configura el despachador asíncrono, o vuelve a notificar en forma sincrónica con None."""
+        self._despachador = despachador
     
     def agregar_observador(self, observador: Observer):
         """Registra un nuevo observador.
-
+        
         Args:
             observador: La instancia del observador a registrar.
         """
         if observador not in self._observadores:
             self._observadores.append(observador)
+            self._suscripciones = {}
     
     def eliminar_observador(self, observador: Observer):
         """Elimina un observador registrado.
-
+        
         Args:
             observador: La instancia del observador a eliminar.
         """
         if observador in self._observadores:
             self._observadores.remove(observador)
+            self._suscripciones = {}
     
     def notificar_observadores(self, evento: str, datos: dict):
-        """Notifica a todos los observadores sobre un evento.
-
+        """Notifica a los observadores suscritos a un evento.
+        
+        Con un despachador configurado, el evento se encola y el método retorna
+        sin esperar a los observadores.
+        
         Args:
             evento: Tipo de evento que ocurrió.
             datos: Información adicional sobre el evento.
         """
-        for observador in self._observadores:
-            observador.actualizar(evento, datos)
\ No newline at end of file
+        suscripciones = self._suscripciones_de(evento)
+        if not suscripciones:
+            return
+        if self._despachador is not None:
+            self._despachador.publicar(suscripciones, evento, datos)
+            return
+        entregar(suscripciones, datos)
+    
+    async def notificar_observadores_async(self, evento: str, datos: dict):
+        """Notifica un evento desde una corrutina, sin pasar por el despachador.
+        
+        Los observadores sincrónicos se llaman en orden y las entregas de los
+        AsyncObserver se esperan en paralelo, cada una con su timeout.
+        
+        Args:
+            evento: Tipo de evento que ocurrió.
+            datos: Información adicional sobre el evento.
+        """
+        suscripciones = self._suscripciones_de(evento)
+        if suscripciones:
+            await entregar_en_bucle(suscripciones, datos)
+    
+    def _suscripciones_de(self, evento: str) -> Tuple[Suscripcion, ...]:
+        suscripciones = self._suscripciones.get(evento)
+        if suscripciones is None:
+            suscripciones = self._suscripciones[evento] = suscripciones_de(self._observadores, evento)
+        return suscripciones
+
+
+class Observable(SujetoObservable, ABC):
+    """
+    Clase base para sujetos observables que notifican a los observadores.
+    Por defecto notifica de forma sincrónica; con un despachador, los eventos
+    se encolan y se entregan desde sus hilos.
+    
+    Las suscripciones se resuelven en una tabla por tipo de evento que se arma
+    la primera vez que se notifica cada tipo y se descarta al cambiar los
+    observadores, así que notificar es una búsqueda en un diccionario que solo
+    llega a los manejadores interesados.
+    
+    Los observadores sincrónicos y los AsyncObserver conviven: desde código
+    asíncrono, notificar_observadores_async() espera las entregas asíncronas
+    en paralelo.
+    """
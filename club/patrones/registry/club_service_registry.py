@@ -7,6 +7,9 @@ Evita el uso de condicionales if/isinstance para despachar métodos.
 import threading
 from typing import Dict, Optional, Any
 
+# Local application imports
+from club.salida import obtener_salida
+
 
 class ClubServiceRegistry:
     """
@@ -47,10 +50,10 @@ class ClubServiceRegistry:
             servicio: Instancia del servicio a registrar.
         """
         if nombre in self._servicios:
-            print(f"[WARNING] Servicio '{nombre}' ya existe. Se sobrescribirá.")
+            obtener_salida().warning(f"Servicio '{nombre}' ya existe. Se sobrescribirá.")
         
         self._servicios[nombre] = servicio
-        print(f"[INFO] Servicio '{nombre}' registrado exitosamente")
+        obtener_salida().info(f"Servicio '{nombre}' registrado exitosamente")
     
     def obtener_servicio(self, nombre: str) -> Optional[Any]:
         """Obtiene un servicio registrado.
@@ -63,7 +66,7 @@ class ClubServiceRegistry:
         """
         servicio = self._servicios.get(nombre)
         if servicio is None:
-            print(f"[ERROR] Servicio '{nombre}' no encontrado")
+            obtener_salida().error(f"Servicio '{nombre}' no encontrado")
         return servicio
     
     def eliminar_servicio(self, nombre: str) -> bool:
@@ -77,9 +80,9 @@ class ClubServiceRegistry:
         """
         if nombre in self._servicios:
             del self._servicios[nombre]
-            print(f"[INFO] Servicio '{nombre}' eliminado")
+            obtener_salida().info(f"Servicio '{nombre}' eliminado")
             return True
-        print(f"[WARNING] Servicio '{nombre}' no existe")
+        obtener_salida().warning(f"Servicio '{nombre}' no existe")
         return False
     
     def listar_servicios(self) -> list:
@@ -93,7 +96,7 @@ class ClubServiceRegistry:
     def reset(self):
         """Limpia todos los servicios registrados (útil para testing)."""
         self._servicios.clear()
-        print("[INFO] Registry reiniciado")
+        obtener_salida().info("Registry reiniciado")
     
     def __str__(self) -> str:
         servicios_str = ", ".join(self._servicios.keys()) if self._servicios else "Ninguno"
@@ -4,24 +4,55 @@ Singleton Registry para la gestión centralizada de datos en memoria.
 
 # Standard library imports
 import threading
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import Iterator, List, Dict, Optional
 
 # Local application imports
+from club.salida import obtener_salida
 from club.entidades.socio import Socio
 from club.entidades.actividad import Actividad
 from club.entidades.profesor import Profesor
 from club.entidades.pago import Pago
+from club.entidades.torneo import Torneo
+from club.estructuras.almacen_pagos import AlmacenPagosColumnar
+from club.estructuras.libro_pagos import LibroPagos
+from club.estructuras.recaudacion import RecaudacionAcumulada
+from club.patrones.observer.observer import Observable
 
 
-class ClubRegistry:
+class ClubRegistry(Observable):
     """
     Singleton que actúa como una base de datos en memoria para el club.
-    Mantiene listas de todas las entidades principales.
+    Mantiene listas de todas las entidades principales y notifica cada
+    modificación a sus observadores (por ejemplo, el diario de cambios).
     """
     
     _instance = None
     _lock = threading.Lock()
     
+    COLECCIONES = ("socios", "actividades", "profesores", "pagos")
+    
+    # Colecciones cuyo contenido cambia con cada evento del registro
+    _COLECCIONES_POR_EVENTO = {
+        'socio_registrado': ("socios",),
+        'socio_eliminado': ("socios",),
+        'estado_pago_actualizado': ("socios",),
+        'actividad_registrada': ("actividades",),
+        # Los servicios desvinculan antes a sus socios y profesores
+        'actividad_eliminada': ("actividades", "socios", "profesores"),
+        'torneo_registrado': ("actividades",),
+        'participante_inscrito': ("actividades",),
+        'profesor_registrado': ("profesores",),
+        'profesor_eliminado': ("profesores",),
+        'sueldo_modificado': ("profesores",),
+        'socio_inscrito': ("socios", "actividades"),
+        'socio_desinscrito': ("socios", "actividades"),
+        'profesor_asignado': ("profesores", "actividades"),
+        'profesor_desasignado': ("profesores", "actividades"),
+        'pago_registrado': ("pagos",),
+        'registro_reiniciado': COLECCIONES,
+    }
+    
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
@@ -34,12 +65,18 @@ class ClubRegistry:
         if self._initialized:
             return
         
+        super().__init__()
         self._socios: Dict[int, Socio] = {}
         self._actividades: Dict[str, Actividad] = {}
         self._profesores: Dict[int, Profesor] = {}
         self._pagos: List[Pago] = []
+        self._pagos_por_socio: Dict[int, List[Pago]] = {}
+        self._libro_pagos = LibroPagos()
+        self._recaudacion = RecaudacionAcumulada()
+        self._generaciones: Dict[str, int] = dict.fromkeys(self.COLECCIONES, 0)
+        self._generaciones_guardadas: Dict[str, int] = dict.fromkeys(self.COLECCIONES, 0)
         self._initialized = True
-        print("[INFO] ClubRegistry inicializado")
+        obtener_salida().info("ClubRegistry inicializado")
     
     @classmethod
     def get_instance(cls) -> 'ClubRegistry':
@@ -55,6 +92,19 @@ class ClubRegistry:
         if socio.dni in self._socios:
             raise ValueError(f"Socio con DNI {socio.dni} ya existe")
         self._socios[socio.dni] = socio
+        self._notificar_cambio('socio_registrado', {'socio': socio})
+    
+    def registrar_socios(self, socios: List[Socio]):
+        """Registra varios socios de una sola vez: se registran todos o ninguno."""
+        nuevos = {socio.dni: socio for socio in socios}
+        if len(nuevos) != len(socios):
+            raise ValueError("El lote contiene DNIs duplicados")
+        existentes = [dni for dni in nuevos if dni in self._socios]
+        if existentes:
+            raise ValueError(f"Socios con DNI {existentes} ya existen")
+        self._socios.update(nuevos)
+        for socio in socios:
+            self._notificar_cambio('socio_registrado', {'socio': socio})
     
     def obtener_socio(self, dni: int) -> Optional[Socio]:
         """Obtiene un socio por su DNI."""
@@ -67,7 +117,15 @@ class ClubRegistry:
     def eliminar_socio(self, dni: int) -> bool:
         """Elimina un socio del registro."""
         if dni in self._socios:
+            if self.usa_almacen_columnar() and self._pagos.tiene_pagos(dni):
+                # El almacén guarda solo DNIs: conserva al socio para materializar sus pagos
+                self._pagos.retirar_socio(self._socios[dni])
+                self.marcar_modificada("pagos")
+            elif not self._usa_almacen_pagos() and dni in self._pagos_por_socio:
+                # Sus pagos lo referencian ahora como socio retirado, que se guarda junto con ellos
+                self.marcar_modificada("pagos")
             del self._socios[dni]
+            self._notificar_cambio('socio_eliminado', {'dni': dni})
             return True
         return False
     
@@ -78,6 +136,7 @@ class ClubRegistry:
         if actividad.nombre.lower() in self._actividades:
             raise ValueError(f"Actividad '{actividad.nombre}' ya existe")
         self._actividades[actividad.nombre.lower()] = actividad
+        self._notificar_cambio('actividad_registrada', {'actividad': actividad})
     
     def obtener_actividad(self, nombre: str) -> Optional[Actividad]:
         """Obtiene una actividad por su nombre."""
@@ -91,6 +150,7 @@ class ClubRegistry:
         """Elimina una actividad del registro."""
         if nombre.lower() in self._actividades:
             del self._actividades[nombre.lower()]
+            self._notificar_cambio('actividad_eliminada', {'nombre': nombre})
             return True
         return False
     
@@ -101,6 +161,7 @@ class ClubRegistry:
         if profesor.dni in self._profesores:
             raise ValueError(f"Profesor con DNI {profesor.dni} ya existe")
         self._profesores[profesor.dni] = profesor
+        self._notificar_cambio('profesor_registrado', {'profesor': profesor})
     
     def obtener_profesor(self, dni: int) -> Optional[Profesor]:
         """Obtiene un profesor por su DNI."""
@@ -114,22 +175,180 @@ class ClubRegistry:
         """Elimina un profesor del registro."""
         if dni in self._profesores:
             del self._profesores[dni]
+            self._notificar_cambio('profesor_eliminado', {'dni': dni})
             return True
         return False
     
+    def modificar_sueldo_profesor(self, profesor: Profesor, sueldo: float):
+        """Modifica el sueldo de un profesor."""
+        profesor.sueldo = sueldo
+        self._notificar_cambio('sueldo_modificado', {'profesor': profesor})
+    
+    # --- Métodos de Relaciones ---
+    
+    def inscribir_socio(self, actividad: Actividad, socio: Socio):
+        """Vincula un socio y una actividad en ambos sentidos."""
+        actividad.inscribir_socio(socio)
+        socio.agregar_actividad(actividad)
+        self._notificar_cambio('socio_inscrito', {'actividad': actividad, 'socio': socio})
+    
+    def desinscribir_socio(self, actividad: Actividad, socio: Socio):
+        """Desvincula un socio y una actividad en ambos sentidos."""
+        actividad.desinscribir_socio(socio)
+        socio.eliminar_actividad(actividad)
+        self._notificar_cambio('socio_desinscrito', {'actividad': actividad, 'socio': socio})
+    
+    def asignar_profesor(self, actividad: Actividad, profesor: Profesor):
+        """Vincula un profesor y una actividad en ambos sentidos."""
+        actividad.agregar_profesor(profesor)
+        profesor.asignar_actividad(actividad)
+        self._notificar_cambio('profesor_asignado', {'actividad': actividad, 'profesor': profesor})
+    
+    def desasignar_profesor(self, actividad: Actividad, profesor: Profesor):
+        """Desvincula un profesor y una actividad en ambos sentidos."""
+        actividad.eliminar_profesor(profesor)
+        profesor.desasignar_actividad(actividad)
+        self._notificar_cambio('profesor_desasignado', {'actividad': actividad, 'profesor': profesor})
+    
+    def registrar_torneo(self, torneo: Torneo):
+        """Asocia un torneo a su actividad."""
+        torneo.actividad.agregar_torneo(torneo)
+        self._notificar_cambio('torneo_registrado', {'torneo': torneo})
+    
+    def inscribir_participante(self, torneo: Torneo, socio: Socio):
+        """Inscribe un socio como participante de un torneo."""
+        torneo.inscribir_participante(socio)
+        self._notificar_cambio('participante_inscrito', {'torneo': torneo, 'socio': socio})
+    
     # --- Métodos de Pagos ---
     
     def registrar_pago(self, pago: Pago):
-        """Registra un nuevo pago."""
+        """Registra un nuevo pago y lo agrega al índice por DNI."""
         self._pagos.append(pago)
+        if not self._usa_almacen_pagos():
+            self._pagos_por_socio.setdefault(pago.socio.dni, []).append(pago)
+            self._libro_pagos.agregar(pago)
+            self._recaudacion.registrar(pago)
+        self._notificar_cambio('pago_registrado', {'pago': pago})
+    
+    def actualizar_estado_pago(self, socio: Socio, estado: str):
+        """Actualiza el estado de pago de un socio."""
+        socio.estado_pago = estado
+        self._notificar_cambio('estado_pago_actualizado', {'socio': socio})
     
     def listar_pagos(self) -> List[Pago]:
         """Retorna la lista de todos los pagos."""
         return self._pagos
     
+    def iterar_filas_pagos(self) -> Iterator[tuple]:
+        """Recorre los pagos como tuplas (dni, monto, metodo, timestamp).
+
+        Con un almacén de pagos no se materializa ningún objeto Pago, lo que
+        permite recorrer historiales grandes con memoria constante.
+        """
+        if self._usa_almacen_pagos():
+            return self._pagos.filas()
+        return ((p.socio.dni, p.monto, p.metodo, p.fecha.timestamp()) for p in self._pagos)
+    
     def obtener_pagos_socio(self, dni: int) -> List[Pago]:
-        """Obtiene todos los pagos de un socio específico."""
-        return [p for p in self._pagos if p.socio.dni == dni]
+        """Obtiene todos los pagos de un socio específico usando el índice por DNI."""
+        if self._usa_almacen_pagos():
+            return self._pagos.pagos_socio(dni)
+        return list(self._pagos_por_socio.get(dni, []))
+    
+    def obtener_pagos_entre(self, desde: datetime, hasta: datetime) -> List[Pago]:
+        """Obtiene los pagos realizados entre dos fechas (inclusive)."""
+        return self._libro_pagos.entre(desde, hasta)
+    
+    def obtener_pagos_mes(self, anio: int, mes: int) -> List[Pago]:
+        """Obtiene los pagos realizados en un mes calendario."""
+        return self._libro_pagos.del_mes(anio, mes)
+    
+    def obtener_ultimos_pagos(self, cantidad: int) -> List[Pago]:
+        """Obtiene los últimos pagos en orden cronológico."""
+        return self._libro_pagos.ultimos(cantidad)
+    
+    def obtener_recaudacion(self) -> RecaudacionAcumulada:
+        """Obtiene los acumuladores de recaudación mantenidos incrementalmente."""
+        return self._recaudacion
+    
+    def usa_almacen_columnar(self) -> bool:
+        """Indica si los pagos se guardan en el almacén columnar."""
+        return isinstance(self._pagos, AlmacenPagosColumnar)
+    
+    def _usa_almacen_pagos(self) -> bool:
+        """Indica si los pagos están en un almacén (columnar o SQLite) en lugar de una lista.
+
+        Los almacenes resuelven por sí mismos las consultas por socio, por fecha
+        y los agregados de recaudación.
+        """
+        return not isinstance(self._pagos, list)
+    
+    def usar_almacen_columnar(self):
+        """Migra los pagos al almacén columnar.
+
+        Los pagos pasan a guardarse en arreglos tipados y se materializan como
+        objetos Pago solo al consultarlos. El almacén resuelve también las
+        consultas por fecha y los agregados de recaudación.
+        """
+        if self.usa_almacen_columnar():
+            return
+        almacen = AlmacenPagosColumnar()
+        for pago in self._pagos:
+            almacen.append(pago)
+            if pago.socio.dni not in self._socios:
+                almacen.retirar_socio(pago.socio)
+        self._pagos = almacen
+        self.reconstruir_indices()
+        self.marcar_modificada("pagos")
+        obtener_salida().info("Pagos migrados al almacén columnar")
+    
+    # --- Gestión de Índices ---
+    
+    def reconstruir_indices(self):
+        """Reconstruye los índices derivados a partir de las colecciones principales.
+
+        Se invoca luego de restaurar los datos desde disco, ya que los índices
+        no se persisten.
+        """
+        if self._usa_almacen_pagos():
+            self._pagos.asignar_resolver(self.obtener_socio)
+            self._pagos_por_socio = {}
+            self._libro_pagos = self._pagos
+            self._recaudacion = self._pagos
+            return
+        self._pagos_por_socio = {}
+        for pago in self._pagos:
+            self._pagos_por_socio.setdefault(pago.socio.dni, []).append(pago)
+        self._libro_pagos = LibroPagos(self._pagos)
+        self._recaudacion = RecaudacionAcumulada(self._pagos)
+    
+    # --- Seguimiento de Cambios ---
+    
+    def _notificar_cambio(self, evento: str, datos: dict):
+        """Avanza la generación de las colecciones afectadas y notifica el cambio."""
+        for coleccion in self._COLECCIONES_POR_EVENTO.get(evento, ()):
+            self._generaciones[coleccion] += 1
+        self.notificar_observadores(evento, datos)
+    
+    def obtener_generacion(self, coleccion: str) -> int:
+        """Retorna el contador de modificaciones de una colección."""
+        return self._generaciones[coleccion]
+    
+    def marcar_modificada(self, coleccion: str):
+        """Marca una colección como modificada (por ejemplo, tras cambiar una entidad directamente)."""
+        self._generaciones[coleccion] += 1
+    
+    def marcar_guardada(self, coleccion: str, generacion: Optional[int] = None):
+        """Registra que una colección fue guardada en la generación indicada (por defecto, la actual)."""
+        self._generaciones_guardadas[coleccion] = (
+            self._generaciones[coleccion] if generacion is None else generacion
+        )
+    
+    def colecciones_modificadas(self) -> List[str]:
+        """Retorna las colecciones modificadas desde que se guardaron por última vez."""
+        return [c for c in self.COLECCIONES
+                if self._generaciones[c] != self._generaciones_guardadas[c]]
     
     # --- Gestión de Estado ---
     
@@ -139,7 +358,9 @@ class ClubRegistry:
         self._actividades.clear()
         self._profesores.clear()
         self._pagos.clear()
-        print("[INFO] ClubRegistry reiniciado")
+        self.reconstruir_indices()
+        self._notificar_cambio('registro_reiniciado', {})
+        obtener_salida().info("ClubRegistry reiniciado")
     
     def __str__(self) -> str:
         return ("ClubRegistry - Estado actual:\n"
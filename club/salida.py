@@ -0,0 +1,211 @@
+"""
+Salida configurable para servicios y observadores del club.
+Centraliza los mensajes del sistema con niveles y destinos intercambiables
+(consola, nula, archivo con buffer o JSON Lines).
+"""
+
+# Standard library imports
+import json
+import sys
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional, TextIO
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+NOMBRES_NIVEL = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+
+class Salida(ABC):
+    """
+    Interfaz base de los destinos de salida.
+    Los mensajes con nivel inferior al mínimo se descartan sin formatearse.
+    """
+    
+    def __init__(self, nivel_minimo: int = INFO):
+        """Inicializa la salida.
+        
+        Args:
+            nivel_minimo: Nivel a partir del cual se emiten los mensajes.
+        """
+        self._nivel_minimo = nivel_minimo
+    
+    @property
+    def nivel_minimo(self) -> int:
+        return self._nivel_minimo
+    
+    @nivel_minimo.setter
+    def nivel_minimo(self, valor: int):
+        self._nivel_minimo = valor
+    
+    def habilitado(self, nivel: int = INFO) -> bool:
+        """Indica si un mensaje del nivel dado sería emitido.
+        
+        Permite evitar el armado de mensajes costosos cuando la salida está apagada.
+        """
+        return nivel >= self._nivel_minimo
+    
+    def debug(self, mensaje: str, **datos):
+        if DEBUG >= self._nivel_minimo:
+            self._emitir(DEBUG, mensaje, True, datos)
+    
+    def info(self, mensaje: str, **datos):
+        if INFO >= self._nivel_minimo:
+            self._emitir(INFO, mensaje, True, datos)
+    
+    def warning(self, mensaje: str, **datos):
+        if WARNING >= self._nivel_minimo:
+            self._emitir(WARNING, mensaje, True, datos)
+    
+    def error(self, mensaje: str, **datos):
+        if ERROR >= self._nivel_minimo:
+            self._emitir(ERROR, mensaje, True, datos)
+    
+    def mostrar(self, texto: str, nivel: int = INFO, **datos):
+        """Emite texto de presentación (reportes, fichas, avisos) sin prefijo de nivel."""
+        if nivel >= self._nivel_minimo:
+            self._emitir(nivel, texto, False, datos)
+    
+    @abstractmethod
+    def _emitir(self, nivel: int, mensaje: str, con_prefijo: bool, datos: dict):
+        """Escribe un mensaje ya filtrado por nivel en el destino concreto."""
+        pass
+    
+    def flush(self):
+        """Vuelca los mensajes pendientes al destino."""
+        pass
+    
+    def cerrar(self):
+        """Libera los recursos del destino."""
+        self.flush()
+    
+    @staticmethod
+    def _formatear(nivel: int, mensaje: str, con_prefijo: bool) -> str:
+        if con_prefijo:
+            return f"[{NOMBRES_NIVEL.get(nivel, nivel)}] {mensaje}"
+        return mensaje
+
+
+class SalidaConsola(Salida):
+    """Escribe los mensajes en la salida estándar (comportamiento por defecto)."""
+    
+    def _emitir(self, nivel: int, mensaje: str, con_prefijo: bool, datos: dict):
+        print(self._formatear(nivel, mensaje, con_prefijo))
+
+
+class SalidaNula(Salida):
+    """Descarta todos los mensajes, para ejecuciones sin consola."""
+    
+    def __init__(self):
+        super().__init__(nivel_minimo=ERROR + 1)
+    
+    def habilitado(self, nivel: int = INFO) -> bool:
+        return False
+    
+    def _emitir(self, nivel: int, mensaje: str, con_prefijo: bool, datos: dict):
+        pass
+
+
+class SalidaArchivo(Salida):
+    """
+    Escribe los mensajes en un archivo de texto a través de un buffer,
+    volcándolo al disco cuando se llena o al llamar a flush().
+    """
+    
+    def __init__(self, ruta: str, nivel_minimo: int = INFO, tamano_buffer: int = 1024 * 1024):
+        """Inicializa la salida a archivo.
+        
+        Args:
+            ruta: Ruta del archivo (se agregan líneas al final).
+            nivel_minimo: Nivel a partir del cual se emiten los mensajes.
+            tamano_buffer: Tamaño del buffer de escritura en bytes.
+        """
+        super().__init__(nivel_minimo)
+        self._archivo: TextIO = open(ruta, "a", encoding="utf-8", buffering=tamano_buffer)
+        self._lock = threading.Lock()
+    
+    def _emitir(self, nivel: int, mensaje: str, con_prefijo: bool, datos: dict):
+        with self._lock:
+            self._archivo.write(self._formatear(nivel, mensaje, con_prefijo) + "\n")
+    
+    def flush(self):
+        with self._lock:
+            if not self._archivo.closed:
+                self._archivo.flush()
+    
+    def cerrar(self):
+        with self._lock:
+            self._archivo.close()
+
+
+class SalidaJSONL(Salida):
+    """
+    Escribe cada mensaje como un objeto JSON por línea, incluyendo el nivel,
+    la fecha y los datos estructurados recibidos como argumentos con nombre.
+    """
+    
+    def __init__(self, destino: Optional[TextIO] = None, ruta: Optional[str] = None,
+                 nivel_minimo: int = INFO, tamano_buffer: int = 1024 * 1024):
+        """Inicializa la salida estructurada.
+        
+        Args:
+            destino: Stream de texto donde escribir (por defecto, stdout).
+            ruta: Ruta de un archivo a usar en lugar de `destino`.
+            nivel_minimo: Nivel a partir del cual se emiten los mensajes.
+            tamano_buffer: Tamaño del buffer de escritura cuando se usa `ruta`.
+        """
+        super().__init__(nivel_minimo)
+        self._propio = ruta is not None
+        if self._propio:
+            self._destino = open(ruta, "a", encoding="utf-8", buffering=tamano_buffer)
+        else:
+            self._destino = destino if destino is not None else sys.stdout
+        self._lock = threading.Lock()
+    
+    def _emitir(self, nivel: int, mensaje: str, con_prefijo: bool, datos: dict):
+        registro = {
+            "fecha": datetime.now().isoformat(),
+            "nivel": NOMBRES_NIVEL.get(nivel, nivel),
+            "mensaje": mensaje,
+        }
+        registro.update(datos)
+        linea = json.dumps(registro, ensure_ascii=False, default=str)
+        with self._lock:
+            self._destino.write(linea + "\n")
+    
+    def flush(self):
+        with self._lock:
+            if not self._destino.closed:
+                self._destino.flush()
+    
+    def cerrar(self):
+        with self._lock:
+            if self._propio:
+                self._destino.close()
+            elif not self._destino.closed:
+                self._destino.flush()
+
+
+_salida_actual: Salida = SalidaConsola()
+
+
+def obtener_salida() -> Salida:
+    """Retorna la salida configurada para todo el sistema."""
+    return _salida_actual
+
+
+def configurar_salida(salida: Salida) -> Salida:
+    """Reemplaza la salida del sistema y retorna la anterior.
+    
+    La salida anterior se vuelca (flush) pero no se cierra, para que el
+    llamador decida si debe reutilizarla.
+    """
+    global _salida_actual
+    anterior = _salida_actual
+    anterior.flush()
+    _salida_actual = salida
+    return anterior
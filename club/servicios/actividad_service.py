@@ -4,10 +4,12 @@ Encapsula la lógica de negocio relacionada con actividades deportivas.
 """
 
 # Standard library imports
+import time
 from typing import List, Optional
 from datetime import datetime
 
 # Local application imports
+from club.salida import obtener_salida
 from club.entidades.actividad import Actividad
 from club.entidades.socio import Socio
 from club.entidades.profesor import Profesor
@@ -18,6 +20,7 @@ from club.excepciones import (
 )
 from club.patrones.factory.actividad_factory import ActividadFactory
 from club.patrones.singleton.club_registry import ClubRegistry
+from club.patrones.observer.despachador import DespachadorEventos
 from club.patrones.observer.notificador_torneo import NotificadorTorneo
 
 
@@ -26,9 +29,18 @@ class ActividadService:
     Servicio para operaciones CRUD y lógica de negocio de actividades.
     """
     
-    def __init__(self):
+    def __init__(self, despachador: Optional[DespachadorEventos] = None,
+                 tamano_lote_torneos: int = NotificadorTorneo.TAMANO_LOTE):
+        """Inicializa el servicio.
+        
+        Args:
+            despachador: Si se indica, las actividades creadas entregan sus
+                notificaciones en segundo plano.
+            tamano_lote_torneos: Socios por mensaje en los anuncios de torneos.
+        """
         self._registry = ClubRegistry.get_instance()
-        self._notificador_torneo = NotificadorTorneo()
+        self._notificador_torneo = NotificadorTorneo(tamano_lote=tamano_lote_torneos)
+        self._despachador = despachador
     
     def crear_actividad(self, nombre: str, costo: Optional[float] = None, 
                        capacidad: Optional[int] = None) -> Optional[Actividad]:
@@ -36,13 +48,23 @@ class ActividadService:
         try:
             actividad = ActividadFactory.crear_actividad(nombre, costo, capacidad)
             self.registrar_actividad(actividad)
-            actividad.agregar_observador(self._notificador_torneo)
-            print(f"Actividad '{actividad.nombre}' registrada exitosamente")
+            self._preparar_actividad(actividad)
+            obtener_salida().mostrar(f"Actividad '{actividad.nombre}' registrada exitosamente")
             return actividad
         except (ValueError, ActividadYaExisteError) as e:
-            print(f"[ERROR] No se pudo crear la actividad: {e}")
+            obtener_salida().error(f"No se pudo crear la actividad: {e}")
             return None
     
+    def _preparar_actividad(self, actividad: Actividad):
+        """Suscribe el notificador de torneos y configura el despachador del servicio.
+        
+        Las actividades restauradas desde disco no conservan sus observadores,
+        así que se preparan también al obtenerlas del registry.
+        """
+        actividad.agregar_observador(self._notificador_torneo)
+        if self._despachador is not None:
+            actividad.configurar_despachador(self._despachador)
+    
     def registrar_actividad(self, actividad: Actividad):
         """Registra una actividad en el sistema."""
         try:
@@ -55,6 +77,7 @@ class ActividadService:
         actividad = self._registry.obtener_actividad(nombre)
         if actividad is None:
             raise ActividadNoEncontradaError(f"No se encontró la actividad '{nombre}'")
+        self._preparar_actividad(actividad)
         return actividad
 
     def eliminar_actividad(self, nombre: str) -> bool:
@@ -66,97 +89,120 @@ class ActividadService:
             for profesor in actividad.profesores:
                 profesor.desasignar_actividad(actividad)
             if self._registry.eliminar_actividad(nombre):
-                print(f"[INFO] Actividad '{nombre}' eliminada del sistema")
+                obtener_salida().info(f"Actividad '{nombre}' eliminada del sistema")
                 return True
             return False
         except ActividadNoEncontradaError as e:
-            print(f"[ERROR] {e}")
+            obtener_salida().error(str(e))
             return False
 
     def inscribir_socio(self, actividad: Actividad, socio: Socio):
         """Inscribe un socio en una actividad."""
-        if len(actividad.socios) >= actividad.capacidad:
+        if actividad.cantidad_socios() >= actividad.capacidad:
             raise CapacidadAlcanzadaError(f"Actividad {actividad.nombre} ha alcanzado su capacidad máxima")
-        if socio in actividad.socios:
+        if actividad.tiene_socio(socio):
             raise InscripcionError(f"Socio {socio.nombre} ya está inscrito en {actividad.nombre}")
-        actividad.inscribir_socio(socio)
-        socio.agregar_actividad(actividad)
-        print(f"Socio {socio.nombre} inscrito en {actividad.nombre}")
+        self._registry.inscribir_socio(actividad, socio)
+        obtener_salida().mostrar(f"Socio {socio.nombre} inscrito en {actividad.nombre}")
 
     def desinscribir_socio(self, actividad: Actividad, socio: Socio):
         """Desinscribe un socio de una actividad."""
-        if socio not in actividad.socios:
+        if not actividad.tiene_socio(socio):
             raise InscripcionError(f"Socio {socio.nombre} no está inscrito en {actividad.nombre}")
-        actividad.desinscribir_socio(socio)
-        socio.eliminar_actividad(actividad)
-        print(f"[INFO] Socio {socio.nombre} desinscrito de {actividad.nombre}")
+        self._registry.desinscribir_socio(actividad, socio)
+        obtener_salida().info(f"Socio {socio.nombre} desinscrito de {actividad.nombre}")
     
     def asignar_profesor(self, actividad: Actividad, profesor: Profesor):
         """Asigna un profesor a una actividad."""
-        if profesor in actividad.profesores:
-            print(f"Profesor {profesor.nombre} ya esta asignado a la actividad {actividad.nombre}")
+        if actividad.tiene_profesor(profesor):
+            obtener_salida().mostrar(f"Profesor {profesor.nombre} ya esta asignado a la actividad {actividad.nombre}")
             return
-        actividad.agregar_profesor(profesor)
-        profesor.asignar_actividad(actividad)
-        print(f"Profesor {profesor.nombre} asignado a {actividad.nombre}")
+        self._registry.asignar_profesor(actividad, profesor)
+        obtener_salida().mostrar(f"Profesor {profesor.nombre} asignado a {actividad.nombre}")
 
     def desasignar_profesor(self, actividad: Actividad, profesor: Profesor):
         """Desasigna un profesor de una actividad."""
-        if profesor not in actividad.profesores:
-            print(f"Profesor {profesor.nombre} no se encuentra asignado a la actividad {actividad.nombre}")
+        if not actividad.tiene_profesor(profesor):
+            obtener_salida().mostrar(f"Profesor {profesor.nombre} no se encuentra asignado a la actividad {actividad.nombre}")
             return
-        actividad.eliminar_profesor(profesor)
-        profesor.desasignar_actividad(actividad)
-        print(f"[INFO] Profesor {profesor.nombre} desasignado de {actividad.nombre}")
+        self._registry.desasignar_profesor(actividad, profesor)
+        obtener_salida().info(f"Profesor {profesor.nombre} desasignado de {actividad.nombre}")
     
     def crear_torneo(self, actividad: Actividad, nombre_torneo: str, 
                     fecha: str = None, costo_inscripcion: float = 0) -> Optional[Torneo]:
-        """Crea un torneo, lo asocia a una actividad y notifica a los observadores."""
+        """Crea un torneo, lo asocia a una actividad y notifica a los observadores.
+        
+        El anuncio a los socios se envía en segundo plano, así que el método
+        retorna sin esperarlo (ver esperar_notificaciones).
+        """
         if fecha is None:
             fecha = datetime.now().strftime("%Y-%m-%d")
+        self._preparar_actividad(actividad)
         torneo = Torneo(nombre_torneo, actividad, fecha, costo_inscripcion)
-        actividad.agregar_torneo(torneo)
+        self._registry.registrar_torneo(torneo)
         datos_evento = {
             'torneo': nombre_torneo,
             'actividad': actividad.nombre,
             'fecha': fecha,
             'costo': costo_inscripcion,
-            'socios': actividad.socios
+            # Copia de referencias en una sola operación: el evento puede
+            # entregarse en segundo plano mientras la actividad sigue cambiando
+            'socios': tuple(actividad.socios)
         }
         actividad.notificar_observadores('nuevo_torneo', datos_evento)
-        print(f"[INFO] Torneo '{nombre_torneo}' creado para {actividad.nombre}")
+        obtener_salida().info(f"Torneo '{nombre_torneo}' creado para {actividad.nombre}")
         return torneo
+    
+    def esperar_notificaciones(self, timeout: Optional[float] = None) -> bool:
+        """Espera a que terminen los anuncios de torneos en curso.
+        
+        Primero se entregan los eventos encolados en el despachador del
+        servicio, que son los que programan los anuncios.
+        
+        Args:
+            timeout: Segundos máximos de espera (por defecto, sin límite).
+        
+        Returns:
+            True si no quedan anuncios pendientes.
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+        if self._despachador is not None and not self._despachador.flush(timeout):
+            return False
+        restante = None if limite is None else max(0.0, limite - time.monotonic())
+        return NotificadorTorneo.esperar(restante)
 
     def inscribir_socio_torneo(self, torneo: Torneo, socio: Socio):
         """Inscribe un socio en un torneo con validaciones."""
-        if socio not in torneo.actividad.socios:
+        if not torneo.actividad.tiene_socio(socio):
             raise InscripcionError(f"{socio.nombre} no está inscrito en la actividad {torneo.actividad.nombre} del torneo.")
-        if socio in torneo.participantes:
+        if torneo.tiene_participante(socio):
             raise InscripcionError(f"{socio.nombre} ya está inscrito en el torneo '{torneo.nombre}'")
-        torneo.inscribir_participante(socio)
-        print(f"{socio.nombre} inscrito en torneo '{torneo.nombre}'")
+        self._registry.inscribir_participante(torneo, socio)
+        obtener_salida().mostrar(f"{socio.nombre} inscrito en torneo '{torneo.nombre}'")
 
     def mostrar_info_actividad(self, nombre: str):
         """Muestra información completa de una actividad."""
         try:
             actividad = self.obtener_actividad(nombre)
-            print("\n" + "="*60)
-            print(str(actividad))
-            print(f"\nSocios inscritos ({len(actividad.socios)}):")
-            if not actividad.socios:
-                print("  No hay socios inscritos.")
+            salida = obtener_salida()
+            if not salida.habilitado():
+                return
+            socios = actividad.socios
+            torneos = actividad.torneos
+            lineas = ["\n" + "="*60, str(actividad), f"\nSocios inscritos ({len(socios)}):"]
+            if not socios:
+                lineas.append("  No hay socios inscritos.")
             else:
-                for socio in actividad.socios:
-                    print(f"  • {socio.nombre} ({socio.get_tipo()})")
-            print(f"\nTorneos organizados ({len(actividad.torneos)}):")
-            if not actividad.torneos:
-                print("  No hay torneos organizados.")
+                lineas.extend(f"  • {socio.nombre} ({socio.get_tipo()})" for socio in socios)
+            lineas.append(f"\nTorneos organizados ({len(torneos)}):")
+            if not torneos:
+                lineas.append("  No hay torneos organizados.")
             else:
-                for torneo in actividad.torneos:
-                    print(f"  • {torneo.nombre} - {torneo.fecha}")
-            print("="*60 + "\n")
+                lineas.extend(f"  • {torneo.nombre} - {torneo.fecha}" for torneo in torneos)
+            lineas.append("="*60 + "\n")
+            salida.mostrar("\n".join(lineas))
         except ActividadNoEncontradaError as e:
-            print(f"[ERROR] {e}")
+            obtener_salida().error(str(e))
     
     def listar_actividades_disponibles(self) -> List[str]:
         """Lista las actividades predefinidas disponibles para crear."""
@@ -0,0 +1,136 @@
+"""
+Buffers fuera de banda del protocolo 5 de pickle.
+Las columnas numéricas grandes se escriben en un archivo aparte, alineadas,
+y al cargar se leen como vistas de ese archivo mapeado en memoria, sin copiar
+sus bytes al flujo de pickle ni al leerlo.
+"""
+
+# Standard library imports
+import glob
+import mmap
+import os
+import pickle
+import struct
+import uuid
+from typing import BinaryIO, Iterator, List, Optional
+
+
+class ArchivoBuffers:
+    """
+    Archivo de buffers asociado a un archivo .dat.
+    
+    El .dat empieza con una cabecera (un diccionario serializado aparte) que
+    nombra el archivo de buffers; luego viene el contenido serializado con el
+    protocolo 5, donde cada buffer grande se reemplaza por una referencia al
+    siguiente buffer del archivo. Si el contenido no tenía buffers grandes, el
+    archivo nombrado no existe y al cargar no se lo busca.
+    
+    Estructura del archivo de buffers:
+        datos de cada buffer, alineados a ALINEACION bytes
+        índice: (desplazamiento, longitud) uint64 por buffer
+        pie: MAGIA y cantidad de buffers
+    """
+    
+    FORMATO = "club-buffers"
+    VERSION = 1
+    MAGIA = b"CLUBBUF\0"
+    ALINEACION = 64
+    # Los buffers más chicos no justifican un archivo aparte y van dentro del pickle
+    UMBRAL_FUERA_DE_BANDA = 64 * 1024
+    
+    _PIE = struct.Struct("<8sQ")
+    _ENTRADA = struct.Struct("<QQ")
+    
+    # --- Escritura ---
+    
+    @classmethod
+    def volcar(cls, contenido, archivo: BinaryIO, ruta_datos: str) -> Optional[str]:
+        """Serializa un contenido enviando sus buffers grandes a un archivo aparte.
+        
+        El archivo de buffers se escribe y se renombra antes de que termine la
+        escritura del .dat, con un nombre único, así que un .dat siempre
+        encuentra los buffers con los que se escribió.
+        
+        Args:
+            contenido: Objeto a serializar.
+            archivo: Archivo (temporal) del .dat, abierto para escritura.
+            ruta_datos: Ruta definitiva del .dat, de la que se deriva la de los buffers.
+        
+        Returns:
+            La ruta del archivo de buffers, o None si no hubo buffers grandes.
+        """
+        ruta = f"{ruta_datos}.{uuid.uuid4().hex[:12]}.buf"
+        pickle.dump({"formato": cls.FORMATO, "version": cls.VERSION, "archivo": os.path.basename(ruta)},
+                    archivo, protocol=5)
+        temporal = ruta + ".tmp"
+        entradas = []
+        try:
+            with open(temporal, "wb") as destino:
+                def fuera_de_banda(buffer: pickle.PickleBuffer) -> bool:
+                    datos = buffer.raw()
+                    if datos.nbytes < cls.UMBRAL_FUERA_DE_BANDA:
+                        return True
+                    relleno = -destino.tell() % cls.ALINEACION
+                    destino.write(b"\0" * relleno)
+                    entradas.append((destino.tell(), datos.nbytes))
+                    destino.write(datos)
+                    return False
+                
+                pickle.dump(contenido, archivo, protocol=5, buffer_callback=fuera_de_banda)
+                for entrada in entradas:
+                    destino.write(cls._ENTRADA.pack(*entrada))
+                destino.write(cls._PIE.pack(cls.MAGIA, len(entradas)))
+                destino.flush()
+                os.fsync(destino.fileno())
+        except BaseException:
+            os.remove(temporal)
+            raise
+        if not entradas:
+            os.remove(temporal)
+            return None
+        os.replace(temporal, ruta)
+        return ruta
+    
+    @staticmethod
+    def limpiar(ruta_datos: str, vigente: Optional[str] = None):
+        """Elimina los archivos de buffers de un .dat salvo el vigente."""
+        for ruta in glob.glob(glob.escape(ruta_datos) + ".*.buf"):
+            if ruta != vigente:
+                try:
+                    os.remove(ruta)
+                except OSError:
+                    # Puede seguir mapeado por otro proceso (o en Windows)
+                    pass
+    
+    # --- Lectura ---
+    
+    @classmethod
+    def es_cabecera(cls, datos) -> bool:
+        """Indica si el primer objeto de un .dat es la cabecera de buffers externos."""
+        return isinstance(datos, dict) and datos.get("formato") == cls.FORMATO
+    
+    @classmethod
+    def cargar(cls, origen: BinaryIO, cabecera: dict, directorio: str):
+        """Deserializa el contenido que sigue a la cabecera, mapeando sus buffers.
+        
+        El archivo de buffers se abre solo si el contenido referencia alguno.
+        """
+        return pickle.load(origen, buffers=cls._buffers(os.path.join(directorio, cabecera["archivo"])))
+    
+    @classmethod
+    def _buffers(cls, ruta: str) -> Iterator[memoryview]:
+        yield from cls.leer(ruta)
+    
+    @classmethod
+    def leer(cls, ruta: str) -> List[memoryview]:
+        """Mapea un archivo de buffers y retorna una vista de solo lectura de cada uno."""
+        with open(ruta, "rb") as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        vista = memoryview(mapa)
+        magia, cantidad = cls._PIE.unpack_from(vista, len(vista) - cls._PIE.size)
+        if magia != cls.MAGIA:
+            raise ValueError(f"'{ruta}' no es un archivo de buffers del club")
+        inicio_indice = len(vista) - cls._PIE.size - cantidad * cls._ENTRADA.size
+        return [vista[desplazamiento:desplazamiento + longitud]
+                for desplazamiento, longitud in cls._ENTRADA.iter_unpack(
+                    vista[inicio_indice:len(vista) - cls._PIE.size])]
@@ -0,0 +1,98 @@
+"""
+Códecs de compresión para los archivos de datos.
+Envuelven un archivo binario abierto para comprimir al escribir y descomprimir
+al leer en streaming, con los módulos de la biblioteca estándar.
+"""
+
+# Standard library imports
+import bz2
+import gzip
+import lzma
+import zlib
+from typing import BinaryIO, Dict
+
+SIN_COMPRESION = "none"
+ZLIB = "zlib"
+BZ2 = "bz2"
+LZMA = "lzma"
+
+CODECS = (SIN_COMPRESION, ZLIB, BZ2, LZMA)
+
+# Firma con la que empieza el contenido de cada códec, para detectarlo al leer
+_FIRMAS: Dict[str, bytes] = {
+    ZLIB: b"\x1f\x8b",
+    BZ2: b"BZh",
+    LZMA: b"\xfd7zXZ\x00",
+}
+
+_LONGITUD_FIRMA = max(len(firma) for firma in _FIRMAS.values())
+
+# Errores de un flujo comprimido corrupto o truncado, además de los de E/S:
+# gzip informa los datos deflate inválidos con zlib.error y bz2 con OSError
+ERRORES_LECTURA = (OSError, EOFError, zlib.error, lzma.LZMAError)
+
+
+def validar_codec(codec: str) -> str:
+    """Retorna el códec si es conocido; si no, lanza ValueError."""
+    if codec not in CODECS:
+        raise ValueError(f"Códec de compresión desconocido: '{codec}' (disponibles: {', '.join(CODECS)})")
+    return codec
+
+
+def abrir_escritura(archivo: BinaryIO, codec: str) -> BinaryIO:
+    """Envuelve un archivo abierto para escritura con el compresor del códec.
+    
+    El objeto retornado debe cerrarse para volcar el final del flujo
+    comprimido; cerrarlo no cierra el archivo subyacente.
+    
+    Args:
+        archivo: Archivo binario abierto para escritura.
+        codec: 'none', 'zlib' (deflate con encabezado gzip), 'bz2' o 'lzma'.
+    """
+    validar_codec(codec)
+    if codec == ZLIB:
+        # Nivel 6, el predeterminado de zlib: el 9 de gzip es mucho más lento y casi no reduce
+        return gzip.GzipFile(fileobj=archivo, mode="wb", compresslevel=6, mtime=0)
+    if codec == BZ2:
+        return bz2.BZ2File(archivo, "wb")
+    if codec == LZMA:
+        return lzma.LZMAFile(archivo, "wb")
+    return _SinCerrar(archivo)
+
+
+def abrir_lectura(archivo: BinaryIO) -> BinaryIO:
+    """Envuelve un archivo abierto para lectura con el descompresor que corresponda.
+    
+    El códec se detecta por la firma del contenido, así que los archivos se
+    leen igual aunque se hayan escrito con otro códec o sin comprimir.
+    
+    Args:
+        archivo: Archivo binario abierto para lectura, con soporte de peek().
+    """
+    inicio = archivo.peek(_LONGITUD_FIRMA)[:_LONGITUD_FIRMA]
+    if inicio.startswith(_FIRMAS[ZLIB]):
+        return gzip.GzipFile(fileobj=archivo, mode="rb")
+    if inicio.startswith(_FIRMAS[BZ2]):
+        return bz2.BZ2File(archivo, "rb")
+    if inicio.startswith(_FIRMAS[LZMA]):
+        return lzma.LZMAFile(archivo, "rb")
+    return _SinCerrar(archivo)
+
+
+class _SinCerrar:
+    """Archivo sin compresión cuyo close() no cierra el archivo subyacente."""
+    
+    def __init__(self, archivo: BinaryIO):
+        self._archivo = archivo
+    
+    def __getattr__(self, nombre: str):
+        return getattr(self._archivo, nombre)
+    
+    def close(self):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        self.close()
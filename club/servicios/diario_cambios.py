@@ -0,0 +1,294 @@
+"""
+Diario de cambios (write-ahead log) del ClubRegistry.
+Registra cada modificación del registro como una línea compacta en un archivo
+de solo agregado, para que guardar cueste en proporción a lo que cambió.
+"""
+
+# Standard library imports
+import json
+import os
+import threading
+from datetime import datetime
+from typing import List, Optional
+
+# Local application imports
+from club.entidades.actividad import Actividad
+from club.entidades.pago import Pago
+from club.entidades.profesor import Profesor
+from club.entidades.torneo import Torneo
+from club.patrones.factory.socio_factory import SocioFactory
+from club.patrones.observer.observer import Observer
+from club.salida import obtener_salida
+
+
+class DiarioCambios(Observer):
+    """
+    Observador del ClubRegistry que escribe cada cambio en un diario.
+
+    Cada registro es una lista JSON [secuencia, operación, argumentos...].
+    Los registros se acumulan en memoria y se escriben con un único fsync
+    por grupo (commit en grupo). El punto de control guarda la última
+    secuencia incluida en la instantánea completa, de modo que al reproducir
+    el diario se omiten los registros ya persistidos.
+    """
+
+    ARCHIVO = "diario.log"
+    ARCHIVO_PUNTO_CONTROL = "diario.ckpt"
+
+    def __init__(self, directorio: str, tamano_grupo: int = 32):
+        """Inicializa el diario.
+
+        Args:
+            directorio: Directorio donde se guardan el diario y el punto de control.
+            tamano_grupo: Cantidad de registros pendientes que dispara un fsync.
+        """
+        self._directorio = directorio
+        self._tamano_grupo = tamano_grupo
+        self._ruta = os.path.join(directorio, self.ARCHIVO)
+        self._ruta_punto_control = os.path.join(directorio, self.ARCHIVO_PUNTO_CONTROL)
+        self._pendientes: List[str] = []
+        self._archivo = None
+        self._secuencia = self._leer_punto_control()
+        self._registros = 0
+        # Los guardados en segundo plano marcan el punto de control desde otro hilo
+        self._lock = threading.RLock()
+    
+    @property
+    def secuencia(self) -> int:
+        """Número de secuencia del último registro agregado."""
+        return self._secuencia
+
+    # --- Escritura ---
+
+    def actualizar(self, evento: str, datos: dict):
+        """Codifica un cambio del registry y lo agrega al diario."""
+        registro = self.codificar(evento, datos)
+        if registro is None:
+            return
+        with self._lock:
+            self._secuencia += 1
+            self._registros += 1
+            self._pendientes.append(json.dumps([self._secuencia, *registro], ensure_ascii=False))
+            if len(self._pendientes) >= self._tamano_grupo:
+                self.sincronizar()
+
+    def sincronizar(self):
+        """Escribe los registros pendientes y los fuerza a disco con un único fsync."""
+        with self._lock:
+            if not self._pendientes:
+                return
+            if self._archivo is None:
+                os.makedirs(self._directorio, exist_ok=True)
+                self._archivo = open(self._ruta, "a", encoding="utf-8")
+            self._archivo.write("\n".join(self._pendientes) + "\n")
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+            self._pendientes.clear()
+
+    def cantidad_registros(self) -> int:
+        """Retorna la cantidad de registros escritos desde el último punto de control."""
+        return self._registros
+
+    def marcar_punto_control(self, secuencia: Optional[int] = None):
+        """Registra que la instantánea completa incluye los cambios hasta una secuencia.
+
+        Si la instantánea incluye todos los cambios, el diario se vacía. Si se
+        tomó antes de los últimos registros (guardado en segundo plano), el
+        diario se conserva y al reproducirlo se omiten los ya incluidos.
+
+        Args:
+            secuencia: Último registro incluido en la instantánea (por defecto, el actual).
+        """
+        with self._lock:
+            if secuencia is None:
+                secuencia = self._secuencia
+            self.sincronizar()
+            os.makedirs(self._directorio, exist_ok=True)
+            temporal = self._ruta_punto_control + ".tmp"
+            with open(temporal, "w", encoding="utf-8") as f:
+                f.write(str(secuencia))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporal, self._ruta_punto_control)
+            if secuencia < self._secuencia:
+                self._registros = self._secuencia - secuencia
+                return
+            self.cerrar()
+            with open(self._ruta, "w", encoding="utf-8") as f:
+                os.fsync(f.fileno())
+            self._registros = 0
+
+    def cerrar(self):
+        """Sincroniza los pendientes y cierra el archivo del diario."""
+        with self._lock:
+            self.sincronizar()
+            if self._archivo is not None:
+                self._archivo.close()
+                self._archivo = None
+
+    def _leer_punto_control(self) -> int:
+        try:
+            with open(self._ruta_punto_control, encoding="utf-8") as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    # --- Codificación ---
+
+    @staticmethod
+    def codificar(evento: str, datos: dict) -> Optional[list]:
+        """Convierte un evento del registry en un registro compacto."""
+        if evento == 'socio_registrado':
+            socio = datos['socio']
+            return ["socio+", socio.get_tipo().lower(), socio.nombre, socio.dni,
+                    getattr(socio, 'edad', None), socio.fecha_registro.timestamp(), socio.estado_pago]
+        if evento == 'socio_eliminado':
+            return ["socio-", datos['dni']]
+        if evento == 'actividad_registrada':
+            actividad = datos['actividad']
+            return ["actividad+", actividad.nombre, actividad.costo, actividad.capacidad]
+        if evento == 'actividad_eliminada':
+            return ["actividad-", datos['nombre']]
+        if evento == 'profesor_registrado':
+            profesor = datos['profesor']
+            return ["profesor+", profesor.nombre, profesor.dni, profesor.sueldo]
+        if evento == 'profesor_eliminado':
+            return ["profesor-", datos['dni']]
+        if evento == 'sueldo_modificado':
+            profesor = datos['profesor']
+            return ["sueldo", profesor.dni, profesor.sueldo]
+        if evento == 'socio_inscrito':
+            return ["inscripcion", datos['actividad'].nombre, datos['socio'].dni]
+        if evento == 'socio_desinscrito':
+            return ["desinscripcion", datos['actividad'].nombre, datos['socio'].dni]
+        if evento == 'profesor_asignado':
+            return ["asignacion", datos['actividad'].nombre, datos['profesor'].dni]
+        if evento == 'profesor_desasignado':
+            return ["desasignacion", datos['actividad'].nombre, datos['profesor'].dni]
+        if evento == 'torneo_registrado':
+            torneo = datos['torneo']
+            return ["torneo", torneo.actividad.nombre, torneo.nombre, torneo.fecha,
+                    torneo.costo_inscripcion, torneo._fecha_creacion.timestamp()]
+        if evento == 'participante_inscrito':
+            torneo = datos['torneo']
+            return ["participante", torneo.actividad.nombre, torneo.nombre, datos['socio'].dni]
+        if evento == 'pago_registrado':
+            pago = datos['pago']
+            return ["pago", pago.socio.dni, pago.monto, pago.metodo, pago.fecha.timestamp()]
+        if evento == 'estado_pago_actualizado':
+            socio = datos['socio']
+            return ["estado_pago", socio.dni, socio.estado_pago]
+        if evento == 'registro_reiniciado':
+            return ["reinicio"]
+        return None
+
+    # --- Reproducción ---
+
+    def reproducir(self, registry: 'ClubRegistry') -> int:
+        """Aplica sobre el registry los registros posteriores al último punto de control.
+
+        El diario no debe estar suscripto al registry durante la reproducción.
+        Una última línea incompleta (escritura interrumpida) se descarta.
+
+        Returns:
+            La cantidad de registros aplicados.
+        """
+        self.cerrar()
+        punto_control = self._leer_punto_control()
+        aplicados = 0
+        self._registros = 0
+        if not os.path.exists(self._ruta):
+            return 0
+        with open(self._ruta, encoding="utf-8") as f:
+            for linea in f:
+                try:
+                    secuencia, operacion, *argumentos = json.loads(linea)
+                except ValueError:
+                    obtener_salida().warning("Registro incompleto al final del diario descartado")
+                    break
+                self._secuencia = max(self._secuencia, secuencia)
+                self._registros += 1
+                if secuencia <= punto_control:
+                    continue
+                try:
+                    self._aplicar(registry, operacion, argumentos)
+                    aplicados += 1
+                except (KeyError, ValueError, StopIteration) as e:
+                    obtener_salida().warning(f"No se pudo aplicar el registro {secuencia} ({operacion}): {e}")
+        return aplicados
+
+    @staticmethod
+    def _requerir(entidad, descripcion: str):
+        """Valida que una entidad referenciada por el diario exista en el registry."""
+        if entidad is None:
+            raise KeyError(f"{descripcion} no encontrado")
+        return entidad
+    
+    @classmethod
+    def _aplicar(cls, registry: 'ClubRegistry', operacion: str, argumentos: list):
+        """Aplica un registro del diario sobre el registry."""
+        def actividad(nombre: str) -> Actividad:
+            return cls._requerir(registry.obtener_actividad(nombre), f"Actividad '{nombre}'")
+        
+        def socio(dni: int) -> 'Socio':
+            return cls._requerir(registry.obtener_socio(dni), f"Socio {dni}")
+        
+        def profesor(dni: int) -> Profesor:
+            return cls._requerir(registry.obtener_profesor(dni), f"Profesor {dni}")
+        
+
+        if operacion == "socio+":
+            tipo, nombre, dni, edad, fecha_registro, estado_pago = argumentos
+            nuevo = SocioFactory.crear_socio(tipo, nombre, dni, edad)
+            nuevo._fecha_registro = datetime.fromtimestamp(fecha_registro)
+            nuevo.estado_pago = estado_pago
+            registry.registrar_socio(nuevo)
+        elif operacion == "socio-":
+            registry.eliminar_socio(argumentos[0])
+        elif operacion == "actividad+":
+            registry.registrar_actividad(Actividad(*argumentos))
+        elif operacion == "actividad-":
+            eliminada = actividad(argumentos[0])
+            for inscrito in eliminada.socios:
+                inscrito.eliminar_actividad(eliminada)
+            for asignado in eliminada.profesores:
+                asignado.desasignar_actividad(eliminada)
+            registry.eliminar_actividad(argumentos[0])
+        elif operacion == "profesor+":
+            registry.registrar_profesor(Profesor(*argumentos))
+        elif operacion == "profesor-":
+            registry.eliminar_profesor(argumentos[0])
+        elif operacion == "sueldo":
+            registry.modificar_sueldo_profesor(profesor(argumentos[0]), argumentos[1])
+        elif operacion == "inscripcion":
+            registry.inscribir_socio(actividad(argumentos[0]), socio(argumentos[1]))
+        elif operacion == "desinscripcion":
+            registry.desinscribir_socio(actividad(argumentos[0]), socio(argumentos[1]))
+        elif operacion == "asignacion":
+            registry.asignar_profesor(actividad(argumentos[0]), profesor(argumentos[1]))
+        elif operacion == "desasignacion":
+            registry.desasignar_profesor(actividad(argumentos[0]), profesor(argumentos[1]))
+        elif operacion == "torneo":
+            nombre_actividad, nombre, fecha, costo, fecha_creacion = argumentos
+            torneo = Torneo(nombre, actividad(nombre_actividad), fecha, costo)
+            torneo._fecha_creacion = datetime.fromtimestamp(fecha_creacion)
+            registry.registrar_torneo(torneo)
+        elif operacion == "participante":
+            nombre_actividad, nombre_torneo, dni = argumentos
+            torneo = next(t for t in actividad(nombre_actividad).torneos if t.nombre == nombre_torneo)
+            registry.inscribir_participante(torneo, socio(dni))
+        elif operacion == "pago":
+            dni, monto, metodo, fecha = argumentos
+            fecha = datetime.fromtimestamp(fecha)
+            # Si el proceso terminó entre la instantánea y el punto de control,
+            # el pago ya está en la instantánea y no debe duplicarse
+            if any(p.fecha == fecha and p.monto == monto and p.metodo == metodo
+                   for p in registry.obtener_pagos_socio(dni)):
+                return
+            registry.registrar_pago(Pago(socio(dni), monto, metodo, fecha))
+        elif operacion == "estado_pago":
+            registry.actualizar_estado_pago(socio(argumentos[0]), argumentos[1])
+        elif operacion == "reinicio":
+            registry.reset()
+        else:
+            raise ValueError(f"Operación desconocida '{operacion}'")
@@ -0,0 +1,175 @@
+"""
+Servicio de Exportación de Datos
+Exporta las colecciones del ClubRegistry a CSV o JSON Lines en streaming.
+"""
+
+# Standard library imports
+import csv
+import gzip
+import json
+import os
+from datetime import datetime
+from itertools import chain, islice
+from typing import Dict, Iterator, List, Optional
+
+# Local application imports
+from club.salida import obtener_salida
+from club.patrones.singleton.club_registry import ClubRegistry
+
+
+class ExportacionService:
+    """
+    Servicio para exportar las colecciones del registry a archivos planos.
+    
+    Las filas se generan de a una a partir del registry y se escriben a medida
+    que se producen, sin listas intermedias, así que la memoria no depende de
+    la cantidad de registros. Las relaciones se exportan como tablas propias
+    (inscripciones, asignaciones, participantes), igual que en el backend SQLite.
+    Con la carga diferida de PersistenciaService, solo se leen del disco las
+    colecciones que se exportan.
+    """
+    
+    FORMATO_CSV = "csv"
+    FORMATO_JSONL = "jsonl"
+    
+    CAMPOS = {
+        "socios": ("dni", "tipo", "nombre", "edad", "fecha_registro", "estado_pago"),
+        "actividades": ("nombre", "costo", "capacidad"),
+        "profesores": ("dni", "nombre", "sueldo"),
+        "inscripciones": ("actividad", "dni"),
+        "asignaciones": ("actividad", "dni"),
+        "torneos": ("actividad", "nombre", "fecha", "costo_inscripcion", "fecha_creacion"),
+        "participantes": ("actividad", "torneo", "dni"),
+        "pagos": ("dni", "monto", "metodo", "fecha", "comprobante"),
+    }
+    
+    def __init__(self):
+        self._registry = ClubRegistry.get_instance()
+    
+    # --- Generación de filas ---
+    
+    def filas(self, coleccion: str) -> Iterator[tuple]:
+        """Genera las filas de una colección, en el orden de CAMPOS.
+        
+        Args:
+            coleccion: Nombre de la colección a recorrer.
+        
+        Returns:
+            Un iterador de tuplas con los valores de cada registro.
+        """
+        if coleccion not in self.CAMPOS:
+            raise ValueError(f"Colección desconocida '{coleccion}'")
+        return getattr(self, f"_filas_{coleccion}")()
+    
+    def _filas_socios(self) -> Iterator[tuple]:
+        for socio in self._registry._socios.values():
+            yield (socio.dni, socio.get_tipo().lower(), socio.nombre, getattr(socio, 'edad', None),
+                   socio.fecha_registro.isoformat(), socio.estado_pago)
+    
+    def _filas_actividades(self) -> Iterator[tuple]:
+        for actividad in self._registry._actividades.values():
+            yield (actividad.nombre, actividad.costo, actividad.capacidad)
+    
+    def _filas_profesores(self) -> Iterator[tuple]:
+        for profesor in self._registry._profesores.values():
+            yield (profesor.dni, profesor.nombre, profesor.sueldo)
+    
+    def _filas_inscripciones(self) -> Iterator[tuple]:
+        for actividad in self._registry._actividades.values():
+            for socio in actividad.socios:
+                yield (actividad.nombre, socio.dni)
+    
+    def _filas_asignaciones(self) -> Iterator[tuple]:
+        for actividad in self._registry._actividades.values():
+            for profesor in actividad.profesores:
+                yield (actividad.nombre, profesor.dni)
+    
+    def _filas_torneos(self) -> Iterator[tuple]:
+        for actividad in self._registry._actividades.values():
+            for torneo in actividad.torneos:
+                yield (actividad.nombre, torneo.nombre, torneo.fecha, torneo.costo_inscripcion,
+                       torneo._fecha_creacion.isoformat())
+    
+    def _filas_participantes(self) -> Iterator[tuple]:
+        for actividad in self._registry._actividades.values():
+            for torneo in actividad.torneos:
+                for socio in torneo.participantes:
+                    yield (actividad.nombre, torneo.nombre, socio.dni)
+    
+    def _filas_pagos(self) -> Iterator[tuple]:
+        desde_timestamp = datetime.fromtimestamp
+        for dni, monto, metodo, timestamp in self._registry.iterar_filas_pagos():
+            yield (dni, monto, metodo, desde_timestamp(timestamp).isoformat(), f"PAGO-{dni}-{int(timestamp)}")
+    
+    # --- Escritura ---
+    
+    def exportar(self, coleccion: str, directorio: str, formato: str = FORMATO_CSV,
+                 comprimir: bool = False, filas_por_archivo: Optional[int] = None) -> List[str]:
+        """Exporta una colección a uno o más archivos.
+        
+        Args:
+            coleccion: Nombre de la colección (ver CAMPOS).
+            directorio: Directorio donde se escriben los archivos.
+            formato: 'csv' (con encabezado en cada archivo) o 'jsonl'.
+            comprimir: Si es True, los archivos se escriben con gzip (.gz).
+            filas_por_archivo: Si se indica, la salida se divide en archivos
+                numerados (pagos-00001.csv, pagos-00002.csv, ...) de a lo sumo
+                esa cantidad de filas.
+        
+        Returns:
+            Las rutas de los archivos escritos.
+        """
+        if formato not in (self.FORMATO_CSV, self.FORMATO_JSONL):
+            raise ValueError(f"Formato de exportación desconocido: '{formato}'")
+        if filas_por_archivo is not None and filas_por_archivo <= 0:
+            raise ValueError("filas_por_archivo debe ser mayor que cero")
+        filas = self.filas(coleccion)
+        campos = self.CAMPOS[coleccion]
+        extension = f".{formato}" + (".gz" if comprimir else "")
+        rutas = []
+        try:
+            os.makedirs(directorio, exist_ok=True)
+            while True:
+                lote = filas if filas_por_archivo is None else islice(filas, filas_por_archivo)
+                primera = next(lote, None)
+                if primera is None and rutas:
+                    break
+                nombre = coleccion if filas_por_archivo is None else f"{coleccion}-{len(rutas) + 1:05d}"
+                ruta = os.path.join(directorio, nombre + extension)
+                with self._abrir(ruta, comprimir) as f:
+                    self._escribir(f, formato, campos, chain((primera,), lote) if primera is not None else ())
+                rutas.append(ruta)
+                if filas_por_archivo is None:
+                    break
+        except OSError as e:
+            obtener_salida().error(f"No se pudo exportar '{coleccion}' en '{directorio}': {e}")
+            return rutas
+        obtener_salida().info(f"Colección '{coleccion}' exportada en {len(rutas)} archivo(s) en '{directorio}'",
+                              coleccion=coleccion, archivos=rutas)
+        return rutas
+    
+    def exportar_todo(self, directorio: str, formato: str = FORMATO_CSV, comprimir: bool = False,
+                      filas_por_archivo: Optional[int] = None) -> Dict[str, List[str]]:
+        """Exporta todas las colecciones con las mismas opciones (ver exportar).
+        
+        Returns:
+            Las rutas de los archivos escritos, por colección.
+        """
+        return {coleccion: self.exportar(coleccion, directorio, formato, comprimir, filas_por_archivo)
+                for coleccion in self.CAMPOS}
+    
+    @staticmethod
+    def _abrir(ruta: str, comprimir: bool):
+        if comprimir:
+            # Nivel intermedio: el máximo cuesta mucho más tiempo para poca ganancia en texto
+            return gzip.open(ruta, "wt", encoding="utf-8", newline="", compresslevel=6)
+        return open(ruta, "w", encoding="utf-8", newline="")
+    
+    @staticmethod
+    def _escribir(archivo, formato: str, campos: tuple, filas):
+        if formato == ExportacionService.FORMATO_CSV:
+            escritor = csv.writer(archivo)
+            escritor.writerow(campos)
+            escritor.writerows(filas)
+        else:
+            archivo.writelines(json.dumps(dict(zip(campos, fila)), ensure_ascii=False) + "\n" for fila in filas)
@@ -0,0 +1,300 @@
+"""
+Formato binario compacto para el estado del ClubRegistry.
+Guarda socios, profesores, actividades, torneos y pagos como registros de
+ancho fijo empaquetados con `struct`, los textos en una tabla de cadenas y
+las relaciones como arreglos de adyacencia, para leerlos con decodificación
+en bloque.
+"""
+
+# Standard library imports
+import struct
+import sys
+from array import array
+from typing import Dict, List, Tuple
+
+# Local application imports
+from club.estructuras.almacen_pagos import AlmacenPagosColumnar
+from club.servicios.instantanea import Instantanea
+
+
+class FormatoBinario:
+    """
+    Lectura y escritura del archivo binario versionado del registry.
+    
+    Estructura del archivo (little-endian):
+        cabecera: magia, versión, opciones y cantidad de secciones
+        secciones: etiqueta de 4 bytes, largo y contenido
+    
+    Las secciones de registros contienen una cantidad seguida de registros de
+    ancho fijo. Las adyacencias (actividades de cada socio, socios de cada
+    actividad, etc.) se guardan como un arreglo de desplazamientos más un
+    arreglo de valores, de modo que los vínculos del elemento i son
+    valores[desplazamientos[i]:desplazamientos[i + 1]].
+    
+    La lectura produce el mismo contenido que Instantanea, que se encarga de
+    reconstruir el grafo de objetos.
+    """
+    
+    MAGIA = b"CLUBBIN\0"
+    VERSION = 1
+    OPCION_PAGOS_COLUMNARES = 1
+    
+    _CABECERA = struct.Struct("<8sHHI")
+    _SECCION = struct.Struct("<4sQ")
+    _CANTIDAD = struct.Struct("<I")
+    # dni, tipo, nombre, edad (-1 si no aplica), fecha de registro, estado de pago
+    _SOCIO = struct.Struct("<qBIhdI")
+    # nombre, costo, costo entero, capacidad
+    _ACTIVIDAD = struct.Struct("<IdBq")
+    # actividad, nombre, fecha, costo, costo entero, fecha de creación
+    _TORNEO = struct.Struct("<IIIdBd")
+    # dni, nombre, sueldo, sueldo entero
+    _PROFESOR = struct.Struct("<qIdB")
+    # dni, monto, monto entero, método, fecha
+    _PAGO = struct.Struct("<qdBId")
+    
+    _TIPOS = ("regular", "premium", "infantil")
+    
+    # --- Escritura ---
+    
+    @classmethod
+    def escribir(cls, archivo, contenidos: Dict[str, dict]):
+        """Escribe el estado completo del registry en un archivo binario abierto.
+        
+        Args:
+            archivo: Archivo abierto en modo binario de escritura.
+            contenidos: Las cuatro colecciones codificadas con Instantanea.codificar.
+        """
+        cadenas = _TablaCadenas()
+        secciones: List[Tuple[bytes, bytes]] = []
+        
+        actividades = contenidos["actividades"]["registros"]
+        indice_actividad = {registro[0].lower(): i for i, registro in enumerate(actividades)}
+        
+        socios = contenidos["socios"]["registros"]
+        secciones.append((b"SOC ", cls._empaquetar(cls._SOCIO, (
+            cls._fila_socio(registro, cadenas) for registro in socios), len(socios))))
+        secciones.append((b"SOCA", cls._adyacencia(
+            ([indice_actividad[clave] for clave in registro[6] if clave in indice_actividad]
+             for registro in socios), 'I')))
+        retirados = {}
+        for contenido in contenidos.values():
+            for registro in contenido["retirados"]:
+                retirados.setdefault(registro[2], registro)
+        secciones.append((b"RET ", cls._empaquetar(cls._SOCIO, (
+            cls._fila_socio(registro, cadenas) for registro in retirados.values()), len(retirados))))
+        
+        secciones.append((b"ACT ", cls._empaquetar(cls._ACTIVIDAD, (
+            (cadenas.indice(nombre), costo, isinstance(costo, int), capacidad)
+            for nombre, costo, capacidad, *_ in actividades), len(actividades))))
+        secciones.append((b"ACTS", cls._adyacencia((registro[3] for registro in actividades), 'q')))
+        secciones.append((b"ACTP", cls._adyacencia((registro[4] for registro in actividades), 'q')))
+        torneos = [(i, torneo) for i, registro in enumerate(actividades) for torneo in registro[5]]
+        secciones.append((b"TOR ", cls._empaquetar(cls._TORNEO, (
+            (i, cadenas.indice(nombre), cadenas.indice(fecha), costo, isinstance(costo, int), creacion)
+            for i, (nombre, fecha, costo, creacion, _) in torneos), len(torneos))))
+        secciones.append((b"TORP", cls._adyacencia((torneo[4] for _, torneo in torneos), 'q')))
+        
+        profesores = contenidos["profesores"]["registros"]
+        secciones.append((b"PRO ", cls._empaquetar(cls._PROFESOR, (
+            (dni, cadenas.indice(nombre), sueldo, isinstance(sueldo, int))
+            for nombre, dni, sueldo, _ in profesores), len(profesores))))
+        secciones.append((b"PROA", cls._adyacencia(
+            ([indice_actividad[clave] for clave in registro[3] if clave in indice_actividad]
+             for registro in profesores), 'I')))
+        
+        pagos = contenidos["pagos"]["registros"]
+        opciones = 0
+        if isinstance(pagos, AlmacenPagosColumnar):
+            opciones |= cls.OPCION_PAGOS_COLUMNARES
+            metodos = pagos._catalogo_metodos
+            filas = zip(pagos._dnis, pagos._montos, (metodos[codigo] for codigo in pagos._metodos),
+                        pagos._timestamps)
+        else:
+            filas = pagos
+        secciones.append((b"PAG ", cls._empaquetar(cls._PAGO, (
+            (dni, monto, isinstance(monto, int), cadenas.indice(metodo), fecha)
+            for dni, monto, metodo, fecha in filas), len(pagos))))
+        
+        # La tabla de cadenas se completa al empaquetar las demás secciones
+        secciones.insert(0, (b"STR ", cadenas.a_bytes()))
+        archivo.write(cls._CABECERA.pack(cls.MAGIA, cls.VERSION, opciones, len(secciones)))
+        for etiqueta, contenido in secciones:
+            archivo.write(cls._SECCION.pack(etiqueta, len(contenido)))
+            archivo.write(contenido)
+    
+    @staticmethod
+    def _fila_socio(registro: tuple, cadenas: '_TablaCadenas') -> tuple:
+        tipo, nombre, dni, edad, fecha_registro, estado_pago, _ = registro
+        return (dni, FormatoBinario._TIPOS.index(tipo), cadenas.indice(nombre),
+                -1 if edad is None else edad, fecha_registro, cadenas.indice(estado_pago))
+    
+    @classmethod
+    def _empaquetar(cls, formato: struct.Struct, filas, cantidad: int) -> bytes:
+        contenido = bytearray(cls._CANTIDAD.pack(cantidad))
+        for fila in filas:
+            contenido += formato.pack(*fila)
+        return bytes(contenido)
+    
+    @classmethod
+    def _adyacencia(cls, listas, tipo: str) -> bytes:
+        desplazamientos = array('I', [0])
+        valores = array(tipo)
+        for lista in listas:
+            valores.extend(lista)
+            desplazamientos.append(len(valores))
+        return (cls._CANTIDAD.pack(len(desplazamientos) - 1)
+                + _a_bytes(desplazamientos) + _a_bytes(valores))
+    
+    # --- Lectura ---
+    
+    @classmethod
+    def leer(cls, archivo) -> Dict[str, dict]:
+        """Lee un archivo binario y retorna su contenido en el formato de Instantanea.
+        
+        Args:
+            archivo: Archivo abierto en modo binario de lectura.
+        
+        Returns:
+            El contenido de cada colección, listo para Instantanea.restaurar.
+        
+        Raises:
+            ValueError: Si el archivo no es un archivo binario del club o su
+                versión no está soportada.
+        """
+        datos = memoryview(archivo.read())
+        if len(datos) < cls._CABECERA.size:
+            raise ValueError("Archivo binario incompleto")
+        magia, version, opciones, cantidad_secciones = cls._CABECERA.unpack_from(datos)
+        if magia != cls.MAGIA:
+            raise ValueError("El archivo no tiene formato binario del club")
+        if version > cls.VERSION:
+            raise ValueError(f"Versión de formato binario no soportada: {version}")
+        secciones = {}
+        posicion = cls._CABECERA.size
+        for _ in range(cantidad_secciones):
+            etiqueta, largo = cls._SECCION.unpack_from(datos, posicion)
+            posicion += cls._SECCION.size
+            secciones[etiqueta] = datos[posicion:posicion + largo]
+            posicion += largo
+        
+        cadenas = _TablaCadenas.desde_bytes(secciones[b"STR "])
+        tipos = cls._TIPOS
+        
+        actividades = cls._desempaquetar(cls._ACTIVIDAD, secciones[b"ACT "])
+        claves = [cadenas[nombre].lower() for nombre, *_ in actividades]
+        socios_actividad = cls._leer_adyacencia(secciones[b"ACTS"], 'q')
+        profesores_actividad = cls._leer_adyacencia(secciones[b"ACTP"], 'q')
+        torneos_actividad = [[] for _ in actividades]
+        participantes = cls._leer_adyacencia(secciones[b"TORP"], 'q')
+        for (actividad, nombre, fecha, costo, entero, creacion), dnis in zip(
+                cls._desempaquetar(cls._TORNEO, secciones[b"TOR "]), participantes):
+            torneos_actividad[actividad].append(
+                (cadenas[nombre], cadenas[fecha], int(costo) if entero else costo, creacion, dnis))
+        
+        def socios(seccion: bytes, adyacencia) -> list:
+            return [(tipos[tipo], cadenas[nombre], dni, None if edad < 0 else edad, fecha,
+                     cadenas[estado], [claves[i] for i in vinculos])
+                    for (dni, tipo, nombre, edad, fecha, estado), vinculos
+                    in zip(cls._desempaquetar(cls._SOCIO, seccion), adyacencia)]
+        
+        registros_socios = socios(secciones[b"SOC "], cls._leer_adyacencia(secciones[b"SOCA"], 'I'))
+        retirados = cls._desempaquetar(cls._SOCIO, secciones[b"RET "])
+        registros_retirados = socios(secciones[b"RET "], ([] for _ in retirados))
+        
+        registros_actividades = [
+            (cadenas[nombre], int(costo) if entero else costo, capacidad, dnis, profesores, torneos)
+            for (nombre, costo, entero, capacidad), dnis, profesores, torneos
+            in zip(actividades, socios_actividad, profesores_actividad, torneos_actividad)]
+        registros_profesores = [
+            (cadenas[nombre], dni, int(sueldo) if entero else sueldo, [claves[i] for i in vinculos])
+            for (dni, nombre, sueldo, entero), vinculos
+            in zip(cls._desempaquetar(cls._PROFESOR, secciones[b"PRO "]),
+                   cls._leer_adyacencia(secciones[b"PROA"], 'I'))]
+        
+        filas_pagos = cls._desempaquetar(cls._PAGO, secciones[b"PAG "])
+        if opciones & cls.OPCION_PAGOS_COLUMNARES:
+            registros_pagos = AlmacenPagosColumnar()
+            for dni, monto, entero, metodo, fecha in filas_pagos:
+                registros_pagos.agregar_fila(dni, monto, cadenas[metodo], fecha)
+        else:
+            registros_pagos = [(dni, int(monto) if entero else monto, cadenas[metodo], fecha)
+                               for dni, monto, entero, metodo, fecha in filas_pagos]
+        
+        def contenido(registros, retirados_coleccion=()) -> dict:
+            return {"formato": Instantanea.FORMATO, "version": Instantanea.VERSION,
+                    "registros": registros, "retirados": list(retirados_coleccion)}
+        
+        return {
+            "socios": contenido(registros_socios, registros_retirados),
+            "actividades": contenido(registros_actividades),
+            "profesores": contenido(registros_profesores),
+            "pagos": contenido(registros_pagos),
+        }
+    
+    @classmethod
+    def _desempaquetar(cls, formato: struct.Struct, seccion) -> list:
+        cantidad, = cls._CANTIDAD.unpack_from(seccion)
+        inicio = cls._CANTIDAD.size
+        return list(formato.iter_unpack(seccion[inicio:inicio + cantidad * formato.size]))
+    
+    @classmethod
+    def _leer_adyacencia(cls, seccion, tipo: str) -> List[array]:
+        cantidad, = cls._CANTIDAD.unpack_from(seccion)
+        inicio = cls._CANTIDAD.size
+        fin = inicio + (cantidad + 1) * 4
+        desplazamientos = _desde_bytes('I', seccion[inicio:fin])
+        valores = _desde_bytes(tipo, seccion[fin:])
+        return [valores[desplazamientos[i]:desplazamientos[i + 1]] for i in range(cantidad)]
+
+
+class _TablaCadenas:
+    """Tabla de textos sin repetir, referenciados por índice."""
+    
+    def __init__(self, cadenas: List[str] = None):
+        self._cadenas: List[str] = cadenas if cadenas is not None else []
+        self._indices: Dict[str, int] = {}
+    
+    def indice(self, cadena: str) -> int:
+        indice = self._indices.get(cadena)
+        if indice is None:
+            indice = self._indices[cadena] = len(self._cadenas)
+            self._cadenas.append(cadena)
+        return indice
+    
+    def __getitem__(self, indice: int) -> str:
+        return self._cadenas[indice]
+    
+    def a_bytes(self) -> bytes:
+        # Los desplazamientos se cuentan en caracteres para cortar el texto ya decodificado
+        desplazamientos = array('I', [0])
+        for cadena in self._cadenas:
+            desplazamientos.append(desplazamientos[-1] + len(cadena))
+        return (FormatoBinario._CANTIDAD.pack(len(self._cadenas)) + _a_bytes(desplazamientos)
+                + "".join(self._cadenas).encode("utf-8"))
+    
+    @classmethod
+    def desde_bytes(cls, seccion) -> '_TablaCadenas':
+        cantidad, = FormatoBinario._CANTIDAD.unpack_from(seccion)
+        inicio = FormatoBinario._CANTIDAD.size
+        fin = inicio + (cantidad + 1) * 4
+        desplazamientos = _desde_bytes('I', seccion[inicio:fin])
+        texto = bytes(seccion[fin:]).decode("utf-8")
+        return cls([texto[desplazamientos[i]:desplazamientos[i + 1]] for i in range(cantidad)])
+
+
+def _a_bytes(arreglo: array) -> bytes:
+    """Convierte un arreglo a bytes little-endian."""
+    if sys.byteorder == "big":
+        arreglo = array(arreglo.typecode, arreglo)
+        arreglo.byteswap()
+    return arreglo.tobytes()
+
+
+def _desde_bytes(tipo: str, contenido) -> array:
+    """Construye un arreglo a partir de bytes little-endian."""
+    arreglo = array(tipo)
+    arreglo.frombytes(contenido)
+    if sys.byteorder == "big":
+        arreglo.byteswap()
+    return arreglo
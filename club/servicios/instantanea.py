@@ -0,0 +1,214 @@
+"""
+Formato de instantánea por referencias.
+Cada entidad se guarda una sola vez como una tupla de valores simples y sus
+relaciones se guardan como identificadores (DNI o clave de actividad), de
+modo que al cargar se reconstruye un único grafo de objetos consistente.
+"""
+
+# Standard library imports
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Optional
+
+# Local application imports
+from club.salida import obtener_salida
+from club.entidades.actividad import Actividad
+from club.entidades.pago import Pago
+from club.entidades.profesor import Profesor
+from club.entidades.socio import Socio
+from club.entidades.torneo import Torneo
+from club.estructuras.almacen_pagos import AlmacenPagosColumnar
+from club.patrones.factory.socio_factory import SocioFactory
+
+
+class Instantanea:
+    """
+    Codifica y restaura las colecciones del ClubRegistry por referencias.
+    
+    El contenido de cada archivo es un diccionario con el formato, la versión,
+    los registros de la colección y los socios "retirados": socios que ya no
+    están registrados pero siguen referenciados por pagos o torneos.
+    
+    Registros por colección:
+        socios: (tipo, nombre, dni, edad, fecha_registro, estado_pago, [actividades])
+        actividades: (nombre, costo, capacidad, [socios], [profesores], [torneos])
+            con torneos como (nombre, fecha, costo, fecha_creacion, [participantes])
+        profesores: (nombre, dni, sueldo, [actividades])
+        pagos: (dni, monto, metodo, fecha), o el AlmacenPagosColumnar completo
+    """
+    
+    FORMATO = "club-referencias"
+    VERSION = 1
+    
+    @classmethod
+    def es_instantanea(cls, datos) -> bool:
+        """Indica si el contenido de un archivo ya está en formato por referencias."""
+        return isinstance(datos, dict) and datos.get("formato") == cls.FORMATO
+    
+    # --- Codificación ---
+    
+    @classmethod
+    def codificar(cls, coleccion: str, datos, socios_registrados) -> dict:
+        """Codifica una colección del registry (o de un archivo antiguo).
+        
+        Args:
+            coleccion: Nombre de la colección ('socios', 'actividades', 'profesores', 'pagos').
+            datos: El diccionario o la lista de entidades de la colección.
+            socios_registrados: DNIs de los socios registrados; los socios
+                referenciados que no estén aquí se guardan como retirados.
+        
+        Returns:
+            El contenido a serializar en el archivo de la colección.
+        """
+        retirados: Dict[int, tuple] = {}
+        
+        def referencia(socio: Socio) -> int:
+            if socio.dni not in socios_registrados and socio.dni not in retirados:
+                retirados[socio.dni] = cls._registro_socio(socio, ())
+            return socio.dni
+        
+        if coleccion == "socios":
+            registros = [cls._registro_socio(s, [a.nombre.lower() for a in s.actividades])
+                         for s in datos.values()]
+        elif coleccion == "actividades":
+            registros = [(a.nombre, a.costo, a.capacidad,
+                          [referencia(s) for s in a.socios],
+                          [p.dni for p in a.profesores],
+                          [(t.nombre, t.fecha, t.costo_inscripcion, t._fecha_creacion.timestamp(),
+                            [referencia(s) for s in t.participantes]) for t in a.torneos])
+                         for a in datos.values()]
+        elif coleccion == "profesores":
+            registros = [(p.nombre, p.dni, p.sueldo, [a.nombre.lower() for a in p.actividades])
+                         for p in datos.values()]
+        elif coleccion == "pagos":
+            if isinstance(datos, AlmacenPagosColumnar):
+                # El almacén columnar ya guarda los socios por DNI; sus socios
+                # retirados se guardan como los de los demás pagos
+                registros = datos
+                for socio in datos.socios_retirados():
+                    referencia(socio)
+            else:
+                registros = [(referencia(p.socio), p.monto, p.metodo, p.fecha.timestamp()) for p in datos]
+        else:
+            raise ValueError(f"Colección desconocida '{coleccion}'")
+        return {"formato": cls.FORMATO, "version": cls.VERSION,
+                "registros": registros, "retirados": list(retirados.values())}
+    
+    @staticmethod
+    def _registro_socio(socio: Socio, actividades: Iterable[str]) -> tuple:
+        return (socio.get_tipo().lower(), socio.nombre, socio.dni, getattr(socio, 'edad', None),
+                socio.fecha_registro.timestamp(), socio.estado_pago, list(actividades))
+    
+    # --- Restauración ---
+    
+    @classmethod
+    def restaurar(cls, registry: 'ClubRegistry', contenidos: Dict[str, dict],
+                  materializados: Optional[Dict[int, Socio]] = None):
+        """Reconstruye las colecciones del registry a partir de las instantáneas leídas.
+        
+        Las colecciones sin instantánea conservan su contenido actual en el
+        registry y se usan para resolver las referencias hacia ellas.
+        
+        Args:
+            registry: El registry cuyas colecciones se reemplazan.
+            contenidos: Contenido de cada archivo leído, por colección.
+            materializados: Socios retirados ya reconstruidos, por DNI; se
+                completa con los de esta restauración para compartirlos con
+                las colecciones que se restauren después.
+        """
+        retirados: Dict[int, tuple] = {}
+        for contenido in contenidos.values():
+            for registro in contenido["retirados"]:
+                retirados.setdefault(registro[2], registro)
+        
+        if "socios" in contenidos:
+            socios = {}
+            actividades_socio = []
+            for registro in contenidos["socios"]["registros"]:
+                nuevo = socios[registro[2]] = cls._crear_socio(registro)
+                actividades_socio.append((nuevo, registro[6]))
+        else:
+            socios = registry._socios
+            actividades_socio = []
+        
+        if materializados is None:
+            materializados = {}
+        
+        def buscar_socio(dni: int) -> Optional[Socio]:
+            encontrado = socios.get(dni) or materializados.get(dni)
+            if encontrado is None and dni in retirados:
+                encontrado = materializados[dni] = cls._crear_socio(retirados[dni])
+            return encontrado
+        
+        if "actividades" in contenidos:
+            actividades = {}
+            profesores_actividad = []
+            for nombre, costo, capacidad, dnis, profesores, torneos in contenidos["actividades"]["registros"]:
+                actividad = Actividad(nombre, costo, capacidad)
+                actividades[nombre.lower()] = actividad
+                cls._vincular(buscar_socio, dnis, actividad.inscribir_socio)
+                profesores_actividad.append((actividad, profesores))
+                for nombre_torneo, fecha, costo_torneo, fecha_creacion, participantes in torneos:
+                    torneo = Torneo(nombre_torneo, actividad, fecha, costo_torneo)
+                    torneo._fecha_creacion = datetime.fromtimestamp(fecha_creacion)
+                    cls._vincular(buscar_socio, participantes, torneo.inscribir_participante)
+                    actividad.agregar_torneo(torneo)
+        else:
+            actividades = registry._actividades
+            profesores_actividad = []
+        
+        for nuevo, claves in actividades_socio:
+            cls._vincular(actividades.get, claves, nuevo.agregar_actividad)
+        
+        if "profesores" in contenidos:
+            profesores = {}
+            for nombre, dni, sueldo, claves in contenidos["profesores"]["registros"]:
+                profesor = profesores[dni] = Profesor(nombre, dni, sueldo)
+                cls._vincular(actividades.get, claves, profesor.asignar_actividad)
+        else:
+            profesores = registry._profesores
+        
+        for actividad, dnis in profesores_actividad:
+            cls._vincular(profesores.get, dnis, actividad.agregar_profesor)
+        
+        registry._socios = socios
+        registry._actividades = actividades
+        registry._profesores = profesores
+        if "pagos" in contenidos:
+            registros = contenidos["pagos"]["registros"]
+            if isinstance(registros, AlmacenPagosColumnar):
+                for dni in retirados:
+                    if dni not in socios and registros.tiene_pagos(dni):
+                        registros.retirar_socio(buscar_socio(dni))
+                registry._pagos = registros
+            else:
+                registry._pagos = [Pago.restaurar(buscar_socio(dni) or cls._socio_desconocido(dni, fecha, materializados),
+                                                  monto, metodo, datetime.fromtimestamp(fecha), f"PAGO-{dni}-{int(fecha)}")
+                                   for dni, monto, metodo, fecha in registros]
+    
+    @staticmethod
+    def _vincular(resolver: Callable, claves: Iterable, vincular: Callable):
+        """Resuelve cada referencia y la vincula, omitiendo las que ya no existen."""
+        for clave in claves:
+            entidad = resolver(clave)
+            if entidad is not None:
+                vincular(entidad)
+    
+    @classmethod
+    def _socio_desconocido(cls, dni: int, fecha: float, materializados: Dict[int, Socio]) -> Socio:
+        """Reemplaza a un socio referenciado por un pago que no figura en ningún archivo.
+        
+        Ocurre con pagos guardados antes de que se conservara a sus socios
+        retirados; el pago se mantiene a nombre de un socio retirado genérico.
+        """
+        obtener_salida().warning(f"El socio con DNI {dni} de un pago guardado no se encontró; "
+                                 f"se restaura como socio retirado")
+        socio = materializados[dni] = cls._crear_socio(("regular", f"Socio retirado {dni}", dni, None,
+                                                        fecha, "Pendiente", ()))
+        return socio
+    
+    @staticmethod
+    def _crear_socio(registro: tuple) -> Socio:
+        tipo, nombre, dni, edad, fecha_registro, estado_pago, _ = registro
+        return SocioFactory.restaurar_socio(tipo, nombre, dni, edad,
+                                            datetime.fromtimestamp(fecha_registro), estado_pago)
+
@@ -4,12 +4,15 @@ Encapsula la lógica de negocio relacionada con pagos de cuotas.
 """
 
 # Standard library imports
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 
 # Local application imports
+from club.salida import obtener_salida
 from club.entidades.pago import Pago
 from club.entidades.socio import Socio
 from club.patrones.singleton.club_registry import ClubRegistry
+from club.patrones.observer.despachador import DespachadorEventos
 from club.patrones.observer.notificador_pago import NotificadorPago
 from club.patrones.observer.observer import Observable
 
@@ -20,38 +23,47 @@ class PagoService(Observable):
     Implementa Observable del patrón Observer.
     """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, despachador: Optional[DespachadorEventos] = None):
+        """Inicializa el servicio.
+
+        Args:
+            despachador: Si se indica, las notificaciones de pagos se entregan
+                en segundo plano y registrar un pago no espera al notificador.
+        """
+        super().__init__(despachador)
         self._registry = ClubRegistry.get_instance()
         self._notificador_pago = NotificadorPago()
         self.agregar_observador(self._notificador_pago)
     
-    def registrar_pago(self, socio: Socio, monto: float, metodo: str = "Efectivo") -> Optional[Pago]:
+    def registrar_pago(self, socio: Socio, monto: float, metodo: str = "Efectivo",
+                       fecha: Optional[datetime] = None) -> Optional[Pago]:
         """Registra un pago de cuota y notifica a los observadores.
 
         Args:
             socio: Socio que realiza el pago.
             monto: Monto pagado.
             metodo: Método de pago (Efectivo, Tarjeta, Transferencia).
+            fecha: Fecha del pago, para registrar pagos retroactivos (por defecto, ahora).
 
         Returns:
             La instancia del pago registrado o None si falla.
         """
         try:
-            pago = Pago(socio, monto, metodo)
+            pago = Pago(socio, monto, metodo, fecha)
             self._registry.registrar_pago(pago)
-            socio.estado_pago = "Pagado"
+            self._registry.actualizar_estado_pago(socio, "Pagado")
             datos_evento = {
                 'socio': socio.nombre,
+                'dni': socio.dni,
                 'monto': monto,
                 'metodo': metodo,
                 'comprobante': pago.comprobante
             }
             self.notificar_observadores('pago_registrado', datos_evento)
-            print(f"[INFO] Pago registrado exitosamente - Comprobante: {pago.comprobante}")
+            obtener_salida().info(f"Pago registrado exitosamente - Comprobante: {pago.comprobante}")
             return pago
         except Exception as e:
-            print(f"[ERROR] No se pudo registrar el pago: {e}")
+            obtener_salida().error(f"No se pudo registrar el pago: {e}")
             return None
     
     def listar_pagos(self) -> List[Pago]:
@@ -69,13 +81,48 @@ class PagoService(Observable):
         """
         return self._registry.obtener_pagos_socio(dni)
     
+    def listar_pagos_entre(self, desde: datetime, hasta: datetime) -> List[Pago]:
+        """Obtiene los pagos realizados entre dos fechas, en orden cronológico.
+
+        Args:
+            desde: Fecha inicial (inclusive).
+            hasta: Fecha final (inclusive).
+
+        Returns:
+            Una lista de pagos dentro del rango.
+        """
+        return self._registry.obtener_pagos_entre(desde, hasta)
+    
+    def listar_pagos_mes(self, anio: int, mes: int) -> List[Pago]:
+        """Obtiene los pagos de un mes calendario, útil para el cierre mensual.
+
+        Args:
+            anio: Año del cierre.
+            mes: Mes del cierre (1-12).
+
+        Returns:
+            Una lista de pagos del mes en orden cronológico.
+        """
+        return self._registry.obtener_pagos_mes(anio, mes)
+    
+    def listar_ultimos_pagos(self, cantidad: int = 10) -> List[Pago]:
+        """Obtiene los últimos pagos registrados según su fecha.
+
+        Args:
+            cantidad: Cantidad de pagos a retornar.
+
+        Returns:
+            Una lista con los pagos más recientes en orden cronológico.
+        """
+        return self._registry.obtener_ultimos_pagos(cantidad)
+    
     def calcular_total_recaudado(self) -> float:
         """Calcula el total recaudado en pagos.
 
         Returns:
             La suma de todos los montos pagados.
         """
-        return sum(p.monto for p in self.listar_pagos())
+        return self._registry.obtener_recaudacion().total
     
     def calcular_total_recaudado_socio(self, dni: int) -> float:
         """Calcula el total pagado por un socio específico.
@@ -86,7 +133,27 @@ class PagoService(Observable):
         Returns:
             La suma de todos los pagos del socio.
         """
-        return sum(p.monto for p in self.obtener_pagos_socio(dni))
+        return self._registry.obtener_recaudacion().total_socio(dni)
+    
+    def calcular_recaudacion_por_metodo(self) -> Dict[str, float]:
+        """Calcula la recaudación agrupada por método de pago.
+
+        Returns:
+            Un diccionario con el total recaudado por cada método.
+        """
+        return self._registry.obtener_recaudacion().por_metodo
+    
+    def calcular_recaudacion_mes(self, anio: int, mes: int) -> float:
+        """Calcula el total recaudado en un mes calendario.
+
+        Args:
+            anio: Año a consultar.
+            mes: Mes a consultar (1-12).
+
+        Returns:
+            La suma de los pagos del mes.
+        """
+        return self._registry.obtener_recaudacion().total_mes(anio, mes)
     
     def mostrar_historial_pagos(self, dni: int):
         """Muestra el historial de pagos de un socio.
@@ -98,23 +165,25 @@ class PagoService(Observable):
         socio = SocioService().obtener_socio(dni)
         if not socio:
             return
+        salida = obtener_salida()
+        if not salida.habilitado():
+            return
         pagos = self.obtener_pagos_socio(dni)
-        print("\n" + "="*60)
-        print(f"HISTORIAL DE PAGOS - {socio.nombre}")
-        print("="*60)
+        lineas = ["\n" + "="*60, f"HISTORIAL DE PAGOS - {socio.nombre}", "="*60]
         if not pagos:
-            print("No hay pagos registrados para este socio")
+            lineas.append("No hay pagos registrados para este socio")
         else:
             for i, pago in enumerate(pagos, 1):
-                print(f"\nPago #{i}")
-                print(f"Fecha: {pago.fecha.strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"Monto: ${pago.monto}")
-                print(f"Método: {pago.metodo}")
-                print(f"Comprobante: {pago.comprobante}")
+                lineas.append(f"\nPago #{i}")
+                lineas.append(f"Fecha: {pago.fecha.strftime('%Y-%m-%d %H:%M:%S')}")
+                lineas.append(f"Monto: ${pago.monto}")
+                lineas.append(f"Método: {pago.metodo}")
+                lineas.append(f"Comprobante: {pago.comprobante}")
             total = sum(p.monto for p in pagos)
-            print(f"\n{'='*60}")
-            print(f"Total pagado: ${total}")
-        print("="*60 + "\n")
+            lineas.append(f"\n{'='*60}")
+            lineas.append(f"Total pagado: ${total}")
+        lineas.append("="*60 + "\n")
+        salida.mostrar("\n".join(lineas))
     
     def notificar_recordatorio_pago(self, socio: Socio, monto: float, vencimiento: str):
         """Envía un recordatorio de pago a un socio.
@@ -126,6 +195,7 @@ class PagoService(Observable):
         """
         datos_evento = {
             'socio': socio.nombre,
+            'dni': socio.dni,
             'monto': monto,
             'vencimiento': vencimiento
         }
@@ -138,28 +208,30 @@ class PagoService(Observable):
             socio: Socio con pago vencido.
             monto: Monto adeudado.
         """
-        socio.estado_pago = "Vencido"
+        self._registry.actualizar_estado_pago(socio, "Vencido")
         datos_evento = {
             'socio': socio.nombre,
+            'dni': socio.dni,
             'monto': monto
         }
         self.notificar_observadores('pago_vencido', datos_evento)
     
     def generar_reporte_recaudacion(self):
         """Genera un reporte de recaudación total."""
-        pagos = self.listar_pagos()
-        total = self.calcular_total_recaudado()
-        print("\n" + "="*60)
-        print("REPORTE DE RECAUDACIÓN")
-        print("="*60)
-        print(f"Total de pagos registrados: {len(pagos)}")
-        print(f"Total recaudado: ${total}")
-        if pagos:
-            por_metodo = {}
-            for pago in pagos:
-                metodo = pago.metodo
-                por_metodo[metodo] = por_metodo.get(metodo, 0) + pago.monto
-            print("\nRecaudación por método de pago:")
-            for metodo, monto in por_metodo.items():
-                print(f"  • {metodo}: ${monto}")
-        print("="*60 + "\n")
\ No newline at end of file
+        salida = obtener_salida()
+        if not salida.habilitado():
+            return
+        recaudacion = self._registry.obtener_recaudacion()
+        lineas = [
+            "\n" + "="*60,
+            "REPORTE DE RECAUDACIÓN",
+            "="*60,
+            f"Total de pagos registrados: {recaudacion.cantidad}",
+            f"Total recaudado: ${recaudacion.total}"
+        ]
+        if recaudacion.cantidad:
+            por_metodo = recaudacion.por_metodo
+            lineas.append("\nRecaudación por método de pago:")
+            lineas.extend(f"  • {metodo}: ${monto}" for metodo, monto in por_metodo.items())
+        lineas.append("="*60 + "\n")
+        salida.mostrar("\n".join(lineas), total=recaudacion.total, cantidad=recaudacion.cantidad)
\ No newline at end of file
@@ -6,22 +6,80 @@ Encapsula la lógica para guardar y cargar el estado del sistema usando Pickle.
 # Standard library imports
 import pickle
 import os
+import struct
+import threading
+import traceback
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from typing import Dict, List, Optional, Union
 
 # Local application imports
+from club.estructuras.almacen_pagos import AlmacenPagosColumnar
+from club.estructuras.carga_perezosa import CargaPerezosa, ColeccionPerezosa
+from club.salida import obtener_salida
 from club.patrones.singleton.club_registry import ClubRegistry
+from club.servicios.buffers_externos import ArchivoBuffers
+from club.servicios.compresion import (SIN_COMPRESION, ERRORES_LECTURA, abrir_escritura, abrir_lectura,
+                                       validar_codec)
+from club.servicios.diario_cambios import DiarioCambios
+from club.servicios.formato_binario import FormatoBinario
+from club.servicios.instantanea import Instantanea
 
 
 class PersistenciaService:
     """
     Servicio para guardar y cargar datos del ClubRegistry en archivos .dat separados.
+    Cada archivo guarda sus entidades una sola vez y referencia a las de otras
+    colecciones por identificador (ver Instantanea), así que al cargar se
+    obtiene un único grafo de objetos.
+    Con el formato binario, todo el registry se guarda en un único archivo de
+    registros empaquetados que se lee con decodificación en bloque.
+    Opcionalmente mantiene un diario de cambios de solo agregado, de modo que
+    guardar solo escribe lo modificado desde la última instantánea completa.
     """
     
-    def __init__(self, directorio: str = "data"):
+    FORMATO_PICKLE = "pickle"
+    FORMATO_BINARIO = "binario"
+    ARCHIVO_BINARIO = "club.bin"
+    MODO_PROCESO = "proceso"
+    MODO_HILO = "hilo"
+    
+    def __init__(self, directorio: str = "data", usar_diario: bool = False,
+                 tamano_grupo: int = 32, max_registros_diario: int = 10000,
+                 formato: str = FORMATO_PICKLE, modo_segundo_plano: Optional[str] = None,
+                 carga_perezosa: bool = False, compresion: Union[str, Dict[str, str]] = SIN_COMPRESION):
         """Inicializa el servicio de persistencia.
-
+        
         Args:
             directorio: El nombre del directorio donde se guardarán los datos.
+            usar_diario: Si es True, cada cambio del registry se agrega a un diario.
+            tamano_grupo: Registros del diario que se escriben juntos con un fsync.
+            max_registros_diario: Tamaño del diario a partir del cual guardar_datos
+                genera una instantánea completa y lo vacía.
+            formato: 'pickle' (un archivo .dat por colección) o 'binario'
+                (un único archivo club.bin).
+            modo_segundo_plano: Cómo se guarda con guardar_datos_async: 'proceso'
+                (fork, por defecto donde está disponible) o 'hilo'.
+            carga_perezosa: Si es True, cargar_datos difiere la lectura de cada
+                colección hasta su primer uso; por defecto carga todo de
+                inmediato.
+            compresion: Códec con el que se escriben los archivos ('none',
+                'zlib', 'bz2' o 'lzma'; 'zlib' escribe deflate con el formato
+                de gzip), o un diccionario con el códec de cada colección (y
+                de 'binario' para club.bin); las que no figuran se guardan sin
+                comprimir. Al leer, el códec se detecta solo.
         """
+        if formato not in (self.FORMATO_PICKLE, self.FORMATO_BINARIO):
+            raise ValueError(f"Formato de persistencia desconocido: '{formato}'")
+        if modo_segundo_plano is None:
+            modo_segundo_plano = self.MODO_PROCESO if hasattr(os, "fork") else self.MODO_HILO
+        if modo_segundo_plano not in (self.MODO_PROCESO, self.MODO_HILO):
+            raise ValueError(f"Modo de guardado en segundo plano desconocido: '{modo_segundo_plano}'")
+        self._formato = formato
+        self._modo_segundo_plano = modo_segundo_plano
+        self._lock_guardado = threading.Lock()
+        self._guardado_en_curso: Optional[Future] = None
+        self._carga_perezosa = carga_perezosa
+        self._cargas: Dict[str, CargaPerezosa] = {}
         self._directorio = directorio
         self._registry = ClubRegistry.get_instance()
         self._filenames = {
@@ -30,53 +88,402 @@ class PersistenciaService:
             "profesores": "profesores.dat",
             "pagos": "pagos.dat"
         }
-
+        if isinstance(compresion, str):
+            compresion = dict.fromkeys([*self._filenames, self.FORMATO_BINARIO], compresion)
+        self._codecs = {key: validar_codec(codec) for key, codec in compresion.items()}
+        self._max_registros_diario = max_registros_diario
+        self._diario = None
+        if usar_diario:
+            self._diario = DiarioCambios(directorio, tamano_grupo)
+            self._registry.agregar_observador(self._diario)
+    
     def _get_path(self, filename: str) -> str:
         return os.path.join(self._directorio, filename)
+    
+    @staticmethod
+    def _escribir_atomico(filepath: str, escribir, codec: str = SIN_COMPRESION):
+        """Escribe un archivo temporal, lo fuerza a disco y lo renombra sobre el definitivo.
 
-    def guardar_datos(self):
-        """Guarda cada diccionario/lista de entidades en un archivo .dat separado."""
+        El contenido pasa por el compresor del códec a medida que se escribe.
+        """
+        temporal = filepath + ".tmp"
+        with open(temporal, "wb") as f:
+            with abrir_escritura(f, codec) as destino:
+                escribir(destino)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, filepath)
+    
+    def guardar_datos(self, completo: bool = False):
+        """Guarda cada diccionario/lista de entidades en un archivo .dat separado.
+        
+        Solo se reescriben los archivos de las colecciones modificadas desde el
+        último guardado (según sus contadores de generación en el registry); si
+        no hubo cambios, retorna de inmediato. Con el formato binario, cualquier
+        cambio reescribe el archivo único.
+        
+        Con el diario activo, solo se fuerzan a disco los cambios pendientes del
+        diario, salvo que se pida una instantánea completa o el diario haya
+        superado su tamaño máximo; en ese caso se escribe la instantánea y el
+        diario se vacía.
+        
+        Si hay un guardado en segundo plano en curso, primero se espera a que termine.
+        
+        Args:
+            completo: Fuerza la escritura de la instantánea completa.
+        """
+        self.esperar_guardado()
+        if self._guardar_en_diario(completo):
+            return
+        pendientes = self._colecciones_pendientes()
+        if not pendientes:
+            obtener_salida().info("No hay cambios para guardar")
+            return
         try:
-            if not os.path.exists(self._directorio):
-                os.makedirs(self._directorio)
-            
-            data_to_save = {
-                "socios": self._registry._socios,
-                "actividades": self._registry._actividades,
-                "profesores": self._registry._profesores,
-                "pagos": self._registry._pagos
-            }
-
-            for key, data in data_to_save.items():
-                filepath = self._get_path(self._filenames[key])
-                with open(filepath, "wb") as f:
-                    pickle.dump(data, f)
-            
-            print(f"[INFO] Datos guardados exitosamente en el directorio '{self._directorio}'")
-            
+            self._cargar_colecciones(pendientes)
+            generaciones = {key: self._registry.obtener_generacion(key) for key in pendientes}
+            secuencia = self._diario.secuencia if self._diario is not None else None
+            self._escribir_instantanea(self._instantanea(pendientes))
+            self._confirmar_guardado(generaciones, secuencia)
+            obtener_salida().info(f"Datos guardados exitosamente en el directorio '{self._directorio}'",
+                                  colecciones=pendientes)
+        
         except Exception as e:
-            print(f"[ERROR] No se pudieron guardar los datos: {e}")
-
+            obtener_salida().error(f"No se pudieron guardar los datos: {e}")
+    
+    def guardar_datos_async(self, completo: bool = False) -> Future:
+        """Guarda los datos en segundo plano sin bloquear a quien lo invoca.
+        
+        La instantánea se toma en el momento de la llamada y los servicios pueden
+        seguir modificando el registry mientras se escribe. En modo 'proceso'
+        (Linux y otros sistemas con fork) un proceso hijo escribe a partir de su
+        copia de la memoria (copy-on-write), por lo que tomar la instantánea es
+        casi instantáneo. En modo 'hilo' las colecciones pendientes se codifican
+        en el momento y un hilo las escribe.
+        
+        Hay como máximo un guardado en curso: si ya hay uno, se retorna su futuro
+        y los cambios posteriores a su instantánea quedan para el próximo guardado.
+        
+        Args:
+            completo: Fuerza la escritura de la instantánea completa (ver guardar_datos).
+        
+        Returns:
+            Un Future que se resuelve con la lista de colecciones guardadas, o
+            con la excepción que impidió guardarlas.
+        """
+        with self._lock_guardado:
+            if self._guardado_en_curso is not None and not self._guardado_en_curso.done():
+                return self._guardado_en_curso
+            futuro = Future()
+            if self._guardar_en_diario(completo):
+                futuro.set_result([])
+                return futuro
+            pendientes = self._colecciones_pendientes()
+            if not pendientes:
+                obtener_salida().info("No hay cambios para guardar")
+                futuro.set_result([])
+                return futuro
+            # El proceso hijo no debe leer archivos por su cuenta
+            self._cargar_colecciones(pendientes)
+            generaciones = {key: self._registry.obtener_generacion(key) for key in pendientes}
+            secuencia = self._diario.secuencia if self._diario is not None else None
+            try:
+                if self._modo_segundo_plano == self.MODO_PROCESO:
+                    pid = self._bifurcar(pendientes)
+                    tarea = lambda: self._esperar_proceso(pid)
+                else:
+                    contenidos = self._instantanea(pendientes, copiar=True)
+                    tarea = lambda: self._escribir_instantanea(contenidos)
+            except Exception as e:
+                obtener_salida().error(f"No se pudo iniciar el guardado en segundo plano: {e}")
+                futuro.set_exception(e)
+                return futuro
+            self._guardado_en_curso = futuro
+            threading.Thread(target=self._completar_guardado, name="guardado-club",
+                             args=(futuro, tarea, pendientes, generaciones, secuencia)).start()
+            return futuro
+    
+    def esperar_guardado(self, timeout: Optional[float] = None) -> bool:
+        """Espera a que termine el guardado en segundo plano en curso, si lo hay.
+        
+        Returns:
+            True si no queda ningún guardado en curso.
+        """
+        futuro = self._guardado_en_curso
+        if futuro is None:
+            return True
+        try:
+            futuro.exception(timeout)
+        except FuturesTimeoutError:
+            return False
+        return True
+    
+    def _completar_guardado(self, futuro: Future, tarea, pendientes: List[str],
+                            generaciones: Dict[str, int], secuencia: Optional[int]):
+        try:
+            tarea()
+            self._confirmar_guardado(generaciones, secuencia)
+        except Exception as e:
+            obtener_salida().error(f"No se pudieron guardar los datos en segundo plano: {e}")
+            futuro.set_exception(e)
+            return
+        obtener_salida().info(f"Datos guardados en segundo plano en el directorio '{self._directorio}'",
+                              colecciones=pendientes)
+        futuro.set_result(pendientes)
+    
+    def _bifurcar(self, pendientes: List[str]) -> int:
+        """Crea un proceso hijo que escribe la instantánea desde su copia de la memoria."""
+        pid = os.fork()
+        if pid == 0:
+            codigo = 1
+            try:
+                self._escribir_instantanea(self._instantanea(pendientes))
+                codigo = 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                # Sin limpieza del intérprete: los buffers y recursos son del proceso padre
+                os._exit(codigo)
+        return pid
+    
+    @staticmethod
+    def _esperar_proceso(pid: int):
+        _, estado = os.waitpid(pid, 0)
+        codigo = os.waitstatus_to_exitcode(estado)
+        if codigo != 0:
+            raise OSError(f"El proceso de guardado terminó con código {codigo}")
+    
+    def _guardar_en_diario(self, completo: bool) -> bool:
+        """Sincroniza solo el diario cuando no hace falta una instantánea.
+        
+        Returns:
+            True si los cambios quedaron guardados en el diario.
+        """
+        if self._diario is None or completo \
+                or self._diario.cantidad_registros() >= self._max_registros_diario:
+            return False
+        try:
+            self._diario.sincronizar()
+            obtener_salida().info(f"Cambios guardados en el diario "
+                                  f"({self._diario.cantidad_registros()} registros desde la última instantánea)")
+        except OSError as e:
+            obtener_salida().error(f"No se pudo escribir el diario de cambios: {e}")
+        return True
+    
+    def _colecciones_pendientes(self) -> List[str]:
+        """Colecciones cuya instantánea hay que escribir (todas, con el formato binario)."""
+        modificadas = set(self._registry.colecciones_modificadas())
+        if self._formato == self.FORMATO_BINARIO:
+            if modificadas or not os.path.exists(self._get_path(self.ARCHIVO_BINARIO)):
+                return list(self._filenames)
+            return []
+        return [key for key, filename in self._filenames.items()
+                if key in modificadas or not os.path.exists(self._get_path(filename))]
+    
+    def _instantanea(self, pendientes: List[str], copiar: bool = False) -> Dict[str, dict]:
+        """Codifica las colecciones pendientes por referencias.
+        
+        Args:
+            pendientes: Colecciones a codificar.
+            copiar: Copia el almacén columnar de pagos, que se guarda tal cual,
+                para que no cambie mientras se escribe desde otro hilo.
+        """
+        contenidos = {}
+        for key in pendientes:
+            contenido = Instantanea.codificar(key, getattr(self._registry, f"_{key}"), self._registry._socios)
+            if copiar and isinstance(contenido["registros"], AlmacenPagosColumnar):
+                contenido["registros"] = contenido["registros"].copia()
+            contenidos[key] = contenido
+        return contenidos
+    
+    def _escribir_instantanea(self, contenidos: Dict[str, dict]):
+        """Escribe las colecciones codificadas en el formato configurado."""
+        os.makedirs(self._directorio, exist_ok=True)
+        if self._formato == self.FORMATO_BINARIO:
+            self._escribir_atomico(self._get_path(self.ARCHIVO_BINARIO),
+                                   lambda f: FormatoBinario.escribir(f, contenidos),
+                                   self._codecs.get(self.FORMATO_BINARIO, SIN_COMPRESION))
+            return
+        for key, contenido in contenidos.items():
+            filepath = self._get_path(self._filenames[key])
+            codec = self._codecs.get(key, SIN_COMPRESION)
+            buffers = []
+            if codec == SIN_COMPRESION:
+                # Las columnas numéricas grandes van a un archivo aparte que se mapea al cargar
+                self._escribir_atomico(filepath, lambda f: buffers.append(ArchivoBuffers.volcar(contenido, f, filepath)))
+            else:
+                self._escribir_atomico(filepath, lambda f: pickle.dump(contenido, f, protocol=pickle.HIGHEST_PROTOCOL),
+                                       codec)
+            ArchivoBuffers.limpiar(filepath, vigente=buffers[0] if buffers else None)
+    
+    def _confirmar_guardado(self, generaciones: Dict[str, int], secuencia: Optional[int]):
+        """Marca las colecciones como guardadas y el punto de control del diario."""
+        for key, generacion in generaciones.items():
+            self._registry.marcar_guardada(key, generacion)
+        if self._diario is not None:
+            self._diario.marcar_punto_control(secuencia)
+    
     def cargar_datos(self) -> bool:
-        """Carga el estado del ClubRegistry desde archivos .dat separados.
-
+        """Carga el estado del ClubRegistry desde archivos .dat separados o desde club.bin.
+        
+        Con la carga diferida, las colecciones del registry se reemplazan por
+        representantes que leen sus archivos la primera vez que se usan: socios,
+        actividades y profesores se restauran juntos (se referencian entre sí) y
+        los pagos por separado. precargar() fuerza la lectura de todo.
+        
+        Con el formato binario y sin club.bin, se leen los archivos .dat y las
+        colecciones quedan marcadas como modificadas para pasarlas al binario.
+        
+        Los archivos guardados con el formato anterior (grafos de objetos
+        completos por archivo) se convierten al leerlos y se marcan como
+        modificados para reescribirse en el próximo guardado.
+        
+        Con el diario activo, luego de la instantánea se reproducen los cambios
+        registrados en el diario desde el último punto de control.
+        
         Returns:
-            True si al menos un archivo de datos se cargó, False en caso contrario.
+            True si al menos un archivo de datos se cargó (o quedó pendiente de
+            carga), False en caso contrario.
         """
+        self.precargar()
+        ruta_binaria = self._get_path(self.ARCHIVO_BINARIO)
+        if self._formato == self.FORMATO_BINARIO and os.path.exists(ruta_binaria):
+            grupos = [list(self._filenames)]
+        else:
+            existentes = [key for key, filename in self._filenames.items()
+                          if os.path.exists(self._get_path(filename))]
+            grupos = [[key for key in existentes if key != "pagos"], [key for key in existentes if key == "pagos"]]
+        
+        materializados = {}
         cargado = False
-        for key, filename in self._filenames.items():
-            filepath = self._get_path(filename)
-            if os.path.exists(filepath):
-                try:
-                    with open(filepath, "rb") as f:
-                        data = pickle.load(f)
-                        setattr(self._registry, f"_{key}", data)
-                    print(f"[INFO] Datos de '{key}' cargados desde {filepath}")
-                    cargado = True
-                except Exception as e:
-                    print(f"[ERROR] No se pudo cargar el archivo {filepath}: {e}")
+        for claves in filter(None, grupos):
+            atributos = [f"_{key}" for key in claves]
+            if "pagos" in claves:
+                atributos += ["_pagos_por_socio", "_libro_pagos", "_recaudacion"]
+            cargar = self._funcion_carga(claves, atributos, materializados)
+            if self._carga_perezosa:
+                carga = CargaPerezosa(cargar)
+                ColeccionPerezosa.instalar(carga, self._registry, atributos)
+                self._cargas.update(dict.fromkeys(claves, carga))
+                cargado = True
+            else:
+                cargado = cargar() or cargado
+        for key in self._filenames:
+            self._registry.marcar_guardada(key)
+        
+        if self._diario is not None:
+            self._registry.eliminar_observador(self._diario)
+            try:
+                aplicados = self._diario.reproducir(self._registry)
+            finally:
+                self._registry.agregar_observador(self._diario)
+            if aplicados:
+                obtener_salida().info(f"{aplicados} cambios reproducidos desde el diario")
+                cargado = True
         
         if not cargado:
-            print("[INFO] No se encontraron archivos de datos existentes.")
-
+            obtener_salida().info("No se encontraron archivos de datos existentes.")
+        
         return cargado
+    
+    def precargar(self):
+        """Carga de inmediato las colecciones que quedaron pendientes de carga diferida.
+        
+        Útil en procesos de larga duración, para pagar la lectura al arrancar y
+        no en la primera consulta.
+        """
+        self._cargar_colecciones(self._filenames)
+    
+    def _cargar_colecciones(self, claves):
+        """Ejecuta las cargas diferidas pendientes de las colecciones indicadas."""
+        for key in claves:
+            carga = self._cargas.pop(key, None)
+            if carga is not None:
+                carga.ejecutar()
+    
+    def _funcion_carga(self, claves: List[str], atributos: List[str], materializados: dict):
+        """Arma la función que restaura un grupo de colecciones en el registry.
+        
+        Args:
+            claves: Colecciones que se leen juntas.
+            atributos: Atributos del registry que ocupan (colecciones e índices).
+            materializados: Socios retirados compartidos entre los grupos.
+        
+        Returns:
+            Una función que retorna True si leyó al menos un archivo.
+        """
+        previos = {atributo: getattr(self._registry, atributo) for atributo in atributos}
+        
+        def cargar():
+            for atributo, valor in previos.items():
+                setattr(self._registry, atributo, valor)
+            if "pagos" in claves:
+                # Los pagos referencian a los socios: se restauran después del resto
+                self._cargar_colecciones([key for key in self._filenames if key not in claves])
+            contenidos, antiguos = self._leer_colecciones(claves)
+            if contenidos:
+                Instantanea.restaurar(self._registry, contenidos, materializados)
+                if "pagos" in claves:
+                    self._registry.reconstruir_indices()
+            for key in antiguos:
+                self._registry.marcar_modificada(key)
+            return bool(contenidos)
+        
+        return cargar
+    
+    def _leer_colecciones(self, claves: List[str]):
+        """Lee las instantáneas de las colecciones indicadas.
+        
+        Returns:
+            El contenido leído por colección y las colecciones que deben
+            reescribirse (formato anterior, o .dat con el formato binario).
+        """
+        contenidos = {}
+        antiguos = []
+        ruta_binaria = self._get_path(self.ARCHIVO_BINARIO)
+        if self._formato == self.FORMATO_BINARIO and os.path.exists(ruta_binaria):
+            try:
+                with open(ruta_binaria, "rb") as f, abrir_lectura(f) as origen:
+                    contenidos = FormatoBinario.leer(origen)
+                obtener_salida().info(f"Datos cargados desde {ruta_binaria}")
+            except (*ERRORES_LECTURA, ValueError, KeyError, struct.error) as e:
+                obtener_salida().error(f"No se pudo cargar el archivo {ruta_binaria}: {e}")
+        
+        for key in claves:
+            filepath = self._get_path(self._filenames[key])
+            if key not in contenidos and os.path.exists(filepath):
+                try:
+                    with open(filepath, "rb") as f, abrir_lectura(f) as origen:
+                        data = pickle.load(origen)
+                        if ArchivoBuffers.es_cabecera(data):
+                            data = ArchivoBuffers.cargar(origen, data, self._directorio)
+                    if not Instantanea.es_instantanea(data):
+                        registrados = ({registro[2] for registro in contenidos["socios"]["registros"]}
+                                       if "socios" in contenidos else self._registry._socios)
+                        data = Instantanea.codificar(key, data, registrados)
+                        antiguos.append(key)
+                    elif self._formato == self.FORMATO_BINARIO:
+                        antiguos.append(key)
+                    contenidos[key] = data
+                    obtener_salida().info(f"Datos de '{key}' cargados desde {filepath}")
+                except Exception as e:
+                    obtener_salida().error(f"No se pudo cargar el archivo {filepath}: {e}")
+        return contenidos, antiguos
+    
+    def migrar_datos(self) -> bool:
+        """Reescribe los archivos .dat guardados con versiones anteriores de las entidades.
+        
+        Los archivos antiguos (grafos de objetos completos, entidades con __dict__
+        y relaciones en listas) se convierten al cargarlos; al volver a guardarlos
+        quedan en el formato por referencias con entidades compactas.
+        
+        Returns:
+            True si había datos para migrar, False en caso contrario.
+        """
+        if not self.cargar_datos():
+            return False
+        for key in self._filenames:
+            self._registry.marcar_modificada(key)
+        self.guardar_datos(completo=True)
+        obtener_salida().info("Datos migrados al formato compacto de entidades")
+        return True
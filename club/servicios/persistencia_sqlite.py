@@ -0,0 +1,615 @@
+"""
+Servicio de Persistencia sobre SQLite.
+Guarda el estado del club en tablas normalizadas e indexadas y sirve las
+consultas de socios y pagos del ClubRegistry directamente desde SQL, sin
+cargar toda la información al iniciar.
+"""
+
+# Standard library imports
+import os
+import sqlite3
+from collections.abc import MutableMapping, Sequence
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Local application imports
+from club.entidades.actividad import Actividad
+from club.entidades.pago import Pago
+from club.entidades.profesor import Profesor
+from club.entidades.socio import Socio
+from club.entidades.torneo import Torneo
+from club.patrones.factory.socio_factory import SocioFactory
+from club.patrones.observer.observer import Observer
+from club.patrones.singleton.club_registry import ClubRegistry
+from club.salida import obtener_salida
+from club.servicios.diario_cambios import DiarioCambios
+from club.servicios.persistencia_service import PersistenciaService
+
+# Las columnas numéricas no declaran tipo para conservar enteros y flotantes tal cual
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS socios (
+    dni INTEGER PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    edad INTEGER,
+    fecha_registro REAL NOT NULL,
+    estado_pago TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS socios_retirados (
+    dni INTEGER PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    edad INTEGER,
+    fecha_registro REAL NOT NULL,
+    estado_pago TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS actividades (
+    clave TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    costo NOT NULL,
+    capacidad INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS profesores (
+    dni INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    sueldo NOT NULL
+);
+CREATE TABLE IF NOT EXISTS inscripciones (
+    actividad TEXT NOT NULL,
+    dni INTEGER NOT NULL,
+    UNIQUE (actividad, dni)
+);
+CREATE INDEX IF NOT EXISTS idx_inscripciones_dni ON inscripciones (dni);
+CREATE TABLE IF NOT EXISTS asignaciones (
+    actividad TEXT NOT NULL,
+    dni INTEGER NOT NULL,
+    UNIQUE (actividad, dni)
+);
+CREATE INDEX IF NOT EXISTS idx_asignaciones_dni ON asignaciones (dni);
+CREATE TABLE IF NOT EXISTS torneos (
+    id INTEGER PRIMARY KEY,
+    actividad TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    fecha TEXT NOT NULL,
+    costo_inscripcion NOT NULL,
+    fecha_creacion REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_torneos_actividad ON torneos (actividad, nombre);
+CREATE TABLE IF NOT EXISTS participantes (
+    torneo INTEGER NOT NULL,
+    dni INTEGER NOT NULL,
+    UNIQUE (torneo, dni)
+);
+CREATE INDEX IF NOT EXISTS idx_participantes_dni ON participantes (dni);
+CREATE TABLE IF NOT EXISTS pagos (
+    id INTEGER PRIMARY KEY,
+    dni INTEGER NOT NULL,
+    monto NOT NULL,
+    metodo TEXT NOT NULL,
+    fecha REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pagos_dni ON pagos (dni);
+CREATE INDEX IF NOT EXISTS idx_pagos_fecha ON pagos (fecha);
+CREATE INDEX IF NOT EXISTS idx_pagos_metodo ON pagos (metodo);
+"""
+
+_COLUMNAS_SOCIO = "dni, tipo, nombre, edad, fecha_registro, estado_pago"
+_COLUMNAS_PAGO = "dni, monto, metodo, fecha"
+
+
+class SociosSQLite(MutableMapping):
+    """
+    Diccionario de socios por DNI respaldado por la tabla `socios`.
+    
+    Funciona como mapa de identidad: cada socio se materializa una sola vez,
+    al consultarlo, y queda en memoria. Iterar el mapa carga los socios que
+    falten en una sola consulta. Las escrituras en la base las realiza
+    PersistenciaSQLiteService al recibir los eventos del registry; asignar o
+    quitar claves solo actualiza la memoria.
+    
+    Los socios eliminados que siguen referenciados por pagos o torneos pasan
+    a la tabla `socios_retirados`: no forman parte del mapa, pero se los
+    obtiene con obtener_retirado() para materializar esas referencias.
+    """
+    
+    def __init__(self, conexion: sqlite3.Connection):
+        self._conexion = conexion
+        self._cache: Dict[int, Socio] = {}
+        self._retirados: Dict[int, Socio] = {}
+        self._completo = False
+    
+    @staticmethod
+    def _materializar(fila: tuple) -> Socio:
+        dni, tipo, nombre, edad, fecha_registro, estado_pago = fila
+        return SocioFactory.restaurar_socio(tipo, nombre, dni, edad,
+                                            datetime.fromtimestamp(fecha_registro), estado_pago)
+    
+    def cargar_consulta(self, consulta: str, parametros: tuple = ()):
+        """Materializa de una vez los socios devueltos por una consulta sobre `socios`."""
+        for fila in self._conexion.execute(consulta, parametros):
+            if fila[0] not in self._cache:
+                self._cache[fila[0]] = self._materializar(fila)
+    
+    def cargar_retirados(self, consulta: str, parametros: tuple = ()):
+        """Materializa de una vez los socios devueltos por una consulta sobre `socios_retirados`."""
+        for fila in self._conexion.execute(consulta, parametros):
+            if fila[0] not in self._retirados:
+                self._retirados[fila[0]] = self._materializar(fila)
+    
+    def obtener_retirado(self, dni: int) -> Optional[Socio]:
+        """Retorna un socio eliminado que siguen referenciando pagos o torneos, o None."""
+        socio = self._retirados.get(dni)
+        if socio is None:
+            fila = self._conexion.execute(
+                f"SELECT {_COLUMNAS_SOCIO} FROM socios_retirados WHERE dni = ?", (dni,)).fetchone()
+            if fila is not None:
+                socio = self._retirados[dni] = self._materializar(fila)
+        return socio
+    
+    def _cargar_todos(self):
+        """Completa la memoria con todos los socios, en orden de registro."""
+        filas = self._conexion.execute(f"SELECT {_COLUMNAS_SOCIO} FROM socios ORDER BY rowid")
+        self._cache = {fila[0]: self._cache.get(fila[0]) or self._materializar(fila) for fila in filas}
+        self._completo = True
+    
+    def __getitem__(self, dni: int) -> Socio:
+        socio = self._cache.get(dni)
+        if socio is None:
+            if self._completo:
+                raise KeyError(dni)
+            fila = self._conexion.execute(
+                f"SELECT {_COLUMNAS_SOCIO} FROM socios WHERE dni = ?", (dni,)).fetchone()
+            if fila is None:
+                raise KeyError(dni)
+            socio = self._cache[dni] = self._materializar(fila)
+        return socio
+    
+    def __contains__(self, dni) -> bool:
+        if dni in self._cache:
+            return True
+        if self._completo:
+            return False
+        return self._conexion.execute("SELECT 1 FROM socios WHERE dni = ?", (dni,)).fetchone() is not None
+    
+    def __setitem__(self, dni: int, socio: Socio):
+        self._cache[dni] = socio
+    
+    def __delitem__(self, dni: int):
+        if dni not in self:
+            raise KeyError(dni)
+        socio = self._cache.pop(dni, None)
+        if socio is not None:
+            # Sus pagos y torneos siguen referenciando al mismo objeto
+            self._retirados[dni] = socio
+    
+    def __iter__(self) -> Iterator[int]:
+        if not self._completo:
+            self._cargar_todos()
+        return iter(self._cache)
+    
+    def __len__(self) -> int:
+        if self._completo:
+            return len(self._cache)
+        return self._conexion.execute("SELECT COUNT(*) FROM socios").fetchone()[0]
+    
+    def clear(self):
+        """Vacía la memoria; las filas se eliminan con el evento de reinicio."""
+        self._cache.clear()
+        self._completo = True
+    
+    def __reduce__(self):
+        # Al serializarse con pickle se convierte en un diccionario común
+        return dict, (dict(self),)
+
+
+class AlmacenPagosSQLite(Sequence):
+    """
+    Secuencia de pagos respaldada por la tabla `pagos`.
+    
+    Ofrece las mismas consultas que AlmacenPagosColumnar, resueltas con SQL
+    sobre los índices por DNI, fecha y método. Los pagos se materializan al
+    consultarlos y la inserción la realiza PersistenciaSQLiteService al
+    recibir el evento `pago_registrado`.
+    """
+    
+    def __init__(self, conexion: sqlite3.Connection,
+                 resolver_socio: Optional[Callable[[int], Optional[Socio]]] = None,
+                 resolver_retirado: Optional[Callable[[int], Optional[Socio]]] = None):
+        self._conexion = conexion
+        self._resolver_socio = resolver_socio
+        # Obtiene los socios eliminados que siguen referenciados por sus pagos
+        self._resolver_retirado = resolver_retirado
+        self._cantidad: Optional[int] = None
+    
+    def asignar_resolver(self, resolver_socio: Callable[[int], Optional[Socio]]):
+        """Asigna la función usada para obtener el socio de cada pago."""
+        self._resolver_socio = resolver_socio
+    
+    # --- Escritura ---
+    
+    def append(self, pago: Pago):
+        """Contabiliza un pago nuevo; la fila se inserta con el evento del registry."""
+        if self._cantidad is not None:
+            self._cantidad += 1
+    
+    def clear(self):
+        """Vacía el almacén; las filas se eliminan con el evento de reinicio."""
+        self._cantidad = 0
+    
+    # --- Secuencia ---
+    
+    def __len__(self) -> int:
+        if self._cantidad is None:
+            self._cantidad = self._conexion.execute("SELECT COUNT(*) FROM pagos").fetchone()[0]
+        return self._cantidad
+    
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            inicio, fin, paso = indice.indices(len(self))
+            if paso != 1:
+                return [self[i] for i in range(inicio, fin, paso)]
+            return self._consultar(f"SELECT {_COLUMNAS_PAGO} FROM pagos ORDER BY id LIMIT ? OFFSET ?",
+                                   (max(fin - inicio, 0), inicio))
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de pago fuera de rango")
+        return self._consultar(f"SELECT {_COLUMNAS_PAGO} FROM pagos ORDER BY id LIMIT 1 OFFSET ?",
+                               (indice,))[0]
+    
+    def __iter__(self) -> Iterator[Pago]:
+        for fila in self._conexion.execute(f"SELECT {_COLUMNAS_PAGO} FROM pagos ORDER BY id"):
+            yield self._materializar(fila)
+    
+    def filas(self) -> Iterator[tuple]:
+        """Recorre los pagos como tuplas (dni, monto, metodo, timestamp) sin materializar objetos Pago."""
+        return iter(self._conexion.execute(f"SELECT {_COLUMNAS_PAGO} FROM pagos ORDER BY id"))
+    
+    def _materializar(self, fila: tuple) -> Pago:
+        """Construye el objeto Pago de una fila sin recalcular su comprobante."""
+        dni, monto, metodo, timestamp = fila
+        socio = self._resolver_socio(dni) if self._resolver_socio else None
+        if socio is None and self._resolver_retirado is not None:
+            socio = self._resolver_retirado(dni)
+        return Pago.restaurar(socio, monto, metodo, datetime.fromtimestamp(timestamp),
+                              f"PAGO-{dni}-{int(timestamp)}")
+    
+    def _consultar(self, consulta: str, parametros: tuple = ()) -> List[Pago]:
+        return [self._materializar(fila) for fila in self._conexion.execute(consulta, parametros)]
+    
+    # --- Consultas por socio y por fecha ---
+    
+    def pagos_socio(self, dni: int) -> List[Pago]:
+        """Retorna los pagos de un socio usando el índice por DNI."""
+        return self._consultar(f"SELECT {_COLUMNAS_PAGO} FROM pagos WHERE dni = ? ORDER BY id", (dni,))
+    
+    def entre(self, desde: datetime, hasta: datetime) -> List[Pago]:
+        """Retorna los pagos con fecha en el intervalo [desde, hasta]."""
+        return self._consultar(f"SELECT {_COLUMNAS_PAGO} FROM pagos WHERE fecha BETWEEN ? AND ? "
+                               "ORDER BY fecha, id", (desde.timestamp(), hasta.timestamp()))
+    
+    def del_mes(self, anio: int, mes: int) -> List[Pago]:
+        """Retorna los pagos realizados en un mes calendario."""
+        return self._consultar(f"SELECT {_COLUMNAS_PAGO} FROM pagos WHERE fecha >= ? AND fecha < ? "
+                               "ORDER BY fecha, id", self._limites_mes(anio, mes))
+    
+    def ultimos(self, cantidad: int) -> List[Pago]:
+        """Retorna los últimos pagos en orden cronológico."""
+        if cantidad <= 0:
+            return []
+        pagos = self._consultar(f"SELECT {_COLUMNAS_PAGO} FROM pagos ORDER BY fecha DESC, id DESC LIMIT ?",
+                                (cantidad,))
+        pagos.reverse()
+        return pagos
+    
+    @staticmethod
+    def _limites_mes(anio: int, mes: int) -> tuple:
+        desde = datetime(anio, mes, 1)
+        hasta = datetime(anio + 1, 1, 1) if mes == 12 else datetime(anio, mes + 1, 1)
+        return desde.timestamp(), hasta.timestamp()
+    
+    # --- Agregados ---
+    
+    def _escalar(self, consulta: str, parametros: tuple = ()):
+        return self._conexion.execute(consulta, parametros).fetchone()[0]
+    
+    @property
+    def total(self) -> float:
+        return self._escalar("SELECT COALESCE(SUM(monto), 0) FROM pagos")
+    
+    @property
+    def cantidad(self) -> int:
+        return len(self)
+    
+    @property
+    def por_metodo(self) -> Dict[str, float]:
+        return dict(self._conexion.execute(
+            "SELECT metodo, SUM(monto) FROM pagos GROUP BY metodo ORDER BY MIN(id)"))
+    
+    def total_socio(self, dni: int) -> float:
+        """Retorna el total pagado por un socio."""
+        return self._escalar("SELECT COALESCE(SUM(monto), 0) FROM pagos WHERE dni = ?", (dni,))
+    
+    def totales_por_socio(self) -> Dict[int, float]:
+        """Retorna el total pagado por cada socio en una sola consulta."""
+        return dict(self._conexion.execute("SELECT dni, SUM(monto) FROM pagos GROUP BY dni"))
+    
+    def total_mes(self, anio: int, mes: int) -> float:
+        """Retorna el total recaudado en un mes calendario."""
+        return self._escalar("SELECT COALESCE(SUM(monto), 0) FROM pagos WHERE fecha >= ? AND fecha < ?",
+                             self._limites_mes(anio, mes))
+    
+    def __reduce__(self):
+        # Al serializarse con pickle se convierte en una lista común de pagos
+        return list, (list(self),)
+
+
+class PersistenciaSQLiteService(Observer):
+    """
+    Servicio de persistencia que guarda el ClubRegistry en una base SQLite.
+    
+    Cada cambio del registry se aplica sobre la base en cuanto ocurre, dentro
+    de una transacción que guardar_datos confirma. Al cargar, las actividades,
+    profesores y torneos (colecciones chicas) se leen completos junto con los
+    socios que participan de ellos; el resto de los socios y todos los pagos
+    se consultan en la base a medida que se los pide.
+    """
+    
+    def __init__(self, ruta: str = os.path.join("data", "club.db"), directorio_pickle: Optional[str] = None):
+        """Inicializa el servicio y crea el esquema si la base no existe.
+        
+        Args:
+            ruta: Ruta del archivo de la base de datos.
+            directorio_pickle: Directorio con archivos .dat a importar cuando la
+                base está vacía (por defecto, el directorio de la base).
+        """
+        self._ruta = ruta
+        self._directorio_pickle = directorio_pickle or os.path.dirname(ruta) or "."
+        self._registry = ClubRegistry.get_instance()
+        directorio = os.path.dirname(ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        self._conexion = sqlite3.connect(ruta)
+        self._conexion.executescript(ESQUEMA)
+        self._conectado = False
+        self._registry.agregar_observador(self)
+    
+    # --- Escritura incremental ---
+    
+    def actualizar(self, evento: str, datos: dict):
+        """Aplica sobre la base un cambio del registry."""
+        registro = DiarioCambios.codificar(evento, datos)
+        if registro is None:
+            return
+        try:
+            self._aplicar(registro[0], registro[1:])
+        except sqlite3.Error as e:
+            obtener_salida().error(f"No se pudo aplicar el cambio '{evento}' en la base: {e}")
+    
+    def _aplicar(self, operacion: str, argumentos: list):
+        """Traduce un registro del diario a sentencias SQL."""
+        ejecutar = self._conexion.execute
+        if operacion == "socio+":
+            tipo, nombre, dni, edad, fecha_registro, estado_pago = argumentos
+            ejecutar("INSERT INTO socios VALUES (?, ?, ?, ?, ?, ?)",
+                     (dni, tipo, nombre, edad, fecha_registro, estado_pago))
+            ejecutar("DELETE FROM socios_retirados WHERE dni = ?", (dni,))
+        elif operacion == "socio-":
+            # Las inscripciones se quitan con sus propios eventos; si tiene pagos
+            # o torneos se conserva como retirado, igual que el registry en memoria
+            ejecutar(f"INSERT OR REPLACE INTO socios_retirados SELECT {_COLUMNAS_SOCIO} FROM socios "
+                     "WHERE dni = ? AND (EXISTS (SELECT 1 FROM pagos WHERE pagos.dni = socios.dni) "
+                     "OR EXISTS (SELECT 1 FROM participantes WHERE participantes.dni = socios.dni))",
+                     (argumentos[0],))
+            ejecutar("DELETE FROM socios WHERE dni = ?", (argumentos[0],))
+        elif operacion == "actividad+":
+            nombre, costo, capacidad = argumentos
+            ejecutar("INSERT INTO actividades VALUES (?, ?, ?, ?)", (nombre.lower(), nombre, costo, capacidad))
+        elif operacion == "actividad-":
+            clave = argumentos[0].lower()
+            ejecutar("DELETE FROM participantes WHERE torneo IN (SELECT id FROM torneos WHERE actividad = ?)",
+                     (clave,))
+            ejecutar("DELETE FROM torneos WHERE actividad = ?", (clave,))
+            ejecutar("DELETE FROM inscripciones WHERE actividad = ?", (clave,))
+            ejecutar("DELETE FROM asignaciones WHERE actividad = ?", (clave,))
+            ejecutar("DELETE FROM actividades WHERE clave = ?", (clave,))
+        elif operacion == "profesor+":
+            ejecutar("INSERT INTO profesores VALUES (?, ?, ?)", (argumentos[1], argumentos[0], argumentos[2]))
+        elif operacion == "profesor-":
+            ejecutar("DELETE FROM profesores WHERE dni = ?", (argumentos[0],))
+            ejecutar("DELETE FROM asignaciones WHERE dni = ?", (argumentos[0],))
+        elif operacion == "sueldo":
+            ejecutar("UPDATE profesores SET sueldo = ? WHERE dni = ?", (argumentos[1], argumentos[0]))
+        elif operacion == "inscripcion":
+            ejecutar("INSERT OR IGNORE INTO inscripciones VALUES (?, ?)", (argumentos[0].lower(), argumentos[1]))
+        elif operacion == "desinscripcion":
+            ejecutar("DELETE FROM inscripciones WHERE actividad = ? AND dni = ?",
+                     (argumentos[0].lower(), argumentos[1]))
+        elif operacion == "asignacion":
+            ejecutar("INSERT OR IGNORE INTO asignaciones VALUES (?, ?)", (argumentos[0].lower(), argumentos[1]))
+        elif operacion == "desasignacion":
+            ejecutar("DELETE FROM asignaciones WHERE actividad = ? AND dni = ?",
+                     (argumentos[0].lower(), argumentos[1]))
+        elif operacion == "torneo":
+            actividad, nombre, fecha, costo, fecha_creacion = argumentos
+            ejecutar("INSERT INTO torneos (actividad, nombre, fecha, costo_inscripcion, fecha_creacion) "
+                     "VALUES (?, ?, ?, ?, ?)", (actividad.lower(), nombre, fecha, costo, fecha_creacion))
+        elif operacion == "participante":
+            actividad, torneo, dni = argumentos
+            ejecutar("INSERT OR IGNORE INTO participantes SELECT id, ? FROM torneos "
+                     "WHERE actividad = ? AND nombre = ? ORDER BY id LIMIT 1", (dni, actividad.lower(), torneo))
+        elif operacion == "pago":
+            ejecutar(f"INSERT INTO pagos ({_COLUMNAS_PAGO}) VALUES (?, ?, ?, ?)", argumentos)
+        elif operacion == "estado_pago":
+            ejecutar("UPDATE socios SET estado_pago = ? WHERE dni = ?", (argumentos[1], argumentos[0]))
+        elif operacion == "reinicio":
+            self._vaciar()
+    
+    def _vaciar(self):
+        for tabla in ("participantes", "torneos", "inscripciones", "asignaciones",
+                      "pagos", "socios", "socios_retirados", "actividades", "profesores"):
+            self._conexion.execute(f"DELETE FROM {tabla}")
+    
+    def _volcar_registry(self):
+        """Reemplaza el contenido de la base por el del registry en memoria."""
+        registry = self._registry
+        self._vaciar()
+        ejecutar_lote = self._conexion.executemany
+        ejecutar_lote("INSERT OR IGNORE INTO socios VALUES (?, ?, ?, ?, ?, ?)",
+                      map(self._fila_socio, registry.listar_socios()))
+        ejecutar_lote("INSERT OR IGNORE INTO profesores VALUES (?, ?, ?)", (
+            (p.dni, p.nombre, p.sueldo) for p in registry.listar_profesores()))
+        actividades = registry.listar_actividades()
+        ejecutar_lote("INSERT OR IGNORE INTO actividades VALUES (?, ?, ?, ?)", (
+            (a.nombre.lower(), a.nombre, a.costo, a.capacidad) for a in actividades))
+        ejecutar_lote("INSERT OR IGNORE INTO asignaciones VALUES (?, ?)", (
+            (a.nombre.lower(), p.dni) for a in actividades for p in a.profesores))
+        # Las inscripciones se insertan en el orden en que cada socio se anotó
+        ejecutar_lote("INSERT OR IGNORE INTO inscripciones VALUES (?, ?)", (
+            (a.nombre.lower(), s.dni) for s in registry.listar_socios() for a in s.actividades))
+        # Socios eliminados que siguen referenciados por torneos o pagos
+        retirados: Dict[int, Socio] = {}
+        
+        def referencia(socio: Socio) -> int:
+            if registry.obtener_socio(socio.dni) is None:
+                retirados.setdefault(socio.dni, socio)
+            return socio.dni
+        
+        for actividad in actividades:
+            for torneo in actividad.torneos:
+                cursor = self._conexion.execute(
+                    "INSERT INTO torneos (actividad, nombre, fecha, costo_inscripcion, fecha_creacion) "
+                    "VALUES (?, ?, ?, ?, ?)", (actividad.nombre.lower(), torneo.nombre, torneo.fecha,
+                                               torneo.costo_inscripcion, torneo._fecha_creacion.timestamp()))
+                ejecutar_lote("INSERT OR IGNORE INTO participantes VALUES (?, ?)", (
+                    (cursor.lastrowid, referencia(s)) for s in torneo.participantes))
+        ejecutar_lote(f"INSERT INTO pagos ({_COLUMNAS_PAGO}) VALUES (?, ?, ?, ?)", (
+            (referencia(p.socio), p.monto, p.metodo, p.fecha.timestamp()) for p in registry.listar_pagos()))
+        ejecutar_lote("INSERT INTO socios_retirados VALUES (?, ?, ?, ?, ?, ?)",
+                      map(self._fila_socio, retirados.values()))
+    
+    @staticmethod
+    def _fila_socio(socio: Socio) -> tuple:
+        return (socio.dni, socio.get_tipo().lower(), socio.nombre, getattr(socio, 'edad', None),
+                socio.fecha_registro.timestamp(), socio.estado_pago)
+    
+    # --- Interfaz de persistencia ---
+    
+    def guardar_datos(self, completo: bool = False):
+        """Confirma en la base los cambios aplicados desde el último guardado.
+        
+        Args:
+            completo: Reescribe la base completa a partir del registry en memoria
+                (sin efecto si el registry ya lee sus colecciones de la base).
+        """
+        try:
+            if completo and not self._conectado:
+                self._volcar_registry()
+            self._conexion.commit()
+            for coleccion in ClubRegistry.COLECCIONES:
+                self._registry.marcar_guardada(coleccion)
+            obtener_salida().info(f"Datos guardados exitosamente en la base '{self._ruta}'")
+        except sqlite3.Error as e:
+            self._conexion.rollback()
+            obtener_salida().error(f"No se pudieron guardar los datos: {e}")
+    
+    def cargar_datos(self) -> bool:
+        """Conecta el ClubRegistry a la base de datos.
+        
+        Si la base está vacía y existen archivos .dat, se importan primero.
+        
+        Returns:
+            True si la base contenía datos, False en caso contrario.
+        """
+        if self._base_vacia() and not self.importar_pickle(self._directorio_pickle):
+            obtener_salida().info("No se encontraron archivos de datos existentes.")
+            return False
+        self._conectar_registry()
+        obtener_salida().info(f"Datos cargados desde la base '{self._ruta}'")
+        return True
+    
+    def importar_pickle(self, directorio: str = "data") -> bool:
+        """Importa a la base los archivos .dat generados por PersistenciaService.
+        
+        Args:
+            directorio: Directorio que contiene los archivos .dat.
+        
+        Returns:
+            True si se importaron datos, False si no había archivos.
+        """
+        self._registry.eliminar_observador(self)
+        try:
+            if not PersistenciaService(directorio).cargar_datos():
+                return False
+            self._volcar_registry()
+            self._conexion.commit()
+        except sqlite3.Error as e:
+            self._conexion.rollback()
+            obtener_salida().error(f"No se pudieron importar los datos: {e}")
+            return False
+        finally:
+            self._registry.agregar_observador(self)
+        obtener_salida().info(f"Archivos .dat de '{directorio}' importados a la base '{self._ruta}'")
+        return True
+    
+    def cerrar(self):
+        """Confirma los cambios pendientes y cierra la conexión."""
+        self._registry.eliminar_observador(self)
+        self._conexion.commit()
+        self._conexion.close()
+    
+    # --- Carga ---
+    
+    def _base_vacia(self) -> bool:
+        return all(self._conexion.execute(f"SELECT 1 FROM {tabla} LIMIT 1").fetchone() is None
+                   for tabla in ("socios", "actividades", "profesores", "pagos"))
+    
+    def _conectar_registry(self):
+        """Reemplaza las colecciones del registry por las respaldadas en la base."""
+        registry = self._registry
+        ejecutar = self._conexion.execute
+        socios = SociosSQLite(self._conexion)
+        profesores = {dni: Profesor(nombre, dni, sueldo) for dni, nombre, sueldo in
+                      ejecutar("SELECT dni, nombre, sueldo FROM profesores ORDER BY rowid")}
+        actividades = {clave: Actividad(nombre, costo, capacidad) for clave, nombre, costo, capacidad in
+                       ejecutar("SELECT clave, nombre, costo, capacidad FROM actividades ORDER BY rowid")}
+        for clave, dni in ejecutar("SELECT actividad, dni FROM asignaciones ORDER BY rowid"):
+            actividad, profesor = actividades.get(clave), profesores.get(dni)
+            if actividad is not None and profesor is not None:
+                actividad.agregar_profesor(profesor)
+                profesor.asignar_actividad(actividad)
+        
+        # Los socios con inscripciones o torneos se materializan juntos para armar el grafo
+        socios.cargar_consulta(
+            f"SELECT {_COLUMNAS_SOCIO} FROM socios WHERE dni IN "
+            "(SELECT dni FROM inscripciones UNION SELECT dni FROM participantes) ORDER BY rowid")
+        for clave, dni in ejecutar("SELECT actividad, dni FROM inscripciones ORDER BY rowid"):
+            actividad, socio = actividades.get(clave), socios.get(dni)
+            if actividad is not None and socio is not None:
+                actividad.inscribir_socio(socio)
+                socio.agregar_actividad(actividad)
+        torneos = {}
+        for id_torneo, clave, nombre, fecha, costo, fecha_creacion in ejecutar(
+                "SELECT id, actividad, nombre, fecha, costo_inscripcion, fecha_creacion FROM torneos ORDER BY id"):
+            actividad = actividades.get(clave)
+            if actividad is None:
+                continue
+            torneo = Torneo(nombre, actividad, fecha, costo)
+            torneo._fecha_creacion = datetime.fromtimestamp(fecha_creacion)
+            actividad.agregar_torneo(torneo)
+            torneos[id_torneo] = torneo
+        socios.cargar_retirados(f"SELECT {_COLUMNAS_SOCIO} FROM socios_retirados WHERE dni IN "
+                                "(SELECT dni FROM participantes)")
+        for id_torneo, dni in ejecutar("SELECT torneo, dni FROM participantes ORDER BY rowid"):
+            torneo, socio = torneos.get(id_torneo), socios.get(dni) or socios.obtener_retirado(dni)
+            if torneo is not None and socio is not None:
+                torneo.inscribir_participante(socio)
+        
+        registry._socios = socios
+        registry._actividades = actividades
+        registry._profesores = profesores
+        registry._pagos = AlmacenPagosSQLite(self._conexion, resolver_retirado=socios.obtener_retirado)
+        registry.reconstruir_indices()
+        for coleccion in ClubRegistry.COLECCIONES:
+            registry.marcar_guardada(coleccion)
+        self._conectado = True
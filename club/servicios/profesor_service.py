@@ -7,6 +7,7 @@ Encapsula la lógica de negocio relacionada con profesores.
 from typing import List, Optional
 
 # Local application imports
+from club.salida import obtener_salida
 from club.entidades.profesor import Profesor
 from club.excepciones import ProfesorNoEncontradoError, ProfesorYaExisteError
 from club.patrones.singleton.club_registry import ClubRegistry
@@ -26,10 +27,10 @@ class ProfesorService:
         try:
             profesor = Profesor(nombre, dni, sueldo)
             self.registrar_profesor(profesor)
-            print(f"[INFO] Profesor {profesor.nombre} registrado exitosamente (DNI: {profesor.dni})")
+            obtener_salida().info(f"Profesor {profesor.nombre} registrado exitosamente (DNI: {profesor.dni})")
             return profesor
         except (ValueError, ProfesorYaExisteError) as e:
-            print(f"[ERROR] No se pudo crear el profesor: {e}")
+            obtener_salida().error(f"No se pudo crear el profesor: {e}")
             return None
     
     def registrar_profesor(self, profesor: Profesor):
@@ -55,15 +56,15 @@ class ProfesorService:
         try:
             profesor = self.obtener_profesor(dni)
             # Desasignar de todas las actividades
-            for actividad in list(profesor.actividades):
-                actividad.eliminar_profesor(profesor)
+            for actividad in profesor.actividades.copia():
+                self._registry.desasignar_profesor(actividad, profesor)
             
             if self._registry.eliminar_profesor(dni):
-                print(f"[INFO] Profesor {profesor.nombre} eliminado del sistema")
+                obtener_salida().info(f"Profesor {profesor.nombre} eliminado del sistema")
                 return True
             return False
         except ProfesorNoEncontradoError as e:
-            print(f"[ERROR] {e}")
+            obtener_salida().error(str(e))
             return False
 
     def modificar_sueldo(self, dni: int, nuevo_sueldo: float) -> bool:
@@ -71,28 +72,26 @@ class ProfesorService:
         try:
             profesor = self.obtener_profesor(dni)
             sueldo_anterior = profesor.sueldo
-            profesor.sueldo = nuevo_sueldo
-            print(f"[INFO] Sueldo de {profesor.nombre} actualizado: ${sueldo_anterior} -> ${nuevo_sueldo}")
+            self._registry.modificar_sueldo_profesor(profesor, nuevo_sueldo)
+            obtener_salida().info(f"Sueldo de {profesor.nombre} actualizado: ${sueldo_anterior} -> ${nuevo_sueldo}")
             return True
         except (ProfesorNoEncontradoError, ValueError) as e:
-            print(f"[ERROR] {e}")
+            obtener_salida().error(str(e))
             return False
 
     def mostrar_info_profesor(self, dni: int):
         """Muestra información completa de un profesor."""
         try:
             profesor = self.obtener_profesor(dni)
-            print("\n" + "="*60)
-            print(str(profesor))
-            print("="*60 + "\n")
+            obtener_salida().mostrar("\n".join(["\n" + "="*60, str(profesor), "="*60 + "\n"]))
         except ProfesorNoEncontradoError as e:
-            print(f"[ERROR] {e}")
+            obtener_salida().error(str(e))
     
     def calcular_nomina_total(self) -> float:
         """Calcula el total de la nómina de todos los profesores."""
         profesores = self.listar_profesores()
         total = sum(p.sueldo for p in profesores)
-        print(f"[INFO] Nómina total de profesores: ${total}")
+        obtener_salida().info(f"Nómina total de profesores: ${total}")
         return total
     
     def listar_profesores_por_actividad(self, nombre_actividad: str) -> List[Profesor]:
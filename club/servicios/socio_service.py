@@ -4,10 +4,18 @@ Encapsula la lógica de negocio relacionada con socios.
 """
 
 # Standard library imports
-from typing import List, Optional
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Third party imports (opcional)
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
 
 # Local application imports
-from club.entidades.socio import Socio
+from club.salida import obtener_salida
+from club.entidades.socio import Socio, SocioPremium, SocioInfantil
 from club.excepciones import SocioNoEncontradoError, SocioYaExisteError
 from club.patrones.factory.socio_factory import SocioFactory
 from club.patrones.singleton.club_registry import ClubRegistry
@@ -25,6 +33,13 @@ class SocioService:
     Servicio para operaciones CRUD y lógica de negocio de socios.
     """
     
+    # Las estrategias no tienen estado, por lo que se comparten entre cálculos
+    _ESTRATEGIAS = {
+        'regular': CuotaRegularStrategy(),
+        'premium': CuotaPremiumStrategy(),
+        'infantil': CuotaInfantilStrategy(),
+    }
+    
     def __init__(self):
         self._registry = ClubRegistry.get_instance()
     
@@ -33,12 +48,74 @@ class SocioService:
         try:
             socio = SocioFactory.crear_socio(tipo, nombre, dni, edad)
             self.registrar_socio(socio)
-            print(f"[INFO] Socio {socio.nombre} registrado exitosamente (DNI: {socio.dni})")
+            obtener_salida().info(f"Socio {socio.nombre} registrado exitosamente (DNI: {socio.dni})")
             return socio
         except (ValueError, SocioYaExisteError) as e:
-            print(f"[ERROR] No se pudo crear el socio: {e}")
+            obtener_salida().error(f"No se pudo crear el socio: {e}")
             return None
     
+    def crear_socios_lote(self, filas: Iterable[Any]) -> Dict[str, Any]:
+        """Crea y registra muchos socios en una sola operación (todo o nada).
+
+        Cada fila puede ser un diccionario con las claves 'tipo', 'nombre', 'dni'
+        y opcionalmente 'edad' (por ejemplo, de csv.DictReader), o una secuencia
+        (tipo, nombre, dni[, edad]) como las de csv.reader. Todas las filas se
+        validan con las reglas de SocioFactory y se controlan los DNIs duplicados
+        contra el registro y dentro del propio lote. Si alguna fila es inválida
+        no se registra ningún socio.
+
+        Args:
+            filas: Iterable con los datos de los socios a crear.
+
+        Returns:
+            Un diccionario con el resumen: 'confirmado', 'total', 'creados',
+            'socios' (creados) y 'errores' (lista de {'fila', 'dni', 'error'}).
+        """
+        socios: List[Socio] = []
+        errores: List[Dict[str, Any]] = []
+        dnis_lote = set()
+        total = 0
+        for numero, fila in enumerate(filas, 1):
+            total = numero
+            dni = None
+            try:
+                tipo, nombre, dni, edad = self._normalizar_fila(fila)
+                if dni in dnis_lote:
+                    raise SocioYaExisteError(f"DNI {dni} repetido dentro del lote")
+                if self._registry.obtener_socio(dni) is not None:
+                    raise SocioYaExisteError(f"Socio con DNI {dni} ya existe")
+                dnis_lote.add(dni)
+                socios.append(SocioFactory.crear_socio(tipo, nombre, dni, edad))
+            except (ValueError, TypeError, KeyError, SocioYaExisteError) as e:
+                errores.append({'fila': numero, 'dni': dni, 'error': str(e)})
+        
+        confirmado = not errores
+        if confirmado:
+            self._registry.registrar_socios(socios)
+            obtener_salida().info(f"Lote de socios registrado: {len(socios)} socios creados")
+        else:
+            obtener_salida().error(f"Lote de socios rechazado: {len(errores)} filas con errores de {total}")
+        return {
+            'confirmado': confirmado,
+            'total': total,
+            'creados': len(socios) if confirmado else 0,
+            'socios': socios if confirmado else [],
+            'errores': errores
+        }
+    
+    @staticmethod
+    def _normalizar_fila(fila: Any) -> tuple:
+        """Convierte una fila (diccionario o secuencia) en (tipo, nombre, dni, edad)."""
+        if isinstance(fila, dict):
+            tipo, nombre, dni, edad = fila['tipo'], fila['nombre'], fila['dni'], fila.get('edad')
+        else:
+            if not 3 <= len(fila) <= 4:
+                raise ValueError(f"Se esperaban 3 o 4 columnas y se recibieron {len(fila)}")
+            tipo, nombre, dni = fila[0], fila[1], fila[2]
+            edad = fila[3] if len(fila) == 4 else None
+        edad = int(edad) if edad not in (None, '') else None
+        return str(tipo), str(nombre).strip(), int(dni), edad
+    
     def registrar_socio(self, socio: Socio):
         """Registra un socio en el sistema."""
         try:
@@ -67,14 +144,17 @@ class SocioService:
                 dni=socio_actual.dni,
                 edad=nueva_edad
             )
-            for actividad in socio_actual.actividades:
-                nuevo_socio.agregar_actividad(actividad)
+            actividades = socio_actual.actividades.copia()
+            for actividad in actividades:
+                self._registry.desinscribir_socio(actividad, socio_actual)
             self._registry.eliminar_socio(dni)
             self._registry.registrar_socio(nuevo_socio)
-            print(f"[INFO] Socio {socio_actual.nombre} modificado a tipo '{nuevo_tipo.capitalize()}'")
+            for actividad in actividades:
+                self._registry.inscribir_socio(actividad, nuevo_socio)
+            obtener_salida().info(f"Socio {socio_actual.nombre} modificado a tipo '{nuevo_tipo.capitalize()}'")
             return nuevo_socio
         except (SocioNoEncontradoError, ValueError) as e:
-            print(f"[ERROR] No se pudo modificar el socio: {e}")
+            obtener_salida().error(f"No se pudo modificar el socio: {e}")
             return None
 
     def eliminar_socio(self, dni: int) -> bool:
@@ -87,33 +167,86 @@ class SocioService:
                 for actividad in list(socio.actividades):
                     actividad_service.desinscribir_socio(actividad, socio)
             if self._registry.eliminar_socio(dni):
-                print(f"[INFO] Socio {socio.nombre} eliminado del sistema")
+                obtener_salida().info(f"Socio {socio.nombre} eliminado del sistema")
                 return True
         except SocioNoEncontradoError as e:
-            print(f"[ERROR] {e}")
+            obtener_salida().error(str(e))
             return False
         return False
     
     def _get_strategy_for_socio(self, socio: Socio):
         """Selecciona la estrategia de cuota apropiada para un socio."""
-        tipo = socio.get_tipo().lower()
-        if tipo == 'regular':
-            return CuotaRegularStrategy()
-        elif tipo == 'premium':
-            return CuotaPremiumStrategy()
-        elif tipo == 'infantil':
-            return CuotaInfantilStrategy()
-        return None
+        return self._ESTRATEGIAS.get(socio.get_tipo().lower())
 
     def calcular_cuota(self, socio: Socio) -> float:
         """Calcula la cuota mensual del socio."""
         estrategia = self._get_strategy_for_socio(socio)
         if estrategia is None:
-            print(f"[ERROR] No hay estrategia definida para tipo '{socio.get_tipo()}'")
+            obtener_salida().error(f"No hay estrategia definida para tipo '{socio.get_tipo()}'")
             return 0.0
         contexto = ContextoCuota(estrategia)
         return contexto.calcular_cuota(socio)
     
+    def calcular_cuotas_masivas(self, socios: Optional[Iterable[Socio]] = None,
+                                filtro: Optional[Callable[[Socio], bool]] = None) -> Dict[int, float]:
+        """Calcula la cuota mensual de muchos socios en una sola pasada.
+
+        Agrupa a los socios por tipo: a premium e infantiles se les asigna la
+        cuota fija correspondiente, y para los regulares se suman los costos de
+        sus actividades a partir de un vector de costos calculado una única vez.
+
+        Args:
+            socios: Socios a facturar (por defecto, todos los registrados).
+            filtro: Función opcional para seleccionar un subconjunto de socios.
+
+        Returns:
+            Un diccionario DNI -> cuota, en el orden de los socios recibidos.
+        """
+        if socios is None:
+            socios = self._registry.listar_socios()
+        if filtro is not None:
+            socios = [s for s in socios if filtro(s)]
+        cuotas_fijas = {'premium': SocioPremium.CUOTA_FIJA, 'infantil': SocioInfantil.CUOTA_FIJA}
+        cuotas: Dict[int, float] = {}
+        regulares: List[Socio] = []
+        for socio in socios:
+            tipo = socio.get_tipo().lower()
+            if tipo == 'regular':
+                regulares.append(socio)
+                cuotas[socio.dni] = 0
+            else:
+                cuotas[socio.dni] = cuotas_fijas.get(tipo, 0.0)
+        if regulares:
+            for socio, cuota in zip(regulares, self._sumar_costos_actividades(regulares)):
+                cuotas[socio.dni] = cuota
+        return cuotas
+    
+    @staticmethod
+    def _sumar_costos_actividades(socios: List[Socio]) -> List[float]:
+        """Suma el costo de las actividades de cada socio usando un vector de costos."""
+        posiciones: Dict['Actividad', int] = {}
+        costos: List[float] = []
+        duenos = array('q')
+        indices = array('q')
+        for numero, socio in enumerate(socios):
+            for actividad in socio.actividades:
+                posicion = posiciones.get(actividad)
+                if posicion is None:
+                    posicion = posiciones[actividad] = len(costos)
+                    costos.append(actividad.costo)
+                duenos.append(numero)
+                indices.append(posicion)
+        if np is not None:
+            vector_costos = np.asarray(costos, dtype=np.float64)
+            totales = np.bincount(np.frombuffer(duenos, dtype=np.int64),
+                                  weights=vector_costos[np.frombuffer(indices, dtype=np.int64)],
+                                  minlength=len(socios))
+            return totales.tolist()
+        totales = [0] * len(socios)
+        for dueno, indice in zip(duenos, indices):
+            totales[dueno] += costos[indice]
+        return totales
+    
     def obtener_descripcion_cuota(self, socio: Socio) -> str:
         """Obtiene la descripción detallada del cálculo de cuota."""
         estrategia = self._get_strategy_for_socio(socio)
@@ -126,19 +259,24 @@ class SocioService:
         """Muestra información completa de un socio."""
         try:
             socio = self.obtener_socio(dni)
-            print("\n" + "="*60)
-            print(str(socio))
-            print("\nDetalle de cuota:")
-            print(self.obtener_descripcion_cuota(socio))
-            print("="*60 + "\n")
+            salida = obtener_salida()
+            if not salida.habilitado():
+                return
+            salida.mostrar("\n".join([
+                "\n" + "="*60,
+                str(socio),
+                "\nDetalle de cuota:",
+                self.obtener_descripcion_cuota(socio),
+                "="*60 + "\n"
+            ]))
         except SocioNoEncontradoError as e:
-            print(f"[ERROR] {e}")
+            obtener_salida().error(str(e))
     
     def listar_socios_por_tipo(self, tipo: str) -> List[Socio]:
         """Lista socios filtrados por tipo."""
         tipo_lower = tipo.lower().strip()
         if tipo_lower not in ["regular", "premium", "infantil"]:
-            print(f"[ERROR] Tipo de socio inválido: '{tipo}'")
+            obtener_salida().error(f"Tipo de socio inválido: '{tipo}'")
             return []
         todos = self.listar_socios()
         return [s for s in todos if s.get_tipo().lower() == tipo_lower]
\ No newline at end of file
@@ -83,6 +83,7 @@ def demostracion_y_creacion_de_datos():
 
     print("\n--- Creando un nuevo torneo de Tenis ---")
     torneo_tenis = actividad_service.crear_torneo(tenis, "Torneo de Otoño", costo_inscripcion=5000)
+    actividad_service.esperar_notificaciones()
 
     print("\n--- Inscribiendo un socio al torneo ---")
     actividad_service.inscribir_socio_torneo(torneo_tenis, s1)
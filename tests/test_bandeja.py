@@ -0,0 +1,67 @@
+"""
+Pruebas de la bandeja de salida: cada mensaje se entrega una sola vez aunque
+el hilo trabajador y procesar_pendientes() corran a la vez.
+"""
+
+# Standard library imports
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+# Local application imports
+from club.notificaciones import BandejaSalida, Mensaje, Transporte
+from club.salida import SalidaNula, configurar_salida
+
+
+class TransporteRegistro(Transporte):
+    """Transporte que anota los ids entregados."""
+    
+    def __init__(self):
+        self.entregados = []
+        self._lock = threading.Lock()
+    
+    def enviar(self, mensaje: Mensaje):
+        with self._lock:
+            self.entregados.append(mensaje.id)
+
+
+class TestBandejaSalida(unittest.TestCase):
+    """Entrega concurrente y recuperación de mensajes reclamados."""
+    
+    def setUp(self):
+        configurar_salida(SalidaNula())
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+        self.ruta = os.path.join(self.directorio.name, "bandeja.db")
+        self.transporte = TransporteRegistro()
+    
+    def test_hilo_y_procesar_pendientes_no_duplican_entregas(self):
+        bandeja = BandejaSalida(self.transporte, ruta=self.ruta, tasa=100000, rafaga=100000, tamano_lote=10)
+        self.addCleanup(bandeja.cerrar)
+        ids = bandeja.encolar_varios(Mensaje("prueba", str(i), "asunto", "cuerpo") for i in range(500))
+        bandeja.iniciar()
+        bandeja.procesar_pendientes()
+        self.assertTrue(bandeja.esperar(10))
+        
+        self.assertEqual(sorted(self.transporte.entregados), sorted(ids))
+        self.assertEqual(bandeja.metricas()["enviados"], 500)
+    
+    def test_mensajes_reclamados_vuelven_a_pendientes_al_abrir(self):
+        bandeja = BandejaSalida(self.transporte, ruta=self.ruta)
+        id_mensaje = bandeja.encolar("prueba", "1", "asunto", "cuerpo")
+        bandeja.cerrar()
+        # Simula un proceso que reclamó el mensaje y terminó antes de confirmarlo
+        with sqlite3.connect(self.ruta) as conexion:
+            conexion.execute("UPDATE mensajes SET estado = ?", (BandejaSalida.ENVIANDO,))
+        conexion.close()
+        
+        bandeja = BandejaSalida(self.transporte, ruta=self.ruta)
+        self.addCleanup(bandeja.cerrar)
+        self.assertEqual(bandeja.procesar_pendientes(), 1)
+        self.assertEqual(self.transporte.entregados, [id_mensaje])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Pruebas de los socios retirados: socios eliminados del registry cuyos pagos
+siguen registrados.
+"""
+
+# Standard library imports
+import os
+import tempfile
+import unittest
+
+# Local application imports
+from club.entidades.actividad import Actividad
+from club.entidades.pago import Pago
+from club.entidades.torneo import Torneo
+from club.patrones.factory.socio_factory import SocioFactory
+from club.patrones.singleton.club_registry import ClubRegistry
+from club.salida import SalidaNula, configurar_salida
+from club.servicios.persistencia_service import PersistenciaService
+from club.servicios.persistencia_sqlite import PersistenciaSQLiteService
+
+
+class TestSociosRetiradosAlmacenColumnar(unittest.TestCase):
+    """Pagos de un socio eliminado con los pagos en el almacén columnar."""
+    
+    def setUp(self):
+        configurar_salida(SalidaNula())
+        self.registry = ClubRegistry.get_instance()
+        self.registry.reset()
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+        self.persistencia = PersistenciaService(self.directorio.name, carga_perezosa=False)
+        
+        socio = SocioFactory.crear_socio("regular", "Ana", 111)
+        self.registry.registrar_socio(socio)
+        self.registry.registrar_socio(SocioFactory.crear_socio("premium", "Beto", 222))
+        self.registry.registrar_pago(Pago(socio, 100.0, "Efectivo"))
+        self.registry.usar_almacen_columnar()
+        self.persistencia.guardar_datos()
+        self.registry.eliminar_socio(111)
+    
+    def tearDown(self):
+        self.registry.reset()
+    
+    def test_los_pagos_conservan_al_socio_eliminado(self):
+        pago, = self.registry.obtener_pagos_socio(111)
+        self.assertEqual(pago.socio.nombre, "Ana")
+        self.assertIn("Ana", repr(pago))
+        self.assertIn("Ana", str(pago))
+    
+    def test_los_pagos_conservan_al_socio_eliminado_tras_recargar(self):
+        self.persistencia.guardar_datos()
+        self.registry.reset()
+        self.persistencia.cargar_datos()
+        
+        self.assertIsNone(self.registry.obtener_socio(111))
+        self.assertEqual([repr(pago) for pago in self.registry.listar_pagos()],
+                         ["Pago(socio='Ana', monto=100.0)"])
+        self.assertEqual(self.registry.obtener_pagos_socio(111)[0].socio.dni, 111)
+
+
+
+class TestSociosRetiradosSQLite(unittest.TestCase):
+    """Pagos y torneos de un socio eliminado con la persistencia en SQLite."""
+    
+    def setUp(self):
+        configurar_salida(SalidaNula())
+        self.registry = ClubRegistry.get_instance()
+        self.registry.reset()
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+        self.ruta = os.path.join(self.directorio.name, "club.db")
+        self.persistencia = PersistenciaSQLiteService(self.ruta)
+        self.persistencia.cargar_datos()
+    
+    def tearDown(self):
+        self.persistencia.cerrar()
+        self.registry.reset()
+    
+    def _registrar_y_eliminar(self):
+        socio = SocioFactory.crear_socio("regular", "Ana", 5)
+        self.registry.registrar_socio(socio)
+        self.registry.registrar_socio(SocioFactory.crear_socio("premium", "Beto", 6))
+        actividad = Actividad("Tenis", 100, 10)
+        self.registry.registrar_actividad(actividad)
+        self.registry.inscribir_socio(actividad, socio)
+        torneo = Torneo("Copa", actividad, "2026-01-01", 0)
+        self.registry.registrar_torneo(torneo)
+        self.registry.inscribir_participante(torneo, socio)
+        self.registry.registrar_pago(Pago(socio, 100.0, "Efectivo"))
+        self.registry.desinscribir_socio(actividad, socio)
+        self.registry.eliminar_socio(5)
+    
+    def _recargar(self):
+        self.persistencia.guardar_datos()
+        self.persistencia.cerrar()
+        self.registry.reset()
+        self.persistencia = PersistenciaSQLiteService(self.ruta)
+        self.persistencia.cargar_datos()
+    
+    def _verificar_retirado(self):
+        self.assertIsNone(self.registry.obtener_socio(5))
+        self.assertEqual([socio.dni for socio in self.registry.listar_socios()], [6])
+        self.assertEqual([(pago.socio.dni, pago.socio.nombre) for pago in self.registry.listar_pagos()],
+                         [(5, "Ana")])
+        self.assertIn("Ana", str(self.registry.obtener_pagos_socio(5)[0]))
+        torneo, = self.registry.obtener_actividad("Tenis").torneos
+        self.assertEqual([socio.nombre for socio in torneo.participantes], ["Ana"])
+    
+    def test_socio_eliminado_antes_de_conectar(self):
+        self._registrar_y_eliminar()
+        self._recargar()
+        self._verificar_retirado()
+    
+    def test_socio_eliminado_con_la_base_conectada(self):
+        self.registry.registrar_socio(SocioFactory.crear_socio("regular", "Carla", 7))
+        self._recargar()
+        self.registry.eliminar_socio(7)
+        self._registrar_y_eliminar()
+        self.assertEqual(repr(self.registry.obtener_pagos_socio(5)[0]), "Pago(socio='Ana', monto=100.0)")
+        self._recargar()
+        self._verificar_retirado()
+
+
+if __name__ == "__main__":
+    unittest.main()